@@ -43,6 +43,16 @@ def _parse_int(env_key: str, default: int) -> int:
         print(f"[WARN] {env_key} 값이 정수가 아님: '{val}', 기본값 {default} 사용")
         return default
 
+def _parse_float(env_key: str, default: float) -> float:
+    val = os.getenv(env_key, "").strip()
+    if not val:
+        return default
+    try:
+        return float(val)
+    except ValueError:
+        print(f"[WARN] {env_key} 값이 숫자가 아님: '{val}', 기본값 {default} 사용")
+        return default
+
 def _parse_list(env_key: str, default: List[str]) -> List[str]:
     raw = os.getenv(env_key, "")
     if not raw.strip():
@@ -59,6 +69,110 @@ CRAWL_SEEDS: List[str] = _parse_list(
 # 분 단위 주기(기본 60분)
 CRAWL_INTERVAL_MIN: int = _parse_int("CRAWL_INTERVAL_MIN", 60)
 
+# 시드별 적응형 주기(1=사용, 기본 0=CRAWL_INTERVAL_MIN 고정 주기): 최근 실행에서 관찰한 신규/변경 빈도로
+# 시드마다 주기를 MIN~MAX(분) 안에서 조정. 켜면 기존 고정 주기 스케줄이 시드별 작업으로 바뀜
+# - TARGET: 크롤 1회당 기대 변경 건수(작을수록 자주 크롤), WINDOW: 빈도 추정에 쓰는 최근 실행 수
+# - BUSY_PERIODS: 수강신청/개강 등 공지가 몰리는 기간(MM-DD~MM-DD, 쉼표 구분), 이 기간엔 주기 × BUSY_FACTOR
+CRAWL_ADAPTIVE: bool = _parse_int("CRAWL_ADAPTIVE", 0) == 1
+CRAWL_ADAPTIVE_MIN_MIN: int = _parse_int("CRAWL_ADAPTIVE_MIN_MIN", 10)
+CRAWL_ADAPTIVE_MAX_MIN: int = _parse_int("CRAWL_ADAPTIVE_MAX_MIN", 720)
+CRAWL_ADAPTIVE_TARGET: float = _parse_float("CRAWL_ADAPTIVE_TARGET", 1.0)
+CRAWL_ADAPTIVE_WINDOW: int = _parse_int("CRAWL_ADAPTIVE_WINDOW", 12)
+CRAWL_BUSY_PERIODS: List[str] = _parse_list("CRAWL_BUSY_PERIODS", ["02-10~03-15", "08-10~09-15"])
+CRAWL_BUSY_FACTOR: float = _parse_float("CRAWL_BUSY_FACTOR", 0.5)
+if CRAWL_ADAPTIVE_MAX_MIN < CRAWL_ADAPTIVE_MIN_MIN:
+    print(f"[WARN] CRAWL_ADAPTIVE_MAX_MIN({CRAWL_ADAPTIVE_MAX_MIN}) < MIN({CRAWL_ADAPTIVE_MIN_MIN}), MIN으로 맞춤")
+    CRAWL_ADAPTIVE_MAX_MIN = CRAWL_ADAPTIVE_MIN_MIN
+
+# 채팅 응답의 공지 신선도(분, 0=확인 안 함): 시드의 마지막 성공 크롤이
+# max(이 값, 시드의 예정 크롤 주기) × 1.5보다 오래되면 응답은 지금 있는 데이터로 바로 하고,
+# 백그라운드 갱신을 1번만 예약(stale-while-revalidate). 예정 주기보다 짧게 잡아도 스케줄을 앞당기지 않음
+# CHECK_SEC: 신선도 확인(DB 조회) 최소 간격
+CHAT_FRESHNESS_MIN: int = _parse_int("CHAT_FRESHNESS_MIN", 30)
+CHAT_FRESHNESS_CHECK_SEC: int = _parse_int("CHAT_FRESHNESS_CHECK_SEC", 30)
+
+# 상세 페이지 동시 수집: 호스트당 동시 요청 수(1이면 순차) / 1회 크롤 전체 마감 시간(초)
+CRAWL_CONCURRENCY_PER_HOST: int = _parse_int("CRAWL_CONCURRENCY_PER_HOST", 4)
+CRAWL_DEADLINE_SEC: int = _parse_int("CRAWL_DEADLINE_SEC", 120)
+
+# 여러 페이지 목록 수집(백필/until-known) 시 한 번에 볼 최대 페이지 수
+CRAWL_MAX_PAGES: int = _parse_int("CRAWL_MAX_PAGES", 500)
+
+# 크롤러 HTTP 클라이언트: 호스트당 커넥션 풀 크기, 재시도 횟수/백오프 기준(ms),
+# 호스트별 초당 요청 수(토큰 버킷)와 버스트 크기
+CRAWL_POOL_SIZE: int = _parse_int("CRAWL_POOL_SIZE", 10)
+CRAWL_MAX_RETRIES: int = _parse_int("CRAWL_MAX_RETRIES", 3)
+CRAWL_BACKOFF_BASE_MS: int = _parse_int("CRAWL_BACKOFF_BASE_MS", 500)
+CRAWL_RATE_PER_HOST: float = _parse_float("CRAWL_RATE_PER_HOST", 5.0)
+CRAWL_RATE_BURST: int = _parse_int("CRAWL_RATE_BURST", 5)
+
+# 스케줄 크롤 실행 방식
+# - thread  : API 프로세스의 전용 스레드에서 실행(기본, 이벤트 루프는 막지 않음)
+# - process : API 프로세스가 띄운 별도 프로세스에서 실행(GIL 경합까지 분리)
+# - external: API는 스케줄러를 띄우지 않음, `python -m app.schedule.worker`가 크롤 담당
+CRAWL_JOB_MODE: str = (os.getenv("CRAWL_JOB_MODE", "thread").strip().lower() or "thread")
+if CRAWL_JOB_MODE not in ("thread", "process", "external"):
+    print(f"[WARN] CRAWL_JOB_MODE 값이 올바르지 않음: '{CRAWL_JOB_MODE}', thread 사용")
+    CRAWL_JOB_MODE = "thread"
+
+# 여러 uvicorn 워커/레플리카 중 하나만 크롤하도록 Postgres advisory lock으로 리더 선출(1=사용)
+# LOCK_KEY: 같은 DB를 쓰는 다른 서비스와 겹치지 않는 정수, CHECK_SEC: 리더 확인/재시도 주기
+CRAWL_LEADER_ELECTION: bool = _parse_int("CRAWL_LEADER_ELECTION", 1) == 1
+CRAWL_LEADER_LOCK_KEY: int = _parse_int("CRAWL_LEADER_LOCK_KEY", 72_110_001)
+CRAWL_LEADER_CHECK_SEC: int = _parse_int("CRAWL_LEADER_CHECK_SEC", 30)
+
+# 크롤러 응답 녹화/재생: live(기본) | record | replay, 저장 위치
+CRAWL_HTTP_MODE: str = (os.getenv("CRAWL_HTTP_MODE", "live").strip().lower() or "live")
+if CRAWL_HTTP_MODE not in ("live", "record", "replay"):
+    print(f"[WARN] CRAWL_HTTP_MODE 값이 올바르지 않음: '{CRAWL_HTTP_MODE}', live 사용")
+    CRAWL_HTTP_MODE = "live"
+CRAWL_FIXTURE_DIR: Path = BASE_DIR / (os.getenv("CRAWL_FIXTURE_DIR", "").strip() or "fixtures/crawl")
+
+# 단계별 파이프라인: 상세 파싱 프로세스 수(0이면 프로세스 풀 없이 스레드에서 파싱),
+# 단계 사이 큐 크기(가득 차면 앞 단계가 대기), DB 쓰기 배치 크기
+# (기본: 이 프로세스가 쓸 수 있는 CPU 수, 최대 4 / CPU가 1개면 프로세스 풀 이득이 없으므로 0)
+_CPUS = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+CRAWL_PARSE_WORKERS: int = _parse_int("CRAWL_PARSE_WORKERS", min(_CPUS, 4) if _CPUS > 1 else 0)
+CRAWL_QUEUE_SIZE: int = _parse_int("CRAWL_QUEUE_SIZE", 64)
+CRAWL_WRITE_BATCH: int = _parse_int("CRAWL_WRITE_BATCH", 100)
+
+# 증분 크롤(스케줄 작업 기본값, 1=사용): 이미 아는 공지가 연속 N건 나오면 목록 스캔 중단,
+# 오래된(stale) 공지는 실행당 최대 BUDGET건만 상세 재방문
+CRAWL_INCREMENTAL: bool = _parse_int("CRAWL_INCREMENTAL", 1) == 1
+CRAWL_KNOWN_STOP_RUN: int = _parse_int("CRAWL_KNOWN_STOP_RUN", 10)
+CRAWL_REVISIT_BUDGET: int = _parse_int("CRAWL_REVISIT_BUDGET", 3)
+CRAWL_REVISIT_AFTER_HOURS: int = _parse_int("CRAWL_REVISIT_AFTER_HOURS", 24)
+
+# 근사 중복 공지 클러스터(1=사용): 제목+본문 SimHash의 해밍 거리가 DISTANCE 비트 이하면 같은 클러스터
+CRAWL_NEAR_DUP: bool = _parse_int("CRAWL_NEAR_DUP", 1) == 1
+CRAWL_NEAR_DUP_DISTANCE: int = _parse_int("CRAWL_NEAR_DUP_DISTANCE", 3)
+
+# 원본 HTML 아카이브(1=사용): 상세 페이지 본문을 압축해 내용 해시 기준으로 중복 없이 보관
+# 코덱은 zstd(zstandard 설치 시) | gzip, 레벨은 코덱 기본 범위 내에서 지정
+RAW_ARCHIVE: bool = _parse_int("RAW_ARCHIVE", 1) == 1
+RAW_ARCHIVE_CODEC: str = (os.getenv("RAW_ARCHIVE_CODEC", "zstd").strip().lower() or "zstd")
+if RAW_ARCHIVE_CODEC not in ("zstd", "gzip"):
+    print(f"[WARN] RAW_ARCHIVE_CODEC 값이 올바르지 않음: '{RAW_ARCHIVE_CODEC}', zstd 사용")
+    RAW_ARCHIVE_CODEC = "zstd"
+RAW_ARCHIVE_LEVEL: int = _parse_int("RAW_ARCHIVE_LEVEL", 9)
+
+# 크롤 실행 이력(app.crawl_run / app.crawl_fetch): 상태 API에서 집계할 최근 실행 수, 보관 기간(일, 0=삭제 안 함)
+CRAWL_HISTORY_RUNS: int = _parse_int("CRAWL_HISTORY_RUNS", 20)
+CRAWL_HISTORY_KEEP_DAYS: int = _parse_int("CRAWL_HISTORY_KEEP_DAYS", 30)
+
+# 채팅(/api/chat) 비동기 경로: LLM/DB 호출 제한 시간(초), async DB 커넥션 풀 크기
+CHAT_LLM_TIMEOUT_SEC: float = _parse_float("CHAT_LLM_TIMEOUT_SEC", 30.0)
+CHAT_DB_TIMEOUT_SEC: float = _parse_float("CHAT_DB_TIMEOUT_SEC", 5.0)
+CHAT_DB_POOL_SIZE: int = _parse_int("CHAT_DB_POOL_SIZE", 10)
+# 같은 질문 동시 요청을 LLM 호출 1번으로 합침(1=사용, 0=요청마다 호출)
+CHAT_SINGLE_FLIGHT: bool = _parse_int("CHAT_SINGLE_FLIGHT", 1) == 1
+# 의미 기반 답 캐시: 글자 n-gram TF-IDF 코사인 유사도가 임계값 이상인 캐시 질문의 답을 재사용
+# (numpy 필요, 없으면 정확히 같은 질문만 적중). 인덱스 최대 항목 수, DB에서 다시 읽는 주기(초)
+CHAT_SEMANTIC_CACHE: bool = _parse_int("CHAT_SEMANTIC_CACHE", 1) == 1
+CHAT_SEMANTIC_THRESHOLD: float = _parse_float("CHAT_SEMANTIC_THRESHOLD", 0.8)
+CHAT_SEMANTIC_MAX_ENTRIES: int = _parse_int("CHAT_SEMANTIC_MAX_ENTRIES", 5000)
+CHAT_SEMANTIC_RELOAD_SEC: int = _parse_int("CHAT_SEMANTIC_RELOAD_SEC", 300)
+
 # 타임존(기본 Asia/Seoul)
 TIMEZONE: str = os.getenv("TIMEZONE", "Asia/Seoul").strip() or "Asia/Seoul"
 
@@ -69,4 +183,26 @@ print("🔧 [CONFIG] OPENAI_API_KEY =", "SET" if OPENAI_API_KEY else "NOT SET")
 print("🔧 [CONFIG] SYSTEM_PROMPT =", "LOADED" if SYSTEM_PROMPT else "EMPTY")
 print("🔧 [CONFIG] CRAWL_SEEDS =", CRAWL_SEEDS)
 print("🔧 [CONFIG] CRAWL_INTERVAL_MIN =", CRAWL_INTERVAL_MIN)
+print("🔧 [CONFIG] CRAWL_ADAPTIVE =", CRAWL_ADAPTIVE, f"({CRAWL_ADAPTIVE_MIN_MIN}~{CRAWL_ADAPTIVE_MAX_MIN} min, target {CRAWL_ADAPTIVE_TARGET}/run, window {CRAWL_ADAPTIVE_WINDOW})")
+print("🔧 [CONFIG] CRAWL_BUSY_PERIODS =", CRAWL_BUSY_PERIODS, f"(x{CRAWL_BUSY_FACTOR})")
+print("🔧 [CONFIG] CRAWL_JOB_MODE =", CRAWL_JOB_MODE)
+print("🔧 [CONFIG] CRAWL_LEADER_ELECTION =", CRAWL_LEADER_ELECTION, f"(key {CRAWL_LEADER_LOCK_KEY}, every {CRAWL_LEADER_CHECK_SEC}s)")
+print("🔧 [CONFIG] CHAT_FRESHNESS_MIN =", CHAT_FRESHNESS_MIN, f"(floor, x1.5 of seed interval; check every {CHAT_FRESHNESS_CHECK_SEC}s)")
+print("🔧 [CONFIG] CRAWL_CONCURRENCY_PER_HOST =", CRAWL_CONCURRENCY_PER_HOST)
+print("🔧 [CONFIG] CRAWL_DEADLINE_SEC =", CRAWL_DEADLINE_SEC)
+print("🔧 [CONFIG] CRAWL_MAX_PAGES =", CRAWL_MAX_PAGES)
+print("🔧 [CONFIG] CRAWL_MAX_RETRIES =", CRAWL_MAX_RETRIES)
+print("🔧 [CONFIG] CRAWL_RATE_PER_HOST =", CRAWL_RATE_PER_HOST, "/ burst", CRAWL_RATE_BURST)
+print("🔧 [CONFIG] CRAWL_HTTP_MODE =", CRAWL_HTTP_MODE)
+print("🔧 [CONFIG] CRAWL_PARSE_WORKERS =", CRAWL_PARSE_WORKERS, "/ queue", CRAWL_QUEUE_SIZE, "/ write batch", CRAWL_WRITE_BATCH)
+print("🔧 [CONFIG] CRAWL_INCREMENTAL =", CRAWL_INCREMENTAL)
+print("🔧 [CONFIG] CRAWL_KNOWN_STOP_RUN =", CRAWL_KNOWN_STOP_RUN)
+print("🔧 [CONFIG] CRAWL_REVISIT_BUDGET =", CRAWL_REVISIT_BUDGET)
+print("🔧 [CONFIG] CRAWL_REVISIT_AFTER_HOURS =", CRAWL_REVISIT_AFTER_HOURS)
+print("🔧 [CONFIG] CRAWL_NEAR_DUP =", CRAWL_NEAR_DUP, f"(distance <= {CRAWL_NEAR_DUP_DISTANCE})")
+print("🔧 [CONFIG] RAW_ARCHIVE =", RAW_ARCHIVE, f"({RAW_ARCHIVE_CODEC}, level {RAW_ARCHIVE_LEVEL})")
+print("🔧 [CONFIG] CRAWL_HISTORY_RUNS =", CRAWL_HISTORY_RUNS, f"(keep {CRAWL_HISTORY_KEEP_DAYS}d)")
+print("🔧 [CONFIG] CHAT_LLM_TIMEOUT_SEC =", CHAT_LLM_TIMEOUT_SEC, "/ db", CHAT_DB_TIMEOUT_SEC, "/ pool", CHAT_DB_POOL_SIZE)
+print("🔧 [CONFIG] CHAT_SINGLE_FLIGHT =", CHAT_SINGLE_FLIGHT)
+print("🔧 [CONFIG] CHAT_SEMANTIC_CACHE =", CHAT_SEMANTIC_CACHE, f"(threshold {CHAT_SEMANTIC_THRESHOLD}, max {CHAT_SEMANTIC_MAX_ENTRIES}, reload {CHAT_SEMANTIC_RELOAD_SEC}s)")
 print("🔧 [CONFIG] TIMEZONE =", TIMEZONE)
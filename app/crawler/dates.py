@@ -0,0 +1,132 @@
+# app/crawler/dates.py
+"""
+크롤링한 날짜 텍스트 파서.
+
+- 흔한 포맷은 미리 컴파일한 정규식으로 바로 처리
+  2025.08.12 / 2025-08-12 14:30 / 2025/8/12 / 2025년 8월 12일 (오후 2시 30분) / 20250812 / 25.08.12
+- 같은 셀 텍스트가 행·페이지마다 반복되므로 결과를 LRU로 메모이즈
+- 위 포맷에 안 걸리는 드문 경우에만 dateutil fuzzy 파싱으로 폴백
+- 최근 글을 상대 표기로 보여 주는 게시판용: 방금 / 5분 전 / 3시간 전 / 2일 전 / 1주 전 / 어제 (14:30)
+  (지금 시각 기준이라 메모이즈하지 않음, TIMEZONE의 현지 시각으로 계산)
+"""
+from __future__ import annotations
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Optional
+
+import pytz
+from dateutil import parser as dateparser
+
+from app.core.config import TIMEZONE
+
+_WS_RE = re.compile(r"\s+")
+
+# 2025.08.12 / 2025-08-12 / 2025/8/12 (+ 선택: 요일, HH:MM[:SS])
+_YMD_RE = re.compile(
+    r"((?:19|20)\d{2})\s*[./-]\s*(\d{1,2})\s*[./-]\s*(\d{1,2})\.?"
+    r"(?:\s*\(?[월화수목금토일]\)?)?"
+    r"(?:\s+(\d{1,2}):(\d{2})(?::(\d{2}))?)?"
+)
+# 2025년 8월 12일 (+ 선택: 요일, 오전/오후, 14:30 또는 2시 30분)
+_KO_RE = re.compile(
+    r"((?:19|20)\d{2})\s*년\s*(\d{1,2})\s*월\s*(\d{1,2})\s*일"
+    r"(?:\s*\(?[월화수목금토일]\)?)?"
+    r"(?:\s*(오전|오후)?\s*(\d{1,2})\s*(?::|시)\s*(?:(\d{2})\s*분?)?)?"
+)
+# 20250812
+_COMPACT_RE = re.compile(r"(?<!\d)((?:19|20)\d{2})(\d{2})(\d{2})(?!\d)")
+# 25.08.12 (셀 전체가 날짜일 때만)
+_SHORT_RE = re.compile(r"(\d{2})[./-](\d{1,2})[./-](\d{1,2})\.?")
+
+# 상대 표기(셀 전체가 이 형태일 때만)
+_AGO_RE = re.compile(r"(\d+)\s*(초|분|시간|일|주)\s*전")
+_DAY_WORD_RE = re.compile(r"(오늘|금일|어제|전일|그제|그저께)(?:\s+(\d{1,2}):(\d{2}))?")
+_AGO_UNITS = {"초": "seconds", "분": "minutes", "시간": "hours", "일": "days", "주": "weeks"}
+_DAYS_BACK = {"오늘": 0, "금일": 0, "어제": 1, "전일": 1, "그제": 2, "그저께": 2}
+
+_CACHE_SIZE = 4096
+_tz = pytz.timezone(TIMEZONE)
+
+def _mk(y, mo, d, h=None, mi=None, s=None) -> Optional[datetime]:
+    try:
+        return datetime(int(y), int(mo), int(d), int(h or 0), int(mi or 0), int(s or 0))
+    except ValueError:
+        return None
+
+def _fast(txt: str) -> Optional[datetime]:
+    m = _YMD_RE.search(txt)
+    if m:
+        dt = _mk(*m.groups())
+        if dt:
+            return dt
+    m = _KO_RE.search(txt)
+    if m:
+        y, mo, d, ampm, h, mi = m.groups()
+        if h is not None and ampm == "오후" and int(h) < 12:
+            h = int(h) + 12
+        elif h is not None and ampm == "오전" and int(h) == 12:
+            h = 0
+        dt = _mk(y, mo, d, h, mi)
+        if dt:
+            return dt
+    m = _COMPACT_RE.search(txt)
+    if m:
+        dt = _mk(*m.groups())
+        if dt:
+            return dt
+    m = _SHORT_RE.fullmatch(txt)
+    if m:
+        return _mk(2000 + int(m.group(1)), m.group(2), m.group(3))
+    return None
+
+def _fuzzy(txt: str) -> Optional[datetime]:
+    # 흔한 구분자 치환 후 dateutil fuzzy(느림, 드문 포맷 전용)
+    txt = txt.replace("년", "-").replace("월", "-").replace("일", "").replace(".", "-").replace("/", "-")
+    try:
+        dt = dateparser.parse(txt, yearfirst=True, dayfirst=False, fuzzy=True)
+    except Exception:
+        return None
+    # "조회수 120" 같은 숫자를 연도로 읽은 경우는 버림
+    return dt if 1900 <= dt.year <= 2100 else None
+
+def _relative(txt: str, now: datetime) -> Optional[datetime]:
+    if txt in ("방금", "방금 전"):
+        return now
+    m = _AGO_RE.fullmatch(txt)
+    if m:
+        return now - timedelta(**{_AGO_UNITS[m.group(2)]: int(m.group(1))})
+    m = _DAY_WORD_RE.fullmatch(txt)
+    if m:
+        day = (now - timedelta(days=_DAYS_BACK[m.group(1)])).replace(hour=0, minute=0, second=0, microsecond=0)
+        if m.group(2) is None:
+            return day
+        try:
+            return day.replace(hour=int(m.group(2)), minute=int(m.group(3)))
+        except ValueError:
+            return None
+    return None
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _parse_cached(txt: str) -> Optional[datetime]:
+    if not txt:
+        return None
+    return _fast(txt) or _fuzzy(txt)
+
+def parse_date(txt: str, now: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    날짜 텍스트를 datetime으로 파싱(실패 시 None).
+    기대 포맷 예: 2025-08-12, 2025.08.12, 2025/08/12, '2025-08-12 14:30', '2025년 8월 12일', '3시간 전', '어제' 등
+    now: 상대 표기의 기준 시각(naive 현지 시각, 기본 지금)
+    """
+    txt = _WS_RE.sub(" ", txt or "").strip()
+    if txt.endswith("전") or txt[:2] in ("방금", "오늘", "금일", "어제", "전일", "그제", "그저"):
+        now = now or datetime.now(_tz).replace(tzinfo=None)
+        rel = _relative(txt, now)
+        if rel is not None:
+            return rel
+    return _parse_cached(txt)
+
+def cache_info():
+    """LRU 적중률 확인용(functools.lru_cache의 CacheInfo)."""
+    return _parse_cached.cache_info()
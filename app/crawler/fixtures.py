@@ -0,0 +1,111 @@
+# app/crawler/fixtures.py
+"""
+크롤러 응답 녹화/재생(record & replay).
+
+CRAWL_HTTP_MODE
+- live   : 기본, 실제 네트워크 사용
+- record : 실제로 받은 응답(목록/상세)을 CRAWL_FIXTURE_DIR에 저장
+- replay : 네트워크 대신 저장된 응답을 돌려주는 transport adapter를 세션에 장착
+           (fetch_notice_list / fetch_notice_detail / crawl_and_store를 오프라인으로 재현)
+
+저장 형식: <url_key>.html(원본 바이트) + <url_key>.json(url, status, headers)
+"""
+from __future__ import annotations
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from app.core.config import CRAWL_HTTP_MODE, CRAWL_FIXTURE_DIR
+from app.crawler.utils import make_url_key
+
+# 재생 시 의미 있는 헤더만 보관
+_KEEP_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+class FixtureMissing(requests.RequestException):
+    """replay 모드에서 녹화되지 않은 URL을 요청한 경우(재시도 대상 아님)."""
+
+_write_lock = threading.Lock()
+
+def _paths(url: str, base: Optional[Path] = None):
+    base = Path(base or CRAWL_FIXTURE_DIR)
+    key = make_url_key(url)
+    return base / f"{key}.html", base / f"{key}.json"
+
+def recording() -> bool:
+    return CRAWL_HTTP_MODE == "record"
+
+def replaying() -> bool:
+    return CRAWL_HTTP_MODE == "replay"
+
+def save(url: str, resp: requests.Response, base: Optional[Path] = None) -> None:
+    """200 응답만 저장(304/오류는 재현 대상이 아님)."""
+    if resp.status_code != 200:
+        return
+    body_path, meta_path = _paths(url, base)
+    meta = {
+        "url": url,
+        "status": resp.status_code,
+        "headers": {k: resp.headers[k] for k in _KEEP_HEADERS if k in resp.headers},
+    }
+    with _write_lock:
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        body_path.write_bytes(resp.content)
+        meta_path.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+
+def load(url: str, base: Optional[Path] = None) -> Optional[Dict]:
+    body_path, meta_path = _paths(url, base)
+    if not meta_path.exists():
+        return None
+    meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    meta["body"] = body_path.read_bytes()
+    return meta
+
+def record_response(url: str, resp: requests.Response) -> None:
+    """http_client.get이 최종 응답을 받은 뒤 호출(리다이렉트 전 원래 URL 기준으로 저장)."""
+    if recording():
+        first = resp.history[0] if resp.history else resp
+        save(first.request.url if first.request is not None else url, resp)
+
+class ReplayAdapter(BaseAdapter):
+    """저장된 응답을 돌려주는 requests transport. 조건부 요청(ETag/Last-Modified)엔 304로 응답."""
+
+    def __init__(self, base: Optional[Path] = None):
+        super().__init__()
+        self.base = base
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        fx = load(request.url, self.base)
+        if fx is None:
+            raise FixtureMissing(f"no fixture for {request.url}", request=request)
+
+        headers = CaseInsensitiveDict(fx.get("headers") or {})
+        resp = requests.Response()
+        resp.url = request.url
+        resp.request = request
+        resp.connection = self
+        resp.headers = headers
+
+        inm = request.headers.get("If-None-Match")
+        ims = request.headers.get("If-Modified-Since")
+        if (inm and inm == headers.get("ETag")) or (ims and ims == headers.get("Last-Modified")):
+            resp.status_code = 304
+            resp._content = b""
+        else:
+            resp.status_code = fx.get("status", 200)
+            resp._content = fx["body"]
+        return resp
+
+    def close(self):
+        pass
+
+def install(session: requests.Session) -> None:
+    """replay 모드면 세션의 http/https transport를 ReplayAdapter로 교체."""
+    if replaying():
+        adapter = ReplayAdapter()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
@@ -0,0 +1,120 @@
+# app/crawler/http_cache.py
+"""
+조건부 GET(ETag / Last-Modified) 검증자 캐시.
+
+- 정규화 URL 키(make_url_key)마다 ETag, Last-Modified, 본문 해시를 보관
+- 다음 요청에 If-None-Match / If-Modified-Since를 붙이고,
+  304 응답이거나 본문 해시가 같으면 None을 돌려 파싱/DB 반영을 건너뛰게 함
+- 새로 받은 검증자는 pending에 두었다가, 파이프라인이 DB 반영에 성공한 URL만
+  confirm()으로 확정 → 저장 실패한 페이지가 "변경 없음"으로 묻히지 않도록
+"""
+from __future__ import annotations
+import hashlib
+import threading
+from typing import Any, Dict, Iterable, Optional
+
+import requests
+from sqlalchemy.orm import Session
+
+from app.crawler import http_client
+from app.crawler.utils import make_url_key
+from app.repo.http_cache_repo import load_validators, save_validators
+
+_lock = threading.Lock()
+_entries: Dict[str, Dict[str, Any]] = {}   # url_key -> 확정된 검증자
+_pending: Dict[str, Dict[str, Any]] = {}   # url_key -> 이번 실행에서 새로 받은 검증자
+_dirty: set = set()                        # DB에 아직 안 쓴 url_key
+_loaded = False
+
+def _body_hash(content: bytes) -> str:
+    return hashlib.sha256(content or b"").hexdigest()
+
+def fetch(url: str, headers: Dict[str, str], timeout: float, revalidate: bool = True) -> Optional[requests.Response]:
+    """
+    GET 후 변경이 없으면 None, 있으면 응답을 반환.
+    revalidate=False면 검증자를 보내지 않고 항상 응답을 돌려준다(검증자 기록은 동일).
+    """
+    key = make_url_key(url)
+    with _lock:
+        entry = dict(_entries.get(key) or {}) if revalidate else {}
+
+    req_headers = dict(headers)
+    if entry.get("etag"):
+        req_headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        req_headers["If-Modified-Since"] = entry["last_modified"]
+
+    resp = http_client.get(url, headers=req_headers, timeout=timeout)
+    if resp.status_code == 304:
+        return None
+    resp.raise_for_status()
+
+    h = _body_hash(resp.content)
+    if entry.get("body_hash") == h:
+        return None
+
+    with _lock:
+        _pending[key] = {
+            "url_key": key,
+            "url": url,
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+            "body_hash": h,
+        }
+    return resp
+
+def get_payload(url: str) -> Any:
+    """목록 페이지처럼 파싱 결과를 메모리에 같이 들고 있는 경우 그 값을 반환."""
+    with _lock:
+        entry = _entries.get(make_url_key(url))
+        return entry.get("payload") if entry else None
+
+def set_payload(url: str, payload: Any) -> None:
+    with _lock:
+        pend = _pending.get(make_url_key(url))
+        if pend is not None:
+            pend["payload"] = payload
+
+def confirm(urls: Iterable[str]) -> None:
+    """DB 반영까지 끝난 URL의 검증자를 확정."""
+    with _lock:
+        for url in urls:
+            key = make_url_key(url)
+            pend = _pending.pop(key, None)
+            if pend is not None:
+                _entries[key] = pend
+                _dirty.add(key)
+
+def discard(urls: Iterable[str]) -> None:
+    with _lock:
+        for url in urls:
+            _pending.pop(make_url_key(url), None)
+
+def warm(db: Session) -> None:
+    """프로세스당 1회 DB에 저장된 검증자를 메모리로 적재."""
+    global _loaded
+    if _loaded:
+        return
+    try:
+        rows = load_validators(db)
+    except Exception as e:
+        print(f"[WARN] http_validator 로드 실패: {e}")
+        db.rollback()
+        return
+    with _lock:
+        for r in rows:
+            _entries.setdefault(r["url_key"], r)
+        _loaded = True
+
+def flush(db: Session) -> int:
+    """확정됐지만 아직 DB에 없는 검증자를 저장(커밋은 호출자 몫)."""
+    with _lock:
+        keys = list(_dirty)
+        rows = [
+            {k: _entries[key].get(k) for k in ("url_key", "url", "etag", "last_modified", "body_hash")}
+            for key in keys if key in _entries
+        ]
+    n = save_validators(db, rows)
+    with _lock:
+        _dirty.difference_update(keys)
+    return n
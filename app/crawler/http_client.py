@@ -0,0 +1,214 @@
+# app/crawler/http_client.py
+"""
+크롤러 공용 HTTP 클라이언트.
+
+- keep-alive 커넥션 풀(requests.Session 1개를 프로세스에서 공유)
+- 연결 오류/타임아웃/429/5xx는 지수 백오프 + 지터로 재시도
+- 호스트별 토큰 버킷으로 초당 요청 수 제한
+- deadline()으로 스레드별 마감을 걸면 요청 timeout/재시도 백오프를 남은 시간 안으로 제한
+- 문자셋은 헤더 → <meta> → utf-8 → cp949 순으로 가볍게 판별
+  (본문 전체를 훑는 resp.apparent_encoding 사용 안 함)
+"""
+from __future__ import annotations
+import codecs
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.core.config import (
+    CRAWL_POOL_SIZE, CRAWL_CONCURRENCY_PER_HOST,
+    CRAWL_MAX_RETRIES, CRAWL_BACKOFF_BASE_MS,
+    CRAWL_RATE_PER_HOST, CRAWL_RATE_BURST,
+)
+from app.crawler import fixtures
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; CambeeCrawler/0.1; +https://example.invalid)"
+}
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+_BACKOFF_MAX_SEC = 30.0
+
+# --- 호스트별 토큰 버킷 ---
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(burst, 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+_buckets: Dict[str, _TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+def _bucket_for(url: str) -> _TokenBucket:
+    host = (urlparse(url).netloc or "").lower()
+    with _buckets_lock:
+        b = _buckets.get(host)
+        if b is None:
+            b = _buckets[host] = _TokenBucket(CRAWL_RATE_PER_HOST, CRAWL_RATE_BURST)
+        return b
+
+# --- 요청별 측정값(스레드별 마지막 요청) ---
+
+_local = threading.local()
+
+def last_fetch() -> Optional[Dict]:
+    """
+    현재 스레드에서 마지막으로 get()한 요청의 {url, status, bytes, fetch_ms, attempts}.
+    fetch_ms는 속도 제한 대기/재시도 백오프를 포함한 전체 시간. 예외로 끝났으면 status=None.
+    """
+    return getattr(_local, "info", None)
+
+# --- 스레드별 마감(크롤 전체 마감을 요청 단위 timeout까지 반영) ---
+
+@contextmanager
+def deadline(deadline_at: Optional[float]) -> Iterator[None]:
+    """이 블록 안의 get()은 time.monotonic() 기준 deadline_at을 넘기지 않음(None이면 제한 없음)."""
+    prev = getattr(_local, "deadline_at", None)
+    _local.deadline_at = deadline_at
+    try:
+        yield
+    finally:
+        _local.deadline_at = prev
+
+def _left() -> Optional[float]:
+    dl = getattr(_local, "deadline_at", None)
+    return None if dl is None else dl - time.monotonic()
+
+# --- 세션(커넥션 풀) ---
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+def get_session() -> requests.Session:
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                s = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=16,
+                    pool_maxsize=max(CRAWL_POOL_SIZE, CRAWL_CONCURRENCY_PER_HOST),
+                    max_retries=0,  # 재시도는 아래 get()에서 직접 처리
+                )
+                s.mount("http://", adapter)
+                s.mount("https://", adapter)
+                s.headers.update(DEFAULT_HEADERS)
+                fixtures.install(s)  # replay 모드면 저장된 응답을 돌려주는 transport로 교체
+                _session = s
+    return _session
+
+def _backoff(attempt: int, retry_after: Optional[str] = None) -> float:
+    if retry_after and retry_after.strip().isdigit():
+        return min(float(retry_after), _BACKOFF_MAX_SEC)
+    base = CRAWL_BACKOFF_BASE_MS / 1000.0
+    # full jitter: [0, base * 2^attempt]
+    return random.uniform(0, min(base * (2 ** attempt), _BACKOFF_MAX_SEC))
+
+def get(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 10,
+    retries: Optional[int] = None,
+) -> requests.Response:
+    """
+    풀링된 세션으로 GET. 일시 오류는 재시도하고, 마지막 응답은 상태코드와 무관하게 반환
+    (raise_for_status / 304 처리는 호출자 몫).
+    """
+    retries = CRAWL_MAX_RETRIES if retries is None else max(retries, 0)
+    session = get_session()
+    started = time.perf_counter()
+    _local.info = {"url": url, "status": None, "bytes": 0, "fetch_ms": 0.0, "attempts": 0}
+    # 재생 모드는 네트워크를 쓰지 않으므로 속도 제한 없음
+    bucket = None if fixtures.replaying() else _bucket_for(url)
+    for attempt in range(retries + 1):
+        if bucket:
+            bucket.acquire()
+        _local.info["attempts"] = attempt + 1
+        left = _left()
+        if left is not None and left <= 0:
+            _local.info["fetch_ms"] = (time.perf_counter() - started) * 1000
+            raise requests.Timeout(f"crawl deadline exceeded before GET {url}")
+        try:
+            resp = session.get(url, headers=headers, timeout=timeout if left is None else min(timeout, left))
+        except (requests.ConnectionError, requests.Timeout):
+            delay = _backoff(attempt)
+            left = _left()
+            if attempt >= retries or (left is not None and left <= delay):
+                _local.info["fetch_ms"] = (time.perf_counter() - started) * 1000
+                raise
+            time.sleep(delay)
+            continue
+        if resp.status_code in RETRY_STATUS and attempt < retries:
+            delay = _backoff(attempt, resp.headers.get("Retry-After"))
+            left = _left()
+            if left is None or left > delay:  # 마감 안에 다시 못 하면 이 응답을 그대로 반환
+                resp.close()
+                time.sleep(delay)
+                continue
+        fixtures.record_response(url, resp)
+        _local.info.update(
+            status=resp.status_code, bytes=len(resp.content),
+            fetch_ms=(time.perf_counter() - started) * 1000,
+        )
+        return resp
+    raise RuntimeError("unreachable")
+
+# --- 문자셋 판별 ---
+
+_HEADER_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.I)
+_META_CHARSET_RE = re.compile(rb"<meta[^>]+charset=[\"']?([\w.:-]+)", re.I)
+_META_SNIFF_BYTES = 4096
+# 국내 사이트는 euc-kr로 선언하고 확장 한글(cp949)을 쓰는 경우가 많음
+_CHARSET_ALIASES = {"euc-kr": "cp949", "euckr": "cp949", "ks_c_5601-1987": "cp949"}
+
+def _known_codec(name: Optional[str]) -> Optional[str]:
+    if not name:
+        return None
+    name = _CHARSET_ALIASES.get(name.strip().lower(), name.strip().lower())
+    try:
+        codecs.lookup(name)
+    except LookupError:
+        return None
+    return name
+
+def detect_charset(resp: requests.Response) -> str:
+    m = _HEADER_CHARSET_RE.search(resp.headers.get("Content-Type", ""))
+    enc = _known_codec(m.group(1)) if m else None
+    if enc:
+        return enc
+    m = _META_CHARSET_RE.search(resp.content[:_META_SNIFF_BYTES])
+    enc = _known_codec(m.group(1).decode("ascii", "ignore")) if m else None
+    if enc:
+        return enc
+    try:
+        resp.content.decode("utf-8")
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "cp949"
+
+def decode(resp: requests.Response) -> str:
+    return resp.content.decode(detect_charset(resp), errors="replace")
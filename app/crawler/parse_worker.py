@@ -0,0 +1,70 @@
+# app/crawler/parse_worker.py
+"""
+상세 페이지 파싱 + 정규화/체크섬(CPU 작업)을 프로세스 풀에서 실행.
+
+- BeautifulSoup 파싱은 GIL을 잡고 있어 스레드로는 코어 1개만 씀 → 프로세스로 분산
+- 풀은 프로세스당 1개를 만들어 실행 간 재사용(spawn이라 기동 비용이 큼)
+- 네트워크 스레드가 돌고 있는 부모를 fork하면 락 상태까지 복제되므로 spawn 컨텍스트 사용
+"""
+from __future__ import annotations
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+
+from app.crawler.simhash import simhash, to_signed
+from app.crawler.sites.ewha_notice import parse_notice_detail
+from app.crawler.utils import make_url_key, body_checksum
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+def parse_detail_row(url: str, html: str, item: Dict) -> Dict:
+    """
+    상세 HTML → app.notice upsert 행.
+    반환: {"row": {...}, "parse_ms": 파싱 시간, "normalize_ms": 정규화/체크섬/지문 시간}
+    (자식 프로세스에서 실행되므로 인자/반환값은 pickle 가능한 값만)
+    """
+    t0 = time.perf_counter()
+    detail = parse_notice_detail(html, url)
+    t1 = time.perf_counter()
+    title = detail.get("title") or item.get("title") or ""
+    body = detail.get("body") or ""
+    row = {
+        "url": url,
+        "url_key": make_url_key(url),
+        "title": title,
+        "body": body,
+        "category": item.get("category"),
+        "posted_at": detail.get("posted_at") or item.get("posted_at"),
+        "checksum": body_checksum(body, title),
+    }
+    h = simhash(title, body)
+    row["simhash"] = to_signed(h) if h is not None else None
+    t2 = time.perf_counter()
+    return {"row": row, "parse_ms": (t1 - t0) * 1000, "normalize_ms": (t2 - t1) * 1000}
+
+def get_pool(workers: int) -> Optional[ProcessPoolExecutor]:
+    """workers <= 0이면 None(호출자가 스레드에서 직접 파싱)."""
+    global _pool, _pool_workers
+    if workers <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+            )
+            _pool_workers = workers
+        return _pool
+
+def shutdown_pool() -> None:
+    """앱 종료 시 또는 풀이 깨졌을 때(BrokenProcessPool) 정리. 다음 get_pool에서 새로 만듦."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
@@ -0,0 +1,66 @@
+# app/crawler/raw_archive.py
+"""
+원본 HTML 아카이브 코덱.
+
+- 본문(문자셋 보정 후 utf-8)을 sha256으로 식별 → 같은 페이지는 blob 1개만 저장(content-addressed)
+- 압축은 zstd(zstandard 설치 시) 우선, 없으면 gzip으로 폴백
+- blob마다 codec을 같이 저장하므로 코덱/레벨을 바꿔도 예전 blob은 그대로 읽힘
+"""
+from __future__ import annotations
+import gzip
+import hashlib
+from typing import Dict
+
+from app.core.config import RAW_ARCHIVE_CODEC, RAW_ARCHIVE_LEVEL
+
+try:
+    import zstandard as zstd
+except ImportError:  # 선택 의존성
+    zstd = None
+    if RAW_ARCHIVE_CODEC == "zstd":
+        print("[WARN] zstandard 미설치: 원본 HTML 아카이브는 gzip으로 압축")
+
+CODEC = RAW_ARCHIVE_CODEC if zstd is not None else "gzip"
+
+def content_hash(html: str) -> str:
+    """압축 전에 중복 여부를 확인할 때 쓰는 키(pack()의 hash와 동일)."""
+    return hashlib.sha256((html or "").encode("utf-8")).hexdigest()
+
+def compress(data: bytes, codec: str = CODEC) -> bytes:
+    if codec == "zstd":
+        # ZstdCompressor는 스레드 안전하지 않으므로 호출마다 생성(생성 비용은 작음)
+        return zstd.ZstdCompressor(level=min(max(RAW_ARCHIVE_LEVEL, 1), 22)).compress(data)
+    if codec == "gzip":
+        return gzip.compress(data, compresslevel=min(max(RAW_ARCHIVE_LEVEL, 1), 9), mtime=0)
+    if codec == "none":
+        return data
+    raise ValueError(f"unknown codec: {codec}")
+
+def decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        if zstd is None:
+            raise RuntimeError("zstd blob을 읽으려면 zstandard 패키지가 필요합니다")
+        return zstd.ZstdDecompressor().decompress(data)
+    if codec == "gzip":
+        return gzip.decompress(data)
+    if codec == "none":
+        return data
+    raise ValueError(f"unknown codec: {codec}")
+
+def pack(html: str) -> Dict:
+    """
+    HTML → 저장용 blob
+    반환: {hash, codec, size_raw, size_stored, data}
+    """
+    raw = (html or "").encode("utf-8")
+    data = compress(raw)
+    return {
+        "hash": hashlib.sha256(raw).hexdigest(),
+        "codec": CODEC,
+        "size_raw": len(raw),
+        "size_stored": len(data),
+        "data": data,
+    }
+
+def unpack(blob: Dict) -> str:
+    return decompress(bytes(blob["data"]), blob["codec"]).decode("utf-8")
@@ -1,16 +1,23 @@
 # app/crawler/sites/ewha_notice.py
 from __future__ import annotations
 import re
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
 from urllib.parse import urljoin
-from datetime import datetime
-from dateutil import parser as dateparser
 from typing import List, Dict, Optional
 
-DEFAULT_HEADERS = {
-    "User-Agent": "Mozilla/5.0 (compatible; CambeeCrawler/0.1; +https://example.invalid)"
-}
+from app.crawler import http_cache, http_client
+from app.crawler.dates import parse_date
+from app.crawler.http_client import DEFAULT_HEADERS
+from app.crawler.sites.registry import SiteAdapter, get_adapter
+
+# 범용 휴리스틱용 정규식(행마다 다시 컴파일하지 않도록 모듈 로드 시 1회)
+_YEAR_RE = re.compile(r"\b20\d{2}\b")
+_FOUR_DIGITS_RE = re.compile(r"\d{4}")
+_DATE_IN_TEXT_RE = re.compile(r"(20\d{2}[./-]\d{1,2}[./-]\d{1,2})")
+_DATE_CLASS_RE = re.compile(r"(date|time)", re.I)
+_CAT_CLASS_RE = re.compile(r"(cat|category|label|tag)", re.I)
+_DETAIL_DATE_CLASS_RE = re.compile(r"(date|time|posted|reg)", re.I)
+_ATTACH_RE = re.compile(r"(\.(pdf|hwp|hwpx|docx?|pptx?|xlsx?)$)|download|attach|attachment", re.I)
 
 # --- 유틸 ---
 
@@ -23,47 +30,115 @@ def _to_abs(base: str, href: str) -> str:
     except Exception:
         return href
 
-def _parse_date(txt: str) -> Optional[datetime]:
+# --- 메인: 공지 리스트 파서 ---
+
+def list_page_url(list_url: str, page: Optional[int]) -> str:
+    # 페이지 파라미터는 사이트 어댑터가 결정(기본: page=N, K2Web: article.offset)
+    return get_adapter(list_url).page_url(list_url, page)
+
+def _get_html(url: str, timeout: float, conditional: bool = False, revalidate: bool = True) -> Optional[str]:
     """
-    날짜 텍스트를 date/datetime으로 파싱.
-    기대 포맷 예: 2025-08-12, 2025.08.12, 2025/08/12, '2025-08-12 14:30' 등
+    공용 HTTP 클라이언트(풀링/재시도/속도 제한)로 받아 문자셋 보정 후 반환.
+    conditional=True면 검증자 캐시(http_cache)를 거쳐 변경 없을 때 None 반환.
     """
-    txt = _clean(txt)
-    # 흔한 구분자 치환
-    txt = txt.replace("년", "-").replace("월", "-").replace("일", "").replace(".", "-").replace("/", "-")
-    try:
-        dt = dateparser.parse(txt, yearfirst=True, dayfirst=False, fuzzy=True)
-        return dt
-    except Exception:
-        return None
-
-# --- 메인: 공지 리스트 파서 ---
+    if conditional:
+        resp = http_cache.fetch(url, DEFAULT_HEADERS, timeout, revalidate=revalidate)
+        if resp is None:
+            return None
+    else:
+        resp = http_client.get(url, headers=DEFAULT_HEADERS, timeout=timeout)
+        resp.raise_for_status()
+    return http_client.decode(resp)
 
-def fetch_notice_list(list_url: str, page: Optional[int] = None) -> List[Dict]:
+def fetch_notice_list(list_url: str, page: Optional[int] = None, conditional: bool = False) -> List[Dict]:
     """
     이화여대 공지 목록 페이지에서
     [{title, link, posted_at(YYYY-MM-DD), category}] 추출.
 
     - page 인자를 사용하는 사이트면 쿼리스트링으로 추가 시도.
-    - 테이블형/리스트형 모두 대응하는 범용 로직.
+    - conditional=True면 목록이 바뀌지 않았을 때 다시 파싱하지 않고 직전 결과를 반환.
     """
-    url = list_url
-    # 페이지 파라미터가 필요한 경우(있다면) 붙이기: page, pageNo, curPage 등 흔한 키 시도
-    if page is not None:
-        if "?" in url:
-            url += f"&page={page}"
-        else:
-            url += f"?page={page}"
+    url = list_page_url(list_url, page)
+    if not conditional:
+        return parse_notice_list(_get_html(url, timeout=10), url)
+
+    cached = http_cache.get_payload(url)
+    html = _get_html(url, timeout=10, conditional=True, revalidate=cached is not None)
+    if html is None:
+        return list(cached)
+    items = parse_notice_list(html, url)
+    http_cache.set_payload(url, items)
+    return items
 
-    resp = requests.get(url, headers=DEFAULT_HEADERS, timeout=10)
-    resp.raise_for_status()
+def parse_notice_list(html: str, url: str) -> List[Dict]:
+    """
+    목록 HTML 파싱.
+    - 호스트에 등록된 어댑터 규칙(미리 컴파일된 셀렉터)으로 먼저 시도
+    - 규칙이 없거나 행을 못 찾으면 테이블형/리스트형 범용 휴리스틱으로 폴백
+    """
+    soup = BeautifulSoup(html, "lxml")
 
-    # 인코딩 보정
-    if not resp.encoding or resp.encoding.lower() == "iso-8859-1":
-        resp.encoding = resp.apparent_encoding
+    adapter = get_adapter(url)
+    items = _parse_list_rules(soup, url, adapter) if adapter.list_row else []
+    if not items:
+        items = _parse_list_generic(soup, url)
 
-    soup = BeautifulSoup(resp.text, "lxml")
+    # 중복/노이즈 정리: 제목/링크 없는 것 제거, 링크 기준으로 유일화
+    dedup = {}
+    for it in items:
+        if not it.get("title") or not it.get("link"):
+            continue
+        key = it["link"]
+        if key not in dedup:
+            dedup[key] = it
+    items = list(dedup.values())
+
+    return items
 
+def _date_iso(txt: str) -> Optional[str]:
+    d = parse_date(txt)
+    return d.date().isoformat() if d else None
+
+def _row_date_generic(tds) -> Optional[str]:
+    # 날짜 후보: td 텍스트 중 '2025', '2024' 등 연도 포함 & 숫자/구분자 비율 높은 것
+    for td in reversed(tds):
+        txt = _clean(td.get_text(" ", strip=True))
+        if _YEAR_RE.search(txt):
+            posted_at = _date_iso(txt)
+            if posted_at:
+                return posted_at
+    return None
+
+def _parse_list_rules(soup: BeautifulSoup, url: str, adapter: SiteAdapter) -> List[Dict]:
+    items = []
+    for row in adapter.list_row.select(soup):
+        a = (adapter.row_link.select_one(row) if adapter.row_link else None) or row.find("a", href=True)
+        if not a:
+            continue
+        title = _clean(a.get_text(" ", strip=True))
+        link = _to_abs(url, a["href"])
+
+        posted_at = None
+        date_node = adapter.row_date.select_one(row) if adapter.row_date else None
+        if date_node:
+            posted_at = _date_iso(date_node.get_text(" ", strip=True))
+        if not posted_at:
+            posted_at = _row_date_generic(row.find_all("td"))
+
+        category = None
+        cat_node = adapter.row_category.select_one(row) if adapter.row_category else None
+        if cat_node:
+            category = _clean(cat_node.get_text(" ", strip=True)) or None
+
+        items.append({
+            "title": title,
+            "link": link,
+            "posted_at": posted_at,
+            "category": category
+        })
+    return items
+
+def _parse_list_generic(soup: BeautifulSoup, url: str) -> List[Dict]:
     items = []
 
     # 1) 테이블 형태: <table> ... <tbody><tr>...</tr>
@@ -80,22 +155,13 @@ def fetch_notice_list(list_url: str, page: Optional[int] = None) -> List[Dict]:
 
             # 카테고리/날짜 컬럼 추정
             tds = tr.find_all("td")
-            posted_at = None
+            posted_at = _row_date_generic(tds)
             category = ""
 
-            # 날짜 후보: td 텍스트 중 '2025', '2024' 등 연도 포함 & 숫자/구분자 비율 높은 것
-            for td in reversed(tds):
-                txt = _clean(td.get_text(" ", strip=True))
-                if re.search(r"\b20\d{2}\b", txt):
-                    d = _parse_date(txt)
-                    if d:
-                        posted_at = d.date().isoformat()
-                        break
-
             # 카테고리 후보: '공지', '학사', '장학' 같은 짧은 텍스트 컬럼
             for td in tds:
                 txt = _clean(td.get_text(" ", strip=True))
-                if 1 <= len(txt) <= 6 and not re.search(r"\d{4}", txt):
+                if 1 <= len(txt) <= 6 and not _FOUR_DIGITS_RE.search(txt):
                     # 제목과 너무 비슷하면 스킵
                     if txt and txt not in title and not posted_at:
                         category = txt
@@ -124,24 +190,20 @@ def fetch_notice_list(list_url: str, page: Optional[int] = None) -> List[Dict]:
                 category = None
 
                 # 클래스 네이밍 힌트 기반
-                date_node = li.find(class_=re.compile(r"(date|time)", re.I))
+                date_node = li.find(class_=_DATE_CLASS_RE)
                 if date_node:
-                    d = _parse_date(date_node.get_text(" ", strip=True))
-                    if d:
-                        posted_at = d.date().isoformat()
+                    posted_at = _date_iso(date_node.get_text(" ", strip=True))
 
-                cat_node = li.find(class_=re.compile(r"(cat|category|label|tag)", re.I))
+                cat_node = li.find(class_=_CAT_CLASS_RE)
                 if cat_node:
                     category = _clean(cat_node.get_text(" ", strip=True)) or None
 
                 # 없으면 텍스트 덩어리에서 날짜 스캔
                 if not posted_at:
                     blob = _clean(li.get_text(" ", strip=True))
-                    m = re.search(r"(20\d{2}[./-]\d{1,2}[./-]\d{1,2})", blob)
+                    m = _DATE_IN_TEXT_RE.search(blob)
                     if m:
-                        d = _parse_date(m.group(1))
-                        if d:
-                            posted_at = d.date().isoformat()
+                        posted_at = _date_iso(m.group(1))
 
                 items.append({
                     "title": title,
@@ -149,49 +211,68 @@ def fetch_notice_list(list_url: str, page: Optional[int] = None) -> List[Dict]:
                     "posted_at": posted_at,
                     "category": category
                 })
-
-    # 중복/노이즈 정리: 제목/링크 없는 것 제거, 링크 기준으로 유일화
-    dedup = {}
-    for it in items:
-        if not it.get("title") or not it.get("link"):
-            continue
-        key = it["link"]
-        if key not in dedup:
-            dedup[key] = it
-    items = list(dedup.values())
-
     return items
 
 
 # --- 상세 본문 추출 공통 유틸 ---
 
+_BLOCK_TAGS = {"article", "main", "section", "div"}
+_TEXT_TYPES = (NavigableString, CData)
+
+def _best_block(root: Tag) -> Optional[Tag]:
+    """
+    트리를 후위 순회 1회로 훑으며 노드별 텍스트 길이/링크 텍스트 길이를 아래→위로 누적하고,
+    블록 태그(article/main/section/div) 중 점수가 가장 높은 노드를 고른다.
+    - 점수 = 본문길이 * (본문길이 / 전체길이), 본문길이 = 전체 - 링크 텍스트
+      → 메뉴/링크가 많이 섞인 바깥 래퍼보다 글이 밀집된 안쪽 블록이 이김
+    - 점수가 같으면 먼저 끝난(더 깊은) 노드 유지
+    """
+    stats: Dict[int, tuple] = {}
+    best, best_score = None, 0.0
+    stack = [(root, False)]
+    while stack:
+        node, visited = stack.pop()
+        if not visited:
+            stack.append((node, True))
+            stack.extend((c, False) for c in node.contents if isinstance(c, Tag))
+            continue
+
+        total = links = 0
+        for c in node.contents:
+            if isinstance(c, Tag):
+                ct, cl = stats.pop(id(c))
+                total += ct
+                links += cl
+            elif type(c) in _TEXT_TYPES:
+                total += len(c.strip())
+        if node.name == "a":
+            links = total
+        stats[id(node)] = (total, links)
+
+        if node.name in _BLOCK_TAGS and total:
+            text_len = total - links
+            score = text_len * text_len / total
+            if score > best_score:
+                best, best_score = node, score
+    return best
+
 def _extract_main_block(soup: BeautifulSoup) -> str:
     # 1) 잡다한 태그 제거
     for t in soup(["script", "style", "noscript"]):
         t.decompose()
 
-    # 2) 대표 블록 후보 우선순위: article > main > section > div
-    candidates = []
-    for name in ["article", "main", "section", "div"]:
-        for tag in soup.find_all(name):
-            txt = _clean(tag.get_text(" ", strip=True))
-            candidates.append((len(txt), txt))
-
-    if candidates:
-        candidates.sort(reverse=True, key=lambda x: x[0])
-        body = candidates[0][1]
-    else:
-        body = _clean(soup.get_text(" ", strip=True))
-    return body
+    # 2) 텍스트 밀도 기준 대표 블록 1개만 get_text (없으면 문서 전체)
+    block = _best_block(soup)
+    return _clean((block or soup).get_text(" ", strip=True))
 
-def _collect_attachments(soup: BeautifulSoup, base_url: str):
+def _collect_attachments(soup: BeautifulSoup, base_url: str, links=None):
     files = []
-    for a in soup.find_all("a", href=True):
+    for a in (links if links is not None else soup.find_all("a", href=True)):
         href = a["href"]
         name = _clean(a.get_text(" ", strip=True)) or href.rsplit("/", 1)[-1]
         abs_url = _to_abs(base_url, href)
         # 첨부로 볼만한 패턴만 수집(확장자/다운로드 경로 힌트)
-        if re.search(r"(\.(pdf|hwp|hwpx|docx?|pptx?|xlsx?)$)|download|attach|attachment", href, re.I):
+        if links is not None or _ATTACH_RE.search(href):
             files.append({"name": name[:120], "href": abs_url})
     # 중복 제거
     dedup = {}
@@ -202,42 +283,66 @@ def _collect_attachments(soup: BeautifulSoup, base_url: str):
 
 # --- 상세 페이지 파서 ---
 
-def fetch_notice_detail(detail_url: str) -> Dict:
+def fetch_notice_html(detail_url: str, conditional: bool = False) -> Optional[str]:
+    """상세 페이지 HTML만 받음(파싱은 호출자가 따로, 예: 파이프라인의 파싱 프로세스 풀)."""
+    return _get_html(detail_url, timeout=12, conditional=conditional)
+
+def fetch_notice_detail(detail_url: str, conditional: bool = False, keep_html: bool = False) -> Optional[Dict]:
     """
     상세 페이지에서 {"title","body","attachments":[...],"posted_at":YYYY-MM-DD} 추출
+    conditional=True이고 지난번과 같은 페이지면(304/동일 본문) None 반환
+    keep_html=True면 원본 HTML도 "html" 키로 함께 반환(아카이브용)
     """
-    resp = requests.get(detail_url, headers=DEFAULT_HEADERS, timeout=12)
-    resp.raise_for_status()
-    if not resp.encoding or resp.encoding.lower() == "iso-8859-1":
-        resp.encoding = resp.apparent_encoding
+    html = fetch_notice_html(detail_url, conditional=conditional)
+    if html is None:
+        return None
+    detail = parse_notice_detail(html, detail_url)
+    if keep_html:
+        detail["html"] = html
+    return detail
 
-    soup = BeautifulSoup(resp.text, "lxml")
+def parse_notice_detail(html: str, detail_url: str) -> Dict:
+    soup = BeautifulSoup(html, "lxml")
+    adapter = get_adapter(detail_url)
 
     # 제목
     title = ""
-    if soup.title:
-        title = _clean(soup.title.get_text(" ", strip=True))
-    h1 = soup.find(["h1","h2"])
-    if h1:
-        h1_txt = _clean(h1.get_text(" ", strip=True))
-        # title이 너무 길거나 빈약하면 헤딩으로 교체
-        if 5 <= len(h1_txt) <= 200:
-            title = h1_txt or title
+    node = adapter.detail_title.select_one(soup) if adapter.detail_title else None
+    if node:
+        title = _clean(node.get_text(" ", strip=True))
+    if not title:
+        if soup.title:
+            title = _clean(soup.title.get_text(" ", strip=True))
+        h1 = soup.find(["h1","h2"])
+        if h1:
+            h1_txt = _clean(h1.get_text(" ", strip=True))
+            # title이 너무 길거나 빈약하면 헤딩으로 교체
+            if 5 <= len(h1_txt) <= 200:
+                title = h1_txt or title
 
     # 날짜 (상세에 있으면 목록값 보완)
     posted_at = None
-    date_node = soup.find(class_=re.compile(r"(date|time|posted|reg)", re.I)) or \
-                soup.find(string=re.compile(r"20\d{2}[\./-]\d{1,2}[\./-]\d{1,2}"))
+    date_node = adapter.detail_date.select_one(soup) if adapter.detail_date else None
     if date_node:
-        d = _parse_date(date_node.get_text(" ", strip=True) if hasattr(date_node, "get_text") else str(date_node))
-        if d:
-            posted_at = d.date().isoformat()
+        posted_at = _date_iso(date_node.get_text(" ", strip=True))
+    if not posted_at:
+        date_node = soup.find(class_=_DETAIL_DATE_CLASS_RE) or soup.find(string=_DATE_IN_TEXT_RE)
+        if date_node:
+            posted_at = _date_iso(date_node.get_text(" ", strip=True) if hasattr(date_node, "get_text") else str(date_node))
 
     # 본문
-    body = _extract_main_block(soup)
+    body = ""
+    node = adapter.detail_body.select_one(soup) if adapter.detail_body else None
+    if node:
+        for t in node(["script", "style", "noscript"]):
+            t.decompose()
+        body = _clean(node.get_text(" ", strip=True))
+    if not body:
+        body = _extract_main_block(soup)
 
     # 첨부
-    attachments = _collect_attachments(soup, detail_url)
+    links = adapter.detail_attachments.select(soup) if adapter.detail_attachments else None
+    attachments = _collect_attachments(soup, detail_url, links=links or None)
 
     return {
         "title": title,
@@ -0,0 +1,94 @@
+# app/crawler/sites/registry.py
+"""
+사이트(호스트)별 파싱 규칙 레지스트리.
+
+- 어댑터는 목록 행/제목 링크/날짜/카테고리/상세 본문 등의 CSS 셀렉터를
+  soupsieve로 미리 컴파일해 들고 있음 → 알려진 사이트는 트리 전체를 훑지 않고 바로 조회
+- 규칙이 없거나 매칭 결과가 없으면 ewha_notice의 범용 휴리스틱(GENERIC)으로 폴백
+- 학과 게시판 추가: register_adapter(SiteAdapter(...)) 한 번이면 됨
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
+
+import soupsieve as sv
+from soupsieve import SoupSieve
+
+def css(selector: str) -> SoupSieve:
+    return sv.compile(selector)
+
+@dataclass(frozen=True)
+class SiteAdapter:
+    name: str
+    hosts: Tuple[str, ...] = ()
+
+    # 목록: 행 → (제목 링크, 날짜, 카테고리)
+    list_row: Optional[SoupSieve] = None
+    row_link: Optional[SoupSieve] = None
+    row_date: Optional[SoupSieve] = None
+    row_category: Optional[SoupSieve] = None
+
+    # 상세
+    detail_title: Optional[SoupSieve] = None
+    detail_date: Optional[SoupSieve] = None
+    detail_body: Optional[SoupSieve] = None
+    detail_attachments: Optional[SoupSieve] = None
+
+    # 페이지 파라미터: page_size가 있으면 offset 방식((page-1) * page_size)
+    page_param: str = "page"
+    page_size: Optional[int] = None
+    page_size_param: Optional[str] = None
+    page_extra: Tuple[Tuple[str, str], ...] = ()
+
+    def page_url(self, list_url: str, page: Optional[int]) -> str:
+        if page is None:
+            return list_url
+        p = urlparse(list_url)
+        qs = dict(parse_qsl(p.query, keep_blank_values=True))
+        for k, v in self.page_extra:
+            qs.setdefault(k, v)
+        if self.page_size:
+            qs[self.page_param] = str((max(page, 1) - 1) * self.page_size)
+            if self.page_size_param:
+                qs[self.page_size_param] = str(self.page_size)
+        else:
+            qs[self.page_param] = str(page)
+        return urlunparse(p._replace(query=urlencode(qs)))
+
+# 규칙 없는 기본 어댑터 → 범용 휴리스틱 사용
+GENERIC = SiteAdapter(name="generic")
+
+_ADAPTERS: Dict[str, SiteAdapter] = {}
+
+def register_adapter(adapter: SiteAdapter) -> SiteAdapter:
+    for host in adapter.hosts:
+        _ADAPTERS[host.lower()] = adapter
+    return adapter
+
+def get_adapter(url: str) -> SiteAdapter:
+    host = (urlparse(url).netloc or "").lower()
+    return _ADAPTERS.get(host) or _ADAPTERS.get(host.removeprefix("www.")) or GENERIC
+
+# ──────────────────────────────────────────────────────────────
+# 내장 어댑터
+
+# 이화여대 본교/학과 게시판(K2Web 게시판: board-table, b-title-box, b-content-box ...)
+# 목록은 article.offset / articleLimit 기반 페이지네이션
+EWHA_K2WEB = register_adapter(SiteAdapter(
+    name="ewha-k2web",
+    hosts=("www.ewha.ac.kr", "ewha.ac.kr", "cse.ewha.ac.kr"),
+    # lxml은 브라우저/html5lib과 달리 빠진 <tbody>를 채워 넣지 않음 → tbody 유무와 상관없이, th만 있는 헤더 행은 제외
+    list_row=css("table.board-table tr:has(> td)"),
+    row_link=css(".b-title-box a[href]"),
+    row_date=css(".b-date"),
+    row_category=css(".b-cate"),
+    detail_title=css(".b-view-title-box .b-title, .b-top-box .b-title"),
+    detail_date=css(".b-etc-box .b-date, .b-date"),
+    detail_body=css(".b-content-box"),
+    detail_attachments=css(".b-file-box a[href]"),
+    page_param="article.offset",
+    page_size=10,
+    page_size_param="articleLimit",
+    page_extra=(("mode", "list"),),
+))
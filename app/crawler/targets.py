@@ -0,0 +1,89 @@
+# app/crawler/targets.py
+"""
+공지 텍스트에서 필터링용 대상 필드(target_grade / target_major / target_student_number) 추출.
+
+- 읽기 모델(notices)로 projection할 때 한 번만 계산해 저장(질문마다 다시 보지 않음)
+- 대상이 하나로 분명할 때만 채우고, 여러 개이거나 애매하면 None(= 전체 대상)으로 둠
+  (crud의 필터는 None을 '전체'로 취급하므로 잘못 좁히는 것보다 안전)
+"""
+from __future__ import annotations
+import re
+from datetime import datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+# 제목 + 본문 앞부분만 봄(대상은 보통 앞에 적혀 있고, 뒤쪽 연락처/유의사항의 숫자 오인 방지)
+_SCAN_CHARS = 1500
+
+# 1학년 / 2학년 대상 / 3~4학년(범위는 여러 학년이므로 제외)
+_GRADE_RE = re.compile(r"(?<![\d~∼\-])([1-6])\s*학년(?!\s*도)(?!\s*[~∼\-])")
+_GRADE_RANGE_RE = re.compile(r"[1-6]\s*(?:학년)?\s*[~∼\-]\s*[1-6]\s*학년")
+# 나열: 1, 2학년 / 1·2학년 / 1,2학년 / 3 및 4학년(뒤 숫자에만 '학년'이 붙어 하나로 보이지만 여러 학년)
+_LIST_SEP = r"\s*(?:[,·ㆍ/]|및|와|과|또는|이나)\s*"
+_GRADE_LIST_RE = re.compile(r"(?<!\d)[1-6]\s*(?:학년)?" + _LIST_SEP + r"[1-6]\s*학년")
+_FRESHMAN_RE = re.compile(r"신입생")
+_ALL_GRADES_RE = re.compile(r"전\s*학년|재학생\s*전체|전체\s*학년")
+
+# 25학번 / 2025학번 (학년도와 구분: '학번'만)
+_SN_RE = re.compile(r"(?<!\d)((?:19|20)?\d{2})\s*학번")
+_SN_LIST_RE = re.compile(r"(?<!\d)((?:19|20)?\d{2})\s*(?:학번)?" + _LIST_SEP + r"((?:19|20)?\d{2})\s*학번")
+
+# [컴퓨터공학전공] / 경영학과 학생 / 사학과 재학생 대상
+_MAJOR_RE = re.compile(
+    r"([가-힣A-Za-z]{1,20}(?:학과|전공|학부))\s*(?:학생|재학생|대상|소속|학부생|신입생)"
+)
+_MAJOR_BRACKET_RE = re.compile(r"[\[\(【<]\s*([가-힣A-Za-z]{1,20}(?:학과|전공|학부))\s*[\]\)】>]")
+# 일반 명사(특정 학과가 아님)
+_MAJOR_STOP = {"각학과", "각전공", "전학과", "타학과", "본학과", "해당학과", "소속학과", "주전공", "복수전공", "부전공", "연계전공", "전공"}
+
+# 학과 게시판 호스트 → 전공(게시판 자체가 해당 전공 대상)
+HOST_MAJORS: Dict[str, str] = {
+    "cse.ewha.ac.kr": "컴퓨터공학전공",
+}
+
+def _one(values) -> Optional[str]:
+    uniq = list(dict.fromkeys(values))
+    return uniq[0] if len(uniq) == 1 else None
+
+def extract_grade(text: str) -> Optional[int]:
+    if _ALL_GRADES_RE.search(text) or _GRADE_RANGE_RE.search(text) or _GRADE_LIST_RE.search(text):
+        return None
+    g = _one(m.group(1) for m in _GRADE_RE.finditer(text))
+    if g:
+        return int(g)
+    if _FRESHMAN_RE.search(text) and "재학생" not in text:
+        return 1
+    return None
+
+def extract_student_number(text: str) -> Optional[int]:
+    """
+    학번 입학연도를 4자리로 반환(필터는 뒤 2자리로 비교하므로 05학번도 2005로 보존).
+    2자리는 내년(다음 신입생)까지 20xx, 그보다 크면 19xx(90학번 → 1990). 나열(24, 25학번)은 None.
+    """
+    if any(m.group(1)[-2:] != m.group(2)[-2:] for m in _SN_LIST_RE.finditer(text)):
+        return None
+    y = _one(m.group(1) for m in _SN_RE.finditer(text))
+    if y is None:
+        return None
+    if len(y) == 4:
+        return int(y)
+    return (2000 if int(y) <= datetime.now().year % 100 + 1 else 1900) + int(y)
+
+def extract_major(text: str, url: Optional[str] = None) -> Optional[str]:
+    found = [m.group(1) for m in _MAJOR_BRACKET_RE.finditer(text)]
+    found += [m.group(1) for m in _MAJOR_RE.finditer(text)]
+    found = [f for f in found if f.replace(" ", "") not in _MAJOR_STOP]
+    major = _one(found)
+    if major:
+        return major
+    if url:
+        return HOST_MAJORS.get((urlparse(url).netloc or "").lower())
+    return None
+
+def extract_targets(title: str, body: str, url: Optional[str] = None) -> Dict[str, Optional[object]]:
+    text = f"{title or ''}\n{(body or '')[:_SCAN_CHARS]}"
+    return {
+        "target_grade": extract_grade(text),
+        "target_major": extract_major(text, url),
+        "target_student_number": extract_student_number(text),
+    }
@@ -0,0 +1,75 @@
+from datetime import datetime
+
+import pytest
+
+from app.crawler import dates
+from app.crawler.dates import parse_date
+
+NOW = datetime(2025, 8, 12, 15, 40, 0)
+
+@pytest.mark.parametrize("txt, expected", [
+    ("2025.08.12", datetime(2025, 8, 12)),
+    ("2025.8.12.", datetime(2025, 8, 12)),
+    ("2025-08-12 14:30", datetime(2025, 8, 12, 14, 30)),
+    ("2025-08-12 14:30:05", datetime(2025, 8, 12, 14, 30, 5)),
+    ("2025/8/2", datetime(2025, 8, 2)),
+    ("2025.08.12 (화)", datetime(2025, 8, 12)),
+    ("  등록일\n 2025.08.12  ", datetime(2025, 8, 12)),
+    ("20250812", datetime(2025, 8, 12)),
+    ("25.08.12", datetime(2025, 8, 12)),
+])
+def test_numeric_formats(txt, expected):
+    assert parse_date(txt) == expected
+
+@pytest.mark.parametrize("txt, expected", [
+    ("2025년 8월 12일", datetime(2025, 8, 12)),
+    ("2025년8월12일(화)", datetime(2025, 8, 12)),
+    ("2025년 8월 12일 14:30", datetime(2025, 8, 12, 14, 30)),
+    ("2025년 8월 12일 오후 2시 30분", datetime(2025, 8, 12, 14, 30)),
+    ("2025년 8월 12일 오후 2시", datetime(2025, 8, 12, 14, 0)),
+    ("2025년 8월 12일 오전 12시", datetime(2025, 8, 12, 0, 0)),
+    ("2025년 8월 12일 오후 12시 10분", datetime(2025, 8, 12, 12, 10)),
+])
+def test_korean_formats(txt, expected):
+    assert parse_date(txt) == expected
+
+@pytest.mark.parametrize("txt, expected", [
+    ("방금", NOW),
+    ("방금 전", NOW),
+    ("30초 전", datetime(2025, 8, 12, 15, 39, 30)),
+    ("5분 전", datetime(2025, 8, 12, 15, 35)),
+    ("3시간 전", datetime(2025, 8, 12, 12, 40)),
+    ("3 시간 전", datetime(2025, 8, 12, 12, 40)),
+    ("2일 전", datetime(2025, 8, 10, 15, 40)),
+    ("1주 전", datetime(2025, 8, 5, 15, 40)),
+    ("오늘", datetime(2025, 8, 12)),
+    ("어제", datetime(2025, 8, 11)),
+    ("어제 09:05", datetime(2025, 8, 11, 9, 5)),
+    ("그저께", datetime(2025, 8, 10)),
+])
+def test_relative_formats(txt, expected):
+    assert parse_date(txt, now=NOW) == expected
+
+def test_relative_dates_are_not_memoized():
+    assert parse_date("1시간 전", now=NOW) == datetime(2025, 8, 12, 14, 40)
+    assert parse_date("1시간 전", now=datetime(2025, 8, 13, 9, 0)) == datetime(2025, 8, 13, 8, 0)
+
+def test_relative_defaults_to_current_local_time():
+    before = datetime.now(dates._tz).replace(tzinfo=None)
+    parsed = parse_date("방금")
+    assert before <= parsed <= datetime.now(dates._tz).replace(tzinfo=None)
+
+@pytest.mark.parametrize("txt", ["", None, "공지", "2025.13.45", "조회수 120"])
+def test_unparseable_returns_none(txt):
+    assert parse_date(txt) is None
+
+def test_invalid_fast_path_match_falls_through_to_next_format():
+    # 2025.02.30은 없는 날짜 → 뒤의 8자리 표기로 파싱
+    assert parse_date("2025.02.30 / 20250301") == datetime(2025, 3, 1)
+
+def test_results_are_memoized():
+    dates._parse_cached.cache_clear()
+    parse_date("2024.12.31")
+    parse_date(" 2024.12.31 ")
+    info = dates.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
@@ -0,0 +1,132 @@
+from bs4 import BeautifulSoup
+
+from app.crawler.sites.ewha_notice import _best_block, _extract_main_block, parse_notice_detail, parse_notice_list
+
+EWHA_LIST = "https://www.ewha.ac.kr/ewha/news/notice.do"
+
+K2WEB_LIST_HTML = """
+<html><body>
+<ul class="gnb"><li><a href="/menu1">메뉴</a></li></ul>
+<table class="board-table"><tbody>
+  <tr>
+    <td class="b-num-box">공지</td>
+    <td><span class="b-cate">학사</span><div class="b-title-box"><a href="?mode=view&amp;articleNo=101">2025학년도 2학기 수강신청 안내</a></div></td>
+    <td><span class="b-date">2025.08.12</span></td>
+  </tr>
+  <tr>
+    <td class="b-num-box">2</td>
+    <td><div class="b-title-box"><a href="?mode=view&amp;articleNo=102">국가장학금 2차 신청</a></div></td>
+    <td>2025-08-01</td>
+  </tr>
+  <tr>
+    <td class="b-num-box">3</td>
+    <td><div class="b-title-box"><a href="?mode=view&amp;articleNo=101">2025학년도 2학기 수강신청 안내</a></div></td>
+    <td><span class="b-date">2025.08.12</span></td>
+  </tr>
+</tbody></table>
+</body></html>
+"""
+
+def test_best_block_prefers_dense_text_over_link_heavy_wrapper():
+    soup = BeautifulSoup(
+        "<body><div id='wrap'>"
+        "<div id='nav'>" + "".join(f"<a href='/m{i}'>메뉴 항목 {i}</a>" for i in range(30)) + "</div>"
+        "<article id='post'><p>" + "수강신청 기간은 8월 12일부터 14일까지입니다. " * 10 + "</p></article>"
+        "</div></body>",
+        "lxml",
+    )
+    assert _best_block(soup)["id"] == "post"
+
+def test_best_block_keeps_deeper_node_on_tie():
+    soup = BeautifulSoup("<div id='outer'><div id='inner'><p>본문 텍스트</p></div></div>", "lxml")
+    assert _best_block(soup)["id"] == "inner"
+
+def test_best_block_without_block_tags_returns_none():
+    soup = BeautifulSoup("<p>본문</p><span>짧은 글</span>", "lxml")
+    assert _best_block(soup) is None
+    assert _extract_main_block(soup) == "본문 짧은 글"
+
+def test_extract_main_block_drops_scripts():
+    soup = BeautifulSoup("<div><script>var x = 1;</script><p>안내문</p></div>", "lxml")
+    assert _extract_main_block(soup) == "안내문"
+
+def test_parse_notice_list_with_k2web_adapter():
+    items = parse_notice_list(K2WEB_LIST_HTML, EWHA_LIST)
+    assert items == [
+        {"title": "2025학년도 2학기 수강신청 안내",
+         "link": EWHA_LIST + "?mode=view&articleNo=101", "posted_at": "2025-08-12", "category": "학사"},
+        {"title": "국가장학금 2차 신청",
+         "link": EWHA_LIST + "?mode=view&articleNo=102", "posted_at": "2025-08-01", "category": None},
+    ]
+
+def test_parse_notice_list_falls_back_to_generic_heuristics():
+    html = """
+    <table><tbody>
+      <tr><td>장학</td><td><a href="/view/7">교내 장학금 신청</a></td><td>2025.03.02</td></tr>
+    </tbody></table>
+    """
+    items = parse_notice_list(html, "https://dept.example.ac.kr/board/list")
+    assert items == [{"title": "교내 장학금 신청", "link": "https://dept.example.ac.kr/view/7",
+                      "posted_at": "2025-03-02", "category": None}]
+
+def test_parse_notice_list_generic_ul_layout():
+    html = """
+    <ul class="board">
+      <li><a href="/n/1">휴학 신청 안내</a><span class="cate">학사</span><span class="date">2025년 8월 1일</span></li>
+      <li><a href="/n/2">도서관 휴관</a> 등록일 2025-07-30</li>
+    </ul>
+    """
+    items = parse_notice_list(html, "https://lib.example.ac.kr/")
+    assert [(i["title"], i["posted_at"], i["category"]) for i in items] == [
+        ("휴학 신청 안내", "2025-08-01", "학사"),
+        ("도서관 휴관", "2025-07-30", None),
+    ]
+
+def test_parse_notice_detail_with_k2web_adapter():
+    html = """
+    <html><head><title>이화여자대학교</title></head><body>
+      <div class="b-view-title-box"><span class="b-title">2학기 수강신청 안내</span></div>
+      <div class="b-etc-box"><span class="b-date">2025.08.12</span></div>
+      <div class="b-content-box"><p>수강신청은 8월 12일부터입니다.</p><script>track()</script></div>
+      <div class="b-file-box"><a href="/file/download?id=1">안내문.hwp</a></div>
+    </body></html>
+    """
+    url = EWHA_LIST + "?mode=view&articleNo=101"
+    assert parse_notice_detail(html, url) == {
+        "title": "2학기 수강신청 안내",
+        "body": "수강신청은 8월 12일부터입니다.",
+        "attachments": [{"name": "안내문.hwp", "href": "https://www.ewha.ac.kr/file/download?id=1"}],
+        "posted_at": "2025-08-12",
+    }
+
+def test_parse_notice_detail_generic_uses_main_block():
+    html = """
+    <html><head><title>학과 공지</title></head><body>
+      <div class="menu"><a href="/a">홈</a><a href="/b">공지</a></div>
+      <div class="view"><h2>졸업논문 제출 안내</h2><p class="reg-date">2025-06-01</p>
+        <p>졸업논문은 6월 30일까지 제출합니다. 제출 양식은 첨부파일을 참고하세요.</p>
+        <a href="/files/form.pdf">제출양식.pdf</a></div>
+    </body></html>
+    """
+    detail = parse_notice_detail(html, "https://dept.example.ac.kr/view/3")
+    assert detail["title"] == "졸업논문 제출 안내"
+    assert detail["posted_at"] == "2025-06-01"
+    assert detail["body"].startswith("졸업논문 제출 안내 2025-06-01 졸업논문은 6월 30일까지")
+    assert detail["attachments"] == [{"name": "제출양식.pdf", "href": "https://dept.example.ac.kr/files/form.pdf"}]
+
+def test_k2web_adapter_without_tbody_and_with_header_row():
+    # lxml은 빠진 <tbody>를 만들지 않음: 어댑터 규칙이 그대로 맞아야 함(범용 폴백이면 카테고리가 빠짐)
+    html = """
+    <table class="board-table">
+      <tr><th>번호</th><th><a href="?sort=title">제목</a></th><th>작성일</th></tr>
+      <tr>
+        <td>1</td>
+        <td><span class="b-cate">장학</span><div class="b-title-box"><a href="?mode=view&amp;articleNo=7">교내 장학금 신청</a></div></td>
+        <td><span class="b-date">2025.03.02</span></td>
+      </tr>
+    </table>
+    """
+    assert parse_notice_list(html, EWHA_LIST) == [
+        {"title": "교내 장학금 신청", "link": EWHA_LIST + "?mode=view&articleNo=7",
+         "posted_at": "2025-03-02", "category": "장학"},
+    ]
@@ -0,0 +1,48 @@
+from urllib.parse import parse_qsl, urlparse
+
+import pytest
+
+from app.crawler.sites.ewha_notice import list_page_url
+from app.crawler.sites.registry import EWHA_K2WEB, GENERIC, SiteAdapter, get_adapter, register_adapter
+
+EWHA_LIST = "https://www.ewha.ac.kr/ewha/news/notice.do"
+
+def _query(url):
+    return dict(parse_qsl(urlparse(url).query, keep_blank_values=True))
+
+def test_page_none_keeps_list_url():
+    assert EWHA_K2WEB.page_url(EWHA_LIST, None) == EWHA_LIST
+    assert GENERIC.page_url("https://example.ac.kr/list?bbs=1", None) == "https://example.ac.kr/list?bbs=1"
+
+@pytest.mark.parametrize("page, offset", [(1, "0"), (2, "10"), (3, "20"), (10, "90")])
+def test_k2web_offset_pagination(page, offset):
+    assert _query(EWHA_K2WEB.page_url(EWHA_LIST, page)) == {
+        "mode": "list", "article.offset": offset, "articleLimit": "10",
+    }
+
+@pytest.mark.parametrize("page", [0, -3])
+def test_offset_pagination_clamps_to_first_page(page):
+    assert _query(EWHA_K2WEB.page_url(EWHA_LIST, page))["article.offset"] == "0"
+
+def test_offset_pagination_keeps_existing_query():
+    url = EWHA_LIST + "?mode=search&srCategoryId=12&article.offset=50"
+    q = _query(EWHA_K2WEB.page_url(url, 4))
+    assert q == {"mode": "search", "srCategoryId": "12", "article.offset": "30", "articleLimit": "10"}
+
+def test_offset_without_page_size_param():
+    adapter = SiteAdapter(name="offset-only", page_param="start", page_size=20)
+    assert _query(adapter.page_url("https://example.ac.kr/list", 3)) == {"start": "40"}
+
+def test_generic_page_number_pagination():
+    assert GENERIC.page_url("https://example.ac.kr/list?bbs=1&page=9", 2) == "https://example.ac.kr/list?bbs=1&page=2"
+
+def test_get_adapter_by_host():
+    assert get_adapter(EWHA_LIST) is EWHA_K2WEB
+    assert get_adapter("https://ewha.ac.kr/x") is EWHA_K2WEB
+    assert get_adapter("https://CSE.ewha.ac.kr/x") is EWHA_K2WEB
+    assert get_adapter("https://unknown.example.com/x") is GENERIC
+
+def test_register_adapter_matches_without_www():
+    adapter = register_adapter(SiteAdapter(name="test-dept", hosts=("dept-test.example.ac.kr",), page_param="pageIndex"))
+    assert get_adapter("https://www.dept-test.example.ac.kr/board") is adapter
+    assert list_page_url("https://dept-test.example.ac.kr/board", 5) == "https://dept-test.example.ac.kr/board?pageIndex=5"
@@ -0,0 +1,100 @@
+import pytest
+
+from app.crawler.simhash import BITS, SimHashIndex, distance, simhash, to_signed, to_unsigned
+from app.services.near_dup import assign_clusters
+
+BASE = 0x0123_4567_89AB_CDEF
+
+def _flip(h, *bits):
+    for b in bits:
+        h ^= 1 << b
+    return h
+
+def test_simhash_is_stable_and_ignores_spacing():
+    a = simhash("2학기 수강신청 안내", "수강신청은 8월 12일부터 14일까지입니다.")
+    assert a == simhash("2학기  수강신청 안내", "수강신청은 8월 12일부터\n14일까지입니다.")
+    assert 0 <= a < 1 << BITS
+
+def test_simhash_of_empty_content_is_none():
+    assert simhash("", "") is None
+    assert simhash(None, None) is None
+
+NOTICE_BODY = (
+    "2025학년도 2학기 수강신청 일정을 다음과 같이 안내합니다. 수강신청 기간은 8월 12일(화) 10시부터 8월 14일(목) 17시까지입니다. "
+    "수강신청은 통합정보시스템에서 진행하며, 수강 가능 학점은 학칙에 따라 최대 18학점입니다. 장바구니 기간은 8월 5일부터 7일까지이고 "
+    "장바구니에 담은 과목은 수강신청 첫날 자동으로 신청되지 않으니 반드시 직접 신청하시기 바랍니다. 정정 기간은 개강 후 1주일이며, "
+    "폐강 과목은 8월 20일 공지합니다. 기타 문의는 학사지원팀(02-3277-0000)으로 연락 바랍니다."
+)
+
+@pytest.mark.parametrize("title, body", [
+    ("[재공지] 2학기 수강신청 안내", NOTICE_BODY),
+    ("2학기 수강신청 안내", NOTICE_BODY.replace("02-3277-0000", "02-3277-1111")),
+    ("2학기 수강신청 안내", NOTICE_BODY + " 감사합니다."),
+])
+def test_small_edit_stays_within_distance_three(title, body):
+    assert distance(simhash("2학기 수강신청 안내", NOTICE_BODY), simhash(title, body)) <= 3
+
+def test_different_notice_is_far():
+    other = simhash("도서관 하계 휴관 안내", "중앙도서관은 시설 공사로 8월 한 달간 휴관합니다. 대출 도서 반납은 무인반납기를 이용해 주세요.")
+    assert distance(simhash("2학기 수강신청 안내", NOTICE_BODY), other) > 10
+
+@pytest.mark.parametrize("h", [0, 1, (1 << 63) - 1, 1 << 63, (1 << 64) - 1])
+def test_signed_roundtrip(h):
+    s = to_signed(h)
+    assert -(1 << 63) <= s < 1 << 63
+    assert to_unsigned(s) == h
+
+def test_distance_three_in_separate_bands_is_found():
+    # 밴드 폭 16비트: 3비트를 서로 다른 밴드에서 뒤집어도 남은 한 밴드가 같아 후보로 잡힘
+    index = SimHashIndex(3)
+    index.add("a", BASE, "a")
+    assert index.nearest(_flip(BASE, 0, 16, 32)) == ("a", 3, "a")
+
+def test_distance_four_is_rejected():
+    index = SimHashIndex(3)
+    index.add("a", BASE, "a")
+    assert index.nearest(_flip(BASE, 0, 16, 32, 48)) is None  # 모든 밴드가 다름
+    assert index.nearest(_flip(BASE, 0, 1, 2, 3)) is None     # 한 밴드에 몰려 후보지만 거리 초과
+
+def test_nearest_prefers_closest_then_cluster_id():
+    index = SimHashIndex(3)
+    index.add("far", _flip(BASE, 0, 1), "c-far")
+    index.add("near", _flip(BASE, 5), "c-near")
+    index.add("tie", _flip(BASE, 6), "c-a")
+    assert index.nearest(BASE) == ("tie", 1, "c-a")
+    assert index.nearest(BASE, exclude="tie") == ("near", 1, "c-near")
+
+def test_zero_distance_index_matches_exact_only():
+    index = SimHashIndex(0)
+    index.add("a", BASE, "a")
+    assert index.nearest(BASE) == ("a", 0, "a")
+    assert index.nearest(_flip(BASE, 0)) is None
+
+def test_assign_joins_cluster_and_is_stable_on_recrawl():
+    index = SimHashIndex(3)
+    assert index.assign("a", BASE) == "a"
+    assert index.assign("b", _flip(BASE, 3, 40)) == "a"
+    assert index.assign("c", _flip(BASE, 0, 16, 32, 48)) == "c"
+    assert index.assign("b", _flip(BASE, 3, 40)) == "a"  # 지문이 그대로면 클러스터 유지
+    assert index.assign("d", None) is None
+    assert len(index) == 3
+
+def test_remove_drops_band_entries():
+    index = SimHashIndex(3)
+    index.add("a", BASE, "a")
+    index.remove("a")
+    index.remove("a")
+    assert len(index) == 0
+    assert index.nearest(BASE) is None
+    assert all(not band for band in index._bands)
+
+def test_assign_clusters_uses_signed_fingerprints():
+    index = SimHashIndex(3)
+    h = (1 << 63) | BASE  # 최상위 비트가 켜진 지문(DB에는 음수로 저장)
+    rows = [
+        {"url_key": "u1", "simhash": to_signed(h)},
+        {"url_key": "u2", "simhash": to_signed(_flip(h, 10, 30))},
+        {"url_key": "u3", "simhash": None},
+    ]
+    assign_clusters(index, rows)
+    assert [r.get("cluster_id") for r in rows] == ["u1", "u1", None]
@@ -0,0 +1,75 @@
+from datetime import datetime
+
+import pytest
+
+from app.crawler.targets import extract_grade, extract_major, extract_student_number, extract_targets
+
+@pytest.mark.parametrize("text, grade", [
+    ("2학년 대상 전공설명회", 2),
+    ("[4학년] 졸업사정 안내", 4),
+    ("2025학년도 2학기 3학년 진로상담", 3),
+    ("1학년 대상 안내, 1학년 필수 이수", 1),
+    ("2025학년도 학사일정", None),
+])
+def test_single_grade(text, grade):
+    assert extract_grade(text) == grade
+
+@pytest.mark.parametrize("text", [
+    "3~4학년 대상", "3-4학년", "1학년~2학년", "3 ∼ 4 학년",
+    "1, 2학년 대상", "1·2학년", "1,2학년", "1ㆍ2학년 필수", "3 및 4학년", "1/2학년",
+    "1학년, 2학년 대상", "1학년과 3학년",
+    "전학년 대상", "재학생 전체", "전체 학년",
+])
+def test_ranges_enumerations_and_all_grades_are_none(text):
+    assert extract_grade(text) is None
+
+@pytest.mark.parametrize("text, grade", [
+    ("2026학년도 신입생 오리엔테이션", 1),
+    ("신입생 및 재학생 장학금", None),
+    ("신입생 오리엔테이션 재안내", 1),
+])
+def test_freshman(text, grade):
+    assert extract_grade(text) == grade
+
+def test_student_number_two_and_four_digits():
+    assert extract_student_number("25학번 대상") == 2025
+    assert extract_student_number("05학번 이전 입학자") == 2005
+    assert extract_student_number("2019학번 졸업요건") == 2019
+    assert extract_student_number("25학번, 25 학번 재안내") == 2025
+    assert extract_student_number("학번 확인") is None
+
+def test_old_two_digit_student_number_maps_to_1900s():
+    assert extract_student_number("90학번 동문회") == 1990
+    next_year = (datetime.now().year + 1) % 100
+    assert extract_student_number(f"{next_year:02d}학번 신입생") == 2000 + next_year
+    assert extract_student_number(f"{next_year + 1:02d}학번") == 1900 + next_year + 1
+
+@pytest.mark.parametrize("text", ["24, 25학번 대상", "24·25학번", "2023학번, 2024학번", "24학번 및 25학번"])
+def test_student_number_enumerations_are_none(text):
+    assert extract_student_number(text) is None
+
+@pytest.mark.parametrize("text, major", [
+    ("[컴퓨터공학전공] 졸업 프로젝트 안내", "컴퓨터공학전공"),
+    ("(경영학부) 전공설명회", "경영학부"),
+    ("【사학과】 답사 안내", "사학과"),
+    ("경영학과 학생 대상 설명회", "경영학과"),
+    ("[컴퓨터공학전공] 컴퓨터공학전공 학생 필독", "컴퓨터공학전공"),
+    ("[경영학과] 사학과 학생 교류", None),
+    ("[각 학과] 조교 모집", None),
+    ("복수전공 신청 안내", None),
+])
+def test_major(text, major):
+    assert extract_major(text) == major
+
+def test_major_falls_back_to_department_board_host():
+    assert extract_major("세미나 안내", "https://cse.ewha.ac.kr/cse/board/notice.do") == "컴퓨터공학전공"
+    assert extract_major("세미나 안내", "https://www.ewha.ac.kr/ewha/news/notice.do") is None
+
+def test_extract_targets_scans_title_and_body_head():
+    body = "본 안내는 1, 2학년 대상입니다." + " " * 2000 + "문의: 4학년 조교"
+    assert extract_targets("[사학과] 답사 안내", body) == {
+        "target_grade": None, "target_major": "사학과", "target_student_number": None,
+    }
+    assert extract_targets("25학번 3학년 설명회", "", "https://cse.ewha.ac.kr/x") == {
+        "target_grade": 3, "target_major": "컴퓨터공학전공", "target_student_number": 2025,
+    }
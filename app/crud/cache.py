@@ -46,3 +46,15 @@ def upsert_cache(db: Session, question: str, title: str, link: str | None, summa
     db.commit()
     db.refresh(item)
     return item
+
+def load_cache_questions(db: Session, limit: int):
+    """의미 기반 캐시 인덱스용: 최근 캐시 항목 (id, question) 최대 limit개."""
+    rows = db.execute(
+        select(GptSearchCache.id, GptSearchCache.question)
+        .order_by(GptSearchCache.id.desc())
+        .limit(limit)
+    ).all()
+    return [(r[0], r[1]) for r in rows]
+
+def get_cache_by_id(db: Session, cache_id: int):
+    return db.get(GptSearchCache, cache_id)
@@ -1,7 +1,27 @@
 # app/crud/notice.py
+from typing import Iterable, List, Optional
+
 from sqlalchemy import desc
 from app.models.models import Notice
 
+def collapse_duplicates(notices: Iterable[Notice], limit: Optional[int] = None) -> List[Notice]:
+    """
+    근사 중복 클러스터(cluster_id)당 첫 공지만 남김(입력 순서 유지 → 정렬된 목록이면 최신 1건).
+    cluster_id가 없는 공지(수동 입력/백필 전)는 그대로 둠.
+    """
+    seen = set()
+    out: List[Notice] = []
+    for n in notices:
+        cid = getattr(n, "cluster_id", None)
+        if cid is not None:
+            if cid in seen:
+                continue
+            seen.add(cid)
+        out.append(n)
+        if limit is not None and len(out) >= limit:
+            break
+    return out
+
 def get_recent_notices(db, limit: int = 30):
     # date가 없을 수도 있으니 보강
     q = db.query(Notice)
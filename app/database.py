@@ -1,6 +1,10 @@
 # app/database.py
 from __future__ import annotations
 
+import asyncio
+import importlib.util
+from typing import Any, Callable, Optional
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session, declarative_base
 from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
@@ -62,3 +66,81 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# 4) 비동기 경로(/api/chat): asyncpg + SQLAlchemy asyncio
+#    - 기존 sync 함수(crud 등)를 그대로 쓰되 AsyncSession.run_sync로 실행 → 이벤트 루프를 막지 않음
+#    - asyncpg/greenlet이 없으면 경고 후 같은 함수를 스레드에서 sync 세션으로 실행(동작은 같고 스레드만 점유)
+def _async_url(url: str) -> str:
+    """postgresql(+psycopg2)://...?sslmode=require → postgresql+asyncpg://...?ssl=require"""
+    parsed = urlparse(url)
+    query = dict(parse_qsl(parsed.query)) if parsed.query else {}
+    if "sslmode" in query:
+        query["ssl"] = query.pop("sslmode")
+    return urlunparse(parsed._replace(scheme="postgresql+asyncpg", query=urlencode(query)))
+
+
+ASYNC_DB = all(importlib.util.find_spec(m) is not None for m in ("asyncpg", "greenlet"))
+async_engine = None
+AsyncSessionLocal = None
+if ASYNC_DB:
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+    async_engine = create_async_engine(
+        _async_url(DB_URL), pool_pre_ping=True, pool_recycle=1800,
+        pool_size=config.CHAT_DB_POOL_SIZE, max_overflow=config.CHAT_DB_POOL_SIZE,
+        pool_timeout=config.CHAT_DB_TIMEOUT_SEC,
+        connect_args={"timeout": config.CHAT_DB_TIMEOUT_SEC, "command_timeout": config.CHAT_DB_TIMEOUT_SEC},
+    )
+    AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+else:
+    print("[WARN] asyncpg/greenlet 미설치: /api/chat의 DB 호출은 스레드에서 sync 세션으로 실행")
+
+
+def _unit_of_work(session: Session, fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """fn 1번 = 트랜잭션 1개: 끝나면 커밋(실패 시 롤백)해서 커넥션을 바로 풀에 돌려줌."""
+    try:
+        result = fn(session, *args, **kwargs)
+        if session.in_transaction():
+            session.commit()
+        return result
+    except BaseException:
+        session.rollback()
+        raise
+
+
+class AsyncDB:
+    """
+    async 엔드포인트용 DB 핸들. `await db.call(fn, *args)` → fn(sync Session, *args)
+    호출마다 CHAT_DB_TIMEOUT_SEC 제한(초과 시 asyncio.TimeoutError).
+    호출이 끝나면 트랜잭션을 닫음 → LLM을 기다리는 동안 요청이 커넥션을 잡고 있지 않음
+    (풀 크기는 동시 DB 호출 수만 제한, 동시 채팅 수는 제한하지 않음).
+    읽어 온 객체는 커밋 후에도 만료되지 않으므로(expire_on_commit=False) 이어서 속성을 읽어도 DB에 다시 가지 않음.
+    """
+
+    def __init__(self):
+        self._async: Optional[Any] = AsyncSessionLocal() if ASYNC_DB else None
+        self._sync: Optional[Session] = None
+
+    async def call(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        if self._async is not None:
+            coro = self._async.run_sync(_unit_of_work, fn, *args, **kwargs)
+        else:
+            if self._sync is None:
+                self._sync = SessionLocal(expire_on_commit=False)
+            coro = asyncio.to_thread(_unit_of_work, self._sync, fn, *args, **kwargs)
+        return await asyncio.wait_for(coro, timeout=config.CHAT_DB_TIMEOUT_SEC)
+
+    async def close(self) -> None:
+        if self._async is not None:
+            await self._async.close()
+        if self._sync is not None:
+            await asyncio.to_thread(self._sync.close)
+
+
+async def get_async_db():
+    db = AsyncDB()
+    try:
+        yield db
+    finally:
+        await db.close()
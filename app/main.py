@@ -91,11 +91,17 @@ def health():
 
 # --- 스케줄러 추가 ---
 from app.schedule.jobs import start_scheduler, shutdown_scheduler
+from app.crawler.parse_worker import shutdown_pool as shutdown_parse_pool
+from app.services import freshness, semantic_cache
 
 @app.on_event("startup")
 async def _on_start():
     start_scheduler()  # 가드가 있어서 중복 호출되어도 안전
+    semantic_cache.schedule_reload()  # 답 캐시 인덱스를 백그라운드에서 미리 빌드
 
 @app.on_event("shutdown")
 async def _on_stop():
-    shutdown_scheduler()
\ No newline at end of file
+    shutdown_scheduler()
+    shutdown_parse_pool()  # 크롤 파싱 프로세스 풀 정리
+    freshness.shutdown()   # 채팅 백그라운드 갱신 스레드 정리
+    semantic_cache.shutdown()
\ No newline at end of file
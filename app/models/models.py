@@ -1,7 +1,7 @@
 # app/models/models.py
 from __future__ import annotations
 
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -74,3 +74,16 @@ class Notice(Base):
 
     # 운영 편의(정렬/백필용)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+
+    # 크롤러(app.notice) projection 원본: url_key / 반영 당시 checksum (수동 입력 행은 NULL)
+    source_key = Column(String(64), nullable=True)
+    source_checksum = Column(String(64), nullable=True)
+
+    # 근사 중복 클러스터(대표 공지의 url_key, db/migrations/008_notice_near_dup.sql) → 조회 시 중복 접기
+    cluster_id = Column(String(64), nullable=True)
+
+    # 이름을 db/migrations/005_notice_projection.sql, 008_notice_near_dup.sql과 맞춤(create_all/마이그레이션 중복 생성 방지)
+    __table_args__ = (
+        Index("ux_notices_source_key", "source_key", unique=True),
+        Index("idx_notices_cluster", "cluster_id"),
+    )
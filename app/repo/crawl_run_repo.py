@@ -0,0 +1,139 @@
+# app/repo/crawl_run_repo.py
+from __future__ import annotations
+import json
+from typing import Dict, List
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+FETCH_BATCH_SIZE = 1000
+
+def insert_run(db: Session, run: Dict) -> int:
+    """
+    run = {seed_url, worker_id, trigger, started_at, duration_ms,
+           found, inserted, updated, unchanged, not_modified, errors, error, summary}
+    """
+    return db.execute(text("""
+        INSERT INTO app.crawl_run
+            (seed_url, worker_id, trigger, started_at, duration_ms,
+             found, inserted, updated, unchanged, not_modified, errors, error, summary)
+        VALUES
+            (:seed_url, :worker_id, :trigger, :started_at, :duration_ms,
+             :found, :inserted, :updated, :unchanged, :not_modified, :errors, :error,
+             CAST(:summary AS JSONB))
+        RETURNING id
+    """), {
+        "seed_url": run["seed_url"],
+        "worker_id": run.get("worker_id"),
+        "trigger": run.get("trigger") or "api",
+        "started_at": run["started_at"],
+        "duration_ms": run.get("duration_ms"),
+        "found": run.get("found", 0),
+        "inserted": run.get("inserted", 0),
+        "updated": run.get("updated", 0),
+        "unchanged": run.get("unchanged", 0),
+        "not_modified": run.get("not_modified", 0),
+        "errors": run.get("errors", 0),
+        "error": run.get("error"),
+        "summary": json.dumps(run.get("summary"), ensure_ascii=False, default=str)
+                   if run.get("summary") is not None else None,
+    }).scalar_one()
+
+def insert_fetches(db: Session, run_id: int, rows: List[Dict], batch_size: int = FETCH_BATCH_SIZE) -> int:
+    """rows = [{url, kind, http_status, bytes, fetch_ms, parse_ms, write_ms, outcome, error}, ...]"""
+    if not rows:
+        return 0
+    sql = text("""
+        INSERT INTO app.crawl_fetch
+            (run_id, url, kind, http_status, bytes, fetch_ms, parse_ms, write_ms, outcome, error)
+        VALUES
+            (:run_id, :url, :kind, :http_status, :bytes, :fetch_ms, :parse_ms, :write_ms, :outcome, :error)
+    """)
+    cols = ("url", "kind", "http_status", "bytes", "fetch_ms", "parse_ms", "write_ms", "outcome", "error")
+    for i in range(0, len(rows), max(batch_size, 1)):
+        db.execute(sql, [
+            {"run_id": run_id, **{c: r.get(c) for c in cols}}
+            for r in rows[i:i + max(batch_size, 1)]
+        ])  # executemany
+    return len(rows)
+
+def recent_runs(db: Session, limit: int = 20) -> List[Dict]:
+    """최근 실행 limit건(최신순) + 실행별 상세 fetch 지연 p50/p95, 오류 수."""
+    rows = db.execute(text("""
+        SELECT r.id, r.seed_url, r.worker_id, r.trigger, r.started_at, r.duration_ms,
+               r.found, r.inserted, r.updated, r.unchanged, r.not_modified, r.errors, r.error,
+               f.fetches, f.fetch_errors, f.fetch_p50, f.fetch_p95, f.parse_p50, f.parse_p95
+        FROM (
+            SELECT * FROM app.crawl_run ORDER BY started_at DESC LIMIT :limit
+        ) r
+        LEFT JOIN LATERAL (
+            SELECT COUNT(*) AS fetches,
+                   COUNT(*) FILTER (WHERE outcome = 'error') AS fetch_errors,
+                   percentile_cont(0.5)  WITHIN GROUP (ORDER BY fetch_ms) AS fetch_p50,
+                   percentile_cont(0.95) WITHIN GROUP (ORDER BY fetch_ms) AS fetch_p95,
+                   percentile_cont(0.5)  WITHIN GROUP (ORDER BY parse_ms) AS parse_p50,
+                   percentile_cont(0.95) WITHIN GROUP (ORDER BY parse_ms) AS parse_p95
+            FROM app.crawl_fetch
+            WHERE run_id = r.id AND kind = 'detail'
+        ) f ON TRUE
+        ORDER BY r.started_at DESC
+    """), {"limit": limit}).mappings().all()
+    return [dict(r) for r in rows]
+
+def fetch_percentiles(db: Session, limit: int = 20) -> List[Dict]:
+    """최근 limit건 실행의 fetch를 종류(list/detail)별로 모은 지연 백분위/오류율/상태코드 분포."""
+    rows = db.execute(text("""
+        WITH runs AS (
+            SELECT id FROM app.crawl_run ORDER BY started_at DESC LIMIT :limit
+        )
+        SELECT f.kind,
+               COUNT(*) AS fetches,
+               COUNT(*) FILTER (WHERE f.outcome = 'error') AS errors,
+               COUNT(*) FILTER (WHERE f.http_status = 304 OR f.outcome = 'not_modified') AS not_modified,
+               COUNT(*) FILTER (WHERE f.http_status >= 400) AS http_errors,
+               COALESCE(SUM(f.bytes), 0) AS bytes,
+               percentile_cont(0.5)  WITHIN GROUP (ORDER BY f.fetch_ms) AS fetch_p50,
+               percentile_cont(0.95) WITHIN GROUP (ORDER BY f.fetch_ms) AS fetch_p95,
+               percentile_cont(0.99) WITHIN GROUP (ORDER BY f.fetch_ms) AS fetch_p99,
+               percentile_cont(0.5)  WITHIN GROUP (ORDER BY f.parse_ms) AS parse_p50,
+               percentile_cont(0.95) WITHIN GROUP (ORDER BY f.parse_ms) AS parse_p95,
+               percentile_cont(0.5)  WITHIN GROUP (ORDER BY f.write_ms) AS write_p50,
+               percentile_cont(0.95) WITHIN GROUP (ORDER BY f.write_ms) AS write_p95
+        FROM app.crawl_fetch f
+        JOIN runs ON runs.id = f.run_id
+        GROUP BY f.kind
+        ORDER BY f.kind
+    """), {"limit": limit}).mappings().all()
+    return [dict(r) for r in rows]
+
+def prune_runs(db: Session, keep_days: int) -> int:
+    """keep_days보다 오래된 실행 삭제(crawl_fetch는 ON DELETE CASCADE)."""
+    if keep_days <= 0:
+        return 0
+    res = db.execute(text("""
+        DELETE FROM app.crawl_run
+        WHERE started_at < NOW() - (:days * INTERVAL '1 day')
+    """), {"days": keep_days})
+    return res.rowcount or 0
+
+def seed_runs(db: Session, seed_url: str, limit: int = 12) -> List[Dict]:
+    """시드별 최근 실행 limit건(최신순): 변경 빈도 추정용."""
+    rows = db.execute(text("""
+        SELECT started_at, inserted, updated, errors, error
+        FROM app.crawl_run
+        WHERE seed_url = :seed_url
+        ORDER BY started_at DESC
+        LIMIT :limit
+    """), {"seed_url": seed_url, "limit": limit}).mappings().all()
+    return [dict(r) for r in rows]
+
+def last_success(db: Session, seed_urls: List[str]) -> Dict[str, object]:
+    """시드별 마지막 성공 실행 시작 시각 {seed_url: started_at} (실행 이력이 없는 시드는 빠짐)."""
+    if not seed_urls:
+        return {}
+    rows = db.execute(text("""
+        SELECT seed_url, MAX(started_at) AS started_at
+        FROM app.crawl_run
+        WHERE seed_url = ANY(:seeds) AND error IS NULL
+        GROUP BY seed_url
+    """), {"seeds": list(seed_urls)}).all()
+    return {r.seed_url: r.started_at for r in rows}
@@ -0,0 +1,46 @@
+# app/repo/crawl_worker_repo.py
+from __future__ import annotations
+import json
+from typing import Dict, List
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+def save_worker_status(db: Session, s: Dict) -> None:
+    """
+    s = {worker_id, mode, running, last_run_at, last_finished_at, next_run_at, last_results}
+    """
+    db.execute(text("""
+        INSERT INTO app.crawl_worker
+            (worker_id, mode, running, last_run_at, last_finished_at, next_run_at, last_results, updated_at)
+        VALUES
+            (:worker_id, :mode, :running, :last_run_at, :last_finished_at, :next_run_at,
+             CAST(:last_results AS JSONB), NOW())
+        ON CONFLICT (worker_id) DO UPDATE SET
+            mode = EXCLUDED.mode,
+            running = EXCLUDED.running,
+            last_run_at = COALESCE(EXCLUDED.last_run_at, app.crawl_worker.last_run_at),
+            last_finished_at = COALESCE(EXCLUDED.last_finished_at, app.crawl_worker.last_finished_at),
+            next_run_at = COALESCE(EXCLUDED.next_run_at, app.crawl_worker.next_run_at),
+            last_results = COALESCE(EXCLUDED.last_results, app.crawl_worker.last_results),
+            updated_at = NOW()
+    """), {
+        "worker_id": s["worker_id"],
+        "mode": s["mode"],
+        "running": bool(s.get("running")),
+        "last_run_at": s.get("last_run_at"),
+        "last_finished_at": s.get("last_finished_at"),
+        "next_run_at": s.get("next_run_at"),
+        "last_results": json.dumps(s["last_results"], ensure_ascii=False, default=str)
+                        if s.get("last_results") is not None else None,
+    })
+
+def load_worker_status(db: Session, limit: int = 10) -> List[Dict]:
+    """최근에 상태를 남긴 워커 순으로."""
+    rows = db.execute(text("""
+        SELECT worker_id, mode, running, last_run_at, last_finished_at, next_run_at,
+               last_results, updated_at
+        FROM app.crawl_worker
+        ORDER BY updated_at DESC
+        LIMIT :limit
+    """), {"limit": limit}).mappings().all()
+    return [dict(r) for r in rows]
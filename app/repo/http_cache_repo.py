@@ -0,0 +1,31 @@
+# app/repo/http_cache_repo.py
+from __future__ import annotations
+from typing import Dict, List
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+def load_validators(db: Session) -> List[Dict]:
+    rows = db.execute(text("""
+        SELECT url_key, url, etag, last_modified, body_hash
+        FROM app.http_validator
+    """)).mappings().all()
+    return [dict(r) for r in rows]
+
+def save_validators(db: Session, rows: List[Dict]) -> int:
+    """
+    rows = [{url_key, url, etag, last_modified, body_hash}, ...]
+    """
+    if not rows:
+        return 0
+    sql = text("""
+        INSERT INTO app.http_validator (url_key, url, etag, last_modified, body_hash)
+        VALUES (:url_key, :url, :etag, :last_modified, :body_hash)
+        ON CONFLICT (url_key) DO UPDATE SET
+            url = EXCLUDED.url,
+            etag = EXCLUDED.etag,
+            last_modified = EXCLUDED.last_modified,
+            body_hash = EXCLUDED.body_hash,
+            updated_at = NOW()
+    """)
+    db.execute(sql, rows)  # executemany
+    return len(rows)
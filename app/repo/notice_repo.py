@@ -4,51 +4,242 @@ from typing import Dict, List
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
-def bulk_insert_raw(db: Session, rows: List[Dict]):
+RAW_COLUMNS = ("url", "status", "html", "error", "blob_hash")
+RAW_BATCH_SIZE = 1000
+
+# COPY text 포맷 이스케이프(역슬래시, 탭, 개행) / NULL은 \N
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+def _copy_field(v) -> str:
+    if v is None:
+        return "\\N"
+    return str(v).translate(_COPY_ESCAPES)
+
+class _CopyStream:
+    """
+    rows를 COPY text 포맷으로 그때그때 인코딩해 read(size)로 내어주는 파일 객체.
+    전체 로그(큰 HTML 포함)를 하나의 문자열로 만들지 않고 행 단위로 흘려보냄.
+    """
+
+    def __init__(self, rows: List[Dict]):
+        self._rows = iter(rows)
+        self._buf = bytearray()
+
+    def _line(self, r: Dict) -> bytes:
+        vals = [r.get(c) for c in RAW_COLUMNS]
+        if vals[1] is None:
+            vals[1] = "ok"
+        return ("\t".join(_copy_field(v) for v in vals) + "\n").encode("utf-8")
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buf) < size:
+            r = next(self._rows, None)
+            if r is None:
+                break
+            self._buf += self._line(r)
+        if size < 0:
+            size = len(self._buf)
+        out = bytes(self._buf[:size])
+        del self._buf[:size]
+        return out
+
+
+def _copy_raw(db: Session, rows: List[Dict]) -> bool:
+    """psycopg2면 COPY FROM STDIN 1회로 적재. 다른 드라이버면 False(호출자가 폴백)."""
+    raw = db.connection().connection  # 세션과 같은 트랜잭션의 DBAPI 커넥션
+    cur = raw.cursor()
+    try:
+        if not hasattr(cur, "copy_expert"):
+            return False
+        cur.copy_expert(
+            f"COPY app.notice_raw ({', '.join(RAW_COLUMNS)}) FROM STDIN",
+            _CopyStream(rows),
+        )
+        return True
+    finally:
+        cur.close()
+
+def bulk_insert_raw(db: Session, rows: List[Dict], batch_size: int = RAW_BATCH_SIZE):
+    """
+    크롤 로그 적재. rows = [{url, status, html, error, blob_hash}, ...]
+    - psycopg2: COPY FROM STDIN(행 수와 무관하게 왕복 1회, 스트리밍 인코딩)
+    - 그 외: batch_size씩 executemany
+    """
     if not rows:
         return 0
+    if _copy_raw(db, rows):
+        return len(rows)
+
     sql = text("""
-        INSERT INTO app.notice_raw (url, status, html, error)
-        VALUES (:url, :status, :html, :error)
+        INSERT INTO app.notice_raw (url, status, html, error, blob_hash)
+        VALUES (:url, :status, :html, :error, :blob_hash)
     """)
-    for r in rows:
-        db.execute(sql, {
+    for i in range(0, len(rows), max(batch_size, 1)):
+        db.execute(sql, [{
             "url": r.get("url"),
-            "status": r.get("status", "ok"),
+            "status": r.get("status") or "ok",
             "html": r.get("html"),
-            "error": r.get("error")
-        })
+            "error": r.get("error"),
+            "blob_hash": r.get("blob_hash"),  # 원본은 app.raw_blob에 압축 보관
+        } for r in rows[i:i + max(batch_size, 1)]])  # executemany
     return len(rows)
 
-def upsert_notice(db: Session, n: Dict):
+UPSERT_CHUNK_SIZE = 500
+
+_UPSERT_MANY_SQL = text("""
+    INSERT INTO app.notice
+        (url, url_key, title, body, category, posted_at, checksum, simhash, cluster_id)
+    SELECT * FROM unnest(
+        CAST(:urls AS TEXT[]), CAST(:url_keys AS TEXT[]), CAST(:titles AS TEXT[]),
+        CAST(:bodies AS TEXT[]), CAST(:categories AS TEXT[]), CAST(:posted_ats AS DATE[]),
+        CAST(:checksums AS TEXT[]), CAST(:simhashes AS BIGINT[]), CAST(:cluster_ids AS TEXT[])
+    )
+    ON CONFLICT (url) DO UPDATE SET
+        title = EXCLUDED.title,
+        body = EXCLUDED.body,
+        category = COALESCE(EXCLUDED.category, app.notice.category),
+        posted_at = COALESCE(EXCLUDED.posted_at, app.notice.posted_at),
+        checksum = EXCLUDED.checksum,
+        simhash = COALESCE(EXCLUDED.simhash, app.notice.simhash),
+        cluster_id = COALESCE(EXCLUDED.cluster_id, app.notice.cluster_id),
+        updated_at = NOW(),
+        checked_at = NOW()
+    -- 내용이 같으면 행을 다시 쓰지 않음(dead tuple/WAL/인덱스 갱신 없음) → RETURNING에도 안 나옴
+    WHERE app.notice.checksum IS DISTINCT FROM EXCLUDED.checksum
+       OR (EXCLUDED.category IS NOT NULL AND app.notice.category IS DISTINCT FROM EXCLUDED.category)
+       OR (EXCLUDED.posted_at IS NOT NULL AND app.notice.posted_at IS DISTINCT FROM EXCLUDED.posted_at)
+    RETURNING url, (xmax = 0) AS inserted
+""")
+
+# 변경 없는 공지는 확인 시각만 갱신(인덱스 없는 컬럼만 바꾸므로 HOT update, 본문 TOAST 재작성 없음)
+_TOUCH_CHECKED_SQL = text("""
+    UPDATE app.notice SET checked_at = NOW()
+    WHERE url = ANY(:urls)
+""")
+
+def upsert_notices(db: Session, rows: List[Dict], chunk_size: int = UPSERT_CHUNK_SIZE) -> Dict[str, str]:
     """
-    n = {
-      url, url_key, title, body, category, posted_at(YYYY-MM-DD|None), checksum
-    }
+    여러 공지를 한 번에 upsert(청크당 multi-row 문장 1회 → 왕복 횟수는 청크 수만큼).
+    rows = [{
+      url, url_key, title, body, category, posted_at(YYYY-MM-DD|None), checksum,
+      simhash(signed 64bit|None), cluster_id(None)
+    }, ...]
+    반환: {url: "inserted" | "updated" | "unchanged"}
+
+    - 컬럼별 배열을 unnest로 펼치므로 행 수와 무관하게 바인드 파라미터는 9개
+    - 같은 url이 여러 번 있으면 마지막 것만 사용
+      (한 문장에서 같은 행을 두 번 ON CONFLICT UPDATE 할 수 없음)
+    - checksum(및 category/posted_at)이 그대로면 UPDATE하지 않고 "unchanged"
+      (updated_at은 실제 내용이 바뀐 시각으로 유지, 재방문 판단은 checked_at으로)
+    """
+    if not rows:
+        return {}
+    by_url: Dict[str, Dict] = {}
+    for n in rows:
+        by_url.pop(n["url"], None)  # 마지막 값 + 마지막 등장 순서 유지
+        by_url[n["url"]] = n
+    uniq = list(by_url.values())
+
+    status: Dict[str, str] = {}
+    for i in range(0, len(uniq), max(chunk_size, 1)):
+        chunk = uniq[i:i + max(chunk_size, 1)]
+        res = db.execute(_UPSERT_MANY_SQL, {
+            "urls": [n["url"] for n in chunk],
+            "url_keys": [n["url_key"] for n in chunk],
+            "titles": [n["title"] for n in chunk],
+            "bodies": [n["body"] for n in chunk],
+            "categories": [n.get("category") for n in chunk],
+            "posted_ats": [n.get("posted_at") for n in chunk],
+            "checksums": [n.get("checksum") for n in chunk],
+            "simhashes": [n.get("simhash") for n in chunk],
+            "cluster_ids": [n.get("cluster_id") for n in chunk],
+        })
+        for r in res:
+            status[r.url] = "inserted" if r.inserted else "updated"
+        unchanged = [n["url"] for n in chunk if n["url"] not in status]
+        if unchanged:
+            db.execute(_TOUCH_CHECKED_SQL, {"urls": unchanged})
+            status.update((u, "unchanged") for u in unchanged)
+    return status
+
+def touch_checked(db: Session, urls: List[str]) -> None:
+    """본문을 다시 받지 않고 변경 없음만 확인한 공지(304/같은 본문)의 checked_at 갱신."""
+    if urls:
+        db.execute(_TOUCH_CHECKED_SQL, {"urls": list(urls)})
+
+def upsert_notice(db: Session, n: Dict) -> bool:
+    """공지 1건 upsert(upsert_notices와 같은 SQL/조건). 새로 insert됐으면 True."""
+    return upsert_notices(db, [n]).get(n["url"]) == "inserted"
+
+def find_known_notices(db: Session, url_keys: List[str], stale_hours: int = 24) -> Dict[str, Dict]:
     """
+    url_key 목록 중 app.notice에 이미 있는 것들을 한 번의 쿼리로 조회.
+    반환: {url_key: {"updated_at": 마지막 내용 변경, "checked_at": 마지막 확인,
+                     "stale": 마지막 확인이 stale_hours보다 오래됐는지}}
+    """
+    if not url_keys:
+        return {}
     sql = text("""
-        INSERT INTO app.notice
-            (url, url_key, title, body, category, posted_at, checksum)
-        VALUES
-            (:url, :url_key, :title, :body, :category, :posted_at, :checksum)
-        ON CONFLICT (url) DO UPDATE SET
-            title = EXCLUDED.title,
-            body = EXCLUDED.body,
-            category = COALESCE(EXCLUDED.category, app.notice.category),
-            posted_at = COALESCE(EXCLUDED.posted_at, app.notice.posted_at),
-            checksum = EXCLUDED.checksum,
-            updated_at = NOW()
-        RETURNING
-            (xmax = 0) AS inserted;  -- Postgres trick: true면 새로 insert
+        SELECT url_key, updated_at, COALESCE(checked_at, updated_at) AS checked_at,
+               (COALESCE(checked_at, updated_at) < NOW() - (:stale_hours * INTERVAL '1 hour')) AS stale
+        FROM app.notice
+        WHERE url_key = ANY(:keys)
     """)
-    res = db.execute(sql, {
-        "url": n["url"],
-        "url_key": n["url_key"],
-        "title": n["title"],
-        "body": n["body"],
-        "category": n.get("category"),
-        "posted_at": n.get("posted_at"),
-        "checksum": n.get("checksum")
-    }).first()
-    # inserted=True면 신규, False면 업데이트/스킵
-    return bool(res.inserted) if res and hasattr(res, "inserted") else False
+    rows = db.execute(sql, {"keys": list(url_keys), "stale_hours": stale_hours}).mappings().all()
+    return {
+        r["url_key"]: {"updated_at": r["updated_at"], "checked_at": r["checked_at"], "stale": bool(r["stale"])}
+        for r in rows
+    }
+
+def load_simhashes(db: Session) -> List[Dict]:
+    """근사 중복 인덱스 적재용: 지문이 있는 공지 전체(먼저 들어온 순)."""
+    rows = db.execute(text("""
+        SELECT url_key, simhash, cluster_id
+        FROM app.notice
+        WHERE simhash IS NOT NULL
+        ORDER BY id
+    """)).mappings().all()
+    return [dict(r) for r in rows]
+
+def notices_without_simhash(db: Session, after_id: int = 0, limit: int = 500) -> List[Dict]:
+    """지문이 없는(마이그레이션 이전) 공지를 id 순으로 limit건(keyset)."""
+    rows = db.execute(text("""
+        SELECT id, url_key, title, body
+        FROM app.notice
+        WHERE simhash IS NULL AND id > :after_id
+        ORDER BY id
+        LIMIT :limit
+    """), {"after_id": after_id, "limit": limit}).mappings().all()
+    return [dict(r) for r in rows]
+
+def save_clusters(db: Session, rows: List[Dict]) -> int:
+    """rows = [{url_key, simhash, cluster_id}, ...] (본문/updated_at은 건드리지 않음)"""
+    if not rows:
+        return 0
+    res = db.execute(text("""
+        UPDATE app.notice n
+        SET simhash = x.h, cluster_id = x.c
+        FROM unnest(CAST(:keys AS TEXT[]), CAST(:hashes AS BIGINT[]), CAST(:clusters AS TEXT[])) AS x(k, h, c)
+        WHERE n.url_key = x.k
+    """), {
+        "keys": [r["url_key"] for r in rows],
+        "hashes": [r["simhash"] for r in rows],
+        "clusters": [r["cluster_id"] for r in rows],
+    })
+    return res.rowcount or 0
+
+def duplicate_clusters(db: Session, limit: int = 20) -> List[Dict]:
+    """공지가 2건 이상 묶인 클러스터(큰 순)."""
+    rows = db.execute(text("""
+        SELECT c.cluster_id, COUNT(*) AS size,
+               MIN(r.title) AS title,
+               ARRAY_AGG(c.url ORDER BY c.id) AS urls
+        FROM app.notice c
+        LEFT JOIN app.notice r ON r.url_key = c.cluster_id
+        WHERE c.cluster_id IS NOT NULL
+        GROUP BY c.cluster_id
+        HAVING COUNT(*) > 1
+        ORDER BY size DESC, c.cluster_id
+        LIMIT :limit
+    """), {"limit": limit}).mappings().all()
+    return [dict(r) for r in rows]
@@ -0,0 +1,86 @@
+# app/repo/raw_archive_repo.py
+from __future__ import annotations
+from typing import Dict, Iterable, List, Optional, Set
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+def existing_hashes(db: Session, hashes: Iterable[str]) -> Set[str]:
+    hashes = list(set(hashes))
+    if not hashes:
+        return set()
+    rows = db.execute(
+        text("SELECT hash FROM app.raw_blob WHERE hash = ANY(:hashes)"),
+        {"hashes": hashes},
+    ).all()
+    return {r[0] for r in rows}
+
+def save_blobs(db: Session, blobs: List[Dict]) -> int:
+    """
+    blobs = [{hash, codec, size_raw, size_stored, data}, ...]
+    같은 hash가 이미 있으면 무시(내용이 같으므로 덮어쓸 필요 없음)
+    """
+    if not blobs:
+        return 0
+    sql = text("""
+        INSERT INTO app.raw_blob (hash, codec, size_raw, size_stored, data)
+        VALUES (:hash, :codec, :size_raw, :size_stored, :data)
+        ON CONFLICT (hash) DO NOTHING
+    """)
+    db.execute(sql, blobs)  # executemany
+    return len(blobs)
+
+def latest_raw(db: Session, url: str, before_id: Optional[int] = None) -> Optional[Dict]:
+    """
+    url의 가장 최근 아카이브(본문이 있는 fetch) 1건.
+    before_id를 주면 그보다 이전 fetch(이력 탐색용)
+    반환: {id, url, fetched_at, status, blob_hash, codec, data} | None
+    """
+    row = db.execute(text("""
+        SELECT r.id, r.url, r.fetched_at, r.status, r.blob_hash, b.codec, b.data
+        FROM app.notice_raw r
+        JOIN app.raw_blob b ON b.hash = r.blob_hash
+        WHERE r.url = :url
+          AND (CAST(:before_id AS BIGINT) IS NULL OR r.id < :before_id)
+        ORDER BY r.id DESC
+        LIMIT 1
+    """), {"url": url, "before_id": before_id}).mappings().first()
+    return dict(row) if row else None
+
+def raw_history(db: Session, url: str, limit: int = 50) -> List[Dict]:
+    """url의 fetch 이력(본문 없이 메타만). 같은 blob_hash가 이어지면 그동안 내용이 안 바뀐 것."""
+    rows = db.execute(text("""
+        SELECT r.id, r.fetched_at, r.status, r.blob_hash, b.size_raw, b.size_stored
+        FROM app.notice_raw r
+        LEFT JOIN app.raw_blob b ON b.hash = r.blob_hash
+        WHERE r.url = :url
+        ORDER BY r.id DESC
+        LIMIT :limit
+    """), {"url": url, "limit": limit}).mappings().all()
+    return [dict(r) for r in rows]
+
+def latest_raw_page(db: Session, after_url: str = "", limit: int = 200) -> List[Dict]:
+    """
+    URL별 최신 아카이브를 url 순으로 limit건씩(keyset 페이지네이션).
+    전체 재파싱 시 다음 호출엔 마지막 행의 url을 after_url로 넘김
+    """
+    rows = db.execute(text("""
+        SELECT DISTINCT ON (r.url) r.id, r.url, r.fetched_at, r.blob_hash, b.codec, b.data
+        FROM app.notice_raw r
+        JOIN app.raw_blob b ON b.hash = r.blob_hash
+        WHERE r.url > :after_url
+        ORDER BY r.url, r.id DESC
+        LIMIT :limit
+    """), {"after_url": after_url, "limit": limit}).mappings().all()
+    return [dict(r) for r in rows]
+
+def archive_stats(db: Session) -> Dict:
+    row = db.execute(text("""
+        SELECT
+            (SELECT COUNT(*) FROM app.raw_blob) AS blobs,
+            (SELECT COALESCE(SUM(size_raw), 0) FROM app.raw_blob) AS bytes_raw,
+            (SELECT COALESCE(SUM(size_stored), 0) FROM app.raw_blob) AS bytes_stored,
+            (SELECT COUNT(*) FROM app.notice_raw WHERE blob_hash IS NOT NULL) AS refs,
+            (SELECT COALESCE(SUM(b.size_raw), 0)
+               FROM app.notice_raw r JOIN app.raw_blob b ON b.hash = r.blob_hash) AS bytes_referenced
+    """)).mappings().first()
+    return dict(row) if row else {}
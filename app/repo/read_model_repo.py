@@ -0,0 +1,85 @@
+# app/repo/read_model_repo.py
+from __future__ import annotations
+from typing import Dict, List, Optional
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+# app.notice 중 읽기 모델(notices)에 없거나, 반영 이후 내용/카테고리/게시일이 바뀐 행
+_PENDING_SQL = text("""
+    SELECT n.url_key, n.url, n.title, n.body, n.category, n.posted_at, n.checksum, n.cluster_id
+    FROM app.notice n
+    LEFT JOIN notices r ON r.source_key = n.url_key
+    WHERE (r.id IS NULL
+           OR r.source_checksum IS DISTINCT FROM n.checksum
+           OR r.category IS DISTINCT FROM LEFT(n.category, 128)
+           OR r.cluster_id IS DISTINCT FROM n.cluster_id
+           OR r.date IS DISTINCT FROM (n.posted_at::timestamp AT TIME ZONE :tz))
+      AND (CAST(:keys AS TEXT[]) IS NULL OR n.url_key = ANY(CAST(:keys AS TEXT[])))
+      AND n.url_key > :after
+    ORDER BY n.url_key
+    LIMIT :limit
+""")
+
+_UPSERT_SQL = text("""
+    INSERT INTO notices
+        (source_key, source_checksum, url, title, content, category, date,
+         target_grade, target_major, target_student_number, cluster_id)
+    SELECT x.k, x.c, LEFT(x.u, 1024), LEFT(x.t, 512), x.b, LEFT(x.cat, 128),
+           (x.d::timestamp AT TIME ZONE :tz), x.g, LEFT(x.m, 128), x.sn, x.cl
+    FROM unnest(
+        CAST(:keys AS TEXT[]), CAST(:checksums AS TEXT[]), CAST(:urls AS TEXT[]),
+        CAST(:titles AS TEXT[]), CAST(:bodies AS TEXT[]), CAST(:categories AS TEXT[]),
+        CAST(:dates AS DATE[]), CAST(:grades AS INTEGER[]), CAST(:majors AS TEXT[]),
+        CAST(:student_numbers AS INTEGER[]), CAST(:clusters AS TEXT[])
+    ) AS x(k, c, u, t, b, cat, d, g, m, sn, cl)
+    ON CONFLICT (source_key) DO UPDATE SET
+        source_checksum = EXCLUDED.source_checksum,
+        url = EXCLUDED.url,
+        title = EXCLUDED.title,
+        content = EXCLUDED.content,
+        category = EXCLUDED.category,
+        date = EXCLUDED.date,
+        target_grade = EXCLUDED.target_grade,
+        target_major = EXCLUDED.target_major,
+        target_student_number = EXCLUDED.target_student_number,
+        cluster_id = EXCLUDED.cluster_id
+    RETURNING (xmax = 0) AS inserted
+""")
+
+def pending_projection(
+    db: Session, tz: str, url_keys: Optional[List[str]] = None, after: str = "", limit: int = 500,
+) -> List[Dict]:
+    """
+    projection이 필요한 app.notice 행을 url_key 순으로 limit건(keyset: 다음엔 마지막 url_key를 after로).
+    url_keys를 주면 그 안에서만 찾음(크롤 1회분), None이면 전체(초기 적재/따라잡기)
+    """
+    rows = db.execute(_PENDING_SQL, {
+        "tz": tz, "keys": list(url_keys) if url_keys is not None else None,
+        "after": after, "limit": limit,
+    }).mappings().all()
+    return [dict(r) for r in rows]
+
+def upsert_read_notices(db: Session, rows: List[Dict], tz: str) -> Dict[str, int]:
+    """
+    rows = [{source_key, source_checksum, url, title, content, category, posted_at,
+             target_grade, target_major, target_student_number, cluster_id}, ...]
+    반환: {"inserted": n, "updated": n}
+    """
+    if not rows:
+        return {"inserted": 0, "updated": 0}
+    res = db.execute(_UPSERT_SQL, {
+        "tz": tz,
+        "keys": [r["source_key"] for r in rows],
+        "checksums": [r.get("source_checksum") for r in rows],
+        "urls": [r["url"] for r in rows],
+        "titles": [r["title"] for r in rows],
+        "bodies": [r.get("content") for r in rows],
+        "categories": [r.get("category") for r in rows],
+        "dates": [r.get("posted_at") for r in rows],
+        "grades": [r.get("target_grade") for r in rows],
+        "majors": [r.get("target_major") for r in rows],
+        "student_numbers": [r.get("target_student_number") for r in rows],
+        "clusters": [r.get("cluster_id") for r in rows],
+    }).all()
+    inserted = sum(1 for r in res if r.inserted)
+    return {"inserted": inserted, "updated": len(res) - inserted}
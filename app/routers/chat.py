@@ -1,20 +1,24 @@
 # app/routers/chat.py
 from __future__ import annotations
 
+import asyncio
+import json
 from fastapi import APIRouter, Depends, HTTPException, status, Body
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from datetime import datetime
 import re
-from typing import Any, Dict, Optional, List
+from typing import Any, AsyncIterator, Dict, Optional, List, Tuple
 
 from app.schemas import ChatRequest, ChatResponse, ChatResponseItem
-from app.database import get_db
+from app.database import AsyncDB, get_async_db, get_db
 from app.crud import (
     get_user_by_id,
     get_cached_answer,
     upsert_cache,
 )
 from app.models.models import ChatLog
+from app.services import chat_flight, semantic_cache
 from app.services.llm import gpt_answer
 
 router = APIRouter()
@@ -46,106 +50,71 @@ def should_skip_cache(payload: Dict[str, Any]) -> bool:
     v = payload.get("nocache")
     return bool(v) is True
 
-# ---------------- 라우터 ----------------
-@router.post("/chat", response_model=ChatResponse)
-def chat_api(body: Dict[str, Any] = Body(...), db: Session = Depends(get_db)):
-    # 0) 요청 정규화 + 검증
+# ---------------- 공통 처리(sync/async 경로 공용) ----------------
+_FAILED = {
+    "title": "GPT 응답 생성 실패(임시)",
+    "link": None,
+    "summary": "현재 외부 응답 생성에 실패했습니다. 잠시 후 다시 시도해주세요.",
+}
+
+def _validate(body: Dict[str, Any]) -> Tuple[str, str]:
     try:
         req = ChatRequest(**normalize_chat_request(body))
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=f"잘못된 요청 바디: {e}")
+    return req.user_id.strip(), req.message.strip()
 
-    uid = req.user_id.strip()
-    question = req.message.strip()
-
-    # 1) 사용자 확인
-    user = get_user_by_id(db, uid)
+def _check_user(user: Any, uid: str, question: str) -> None:
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"사용자 정보를 찾을 수 없습니다. (user_id='{uid}')")
     if not question:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="질문이 비어 있습니다.")
 
-    force_llm = should_force_llm(body)
-    nocache = should_skip_cache(body)
+def _answer_fields(ans: Dict[str, Any]) -> Dict[str, Optional[str]]:
+    return {
+        "title": ans.get("title") or "자동 생성된 요약",
+        "link": ans.get("link"),
+        "summary": ans.get("summary") or "",
+    }
 
-    # === 경로 A: LLM 강제 (DB/캐시 우회) ===
-    if force_llm:
-        try:
-            ans = gpt_answer(question)
-            gpt_title = ans.get("title") or "자동 생성된 요약"
-            gpt_link = ans.get("link")
-            gpt_summary = ans.get("summary") or ""
-        except Exception as e:
-            print(f"[WARN] GPT call failed (force): {e}")
-            gpt_title, gpt_link = "GPT 응답 생성 실패(임시)", None
-            gpt_summary = "현재 외부 응답 생성에 실패했습니다. 잠시 후 다시 시도해주세요."
+def _cached_fields(cached: Any) -> Dict[str, Optional[str]]:
+    if isinstance(cached, dict):
+        return _answer_fields(cached)
+    d = getattr(cached, "__dict__", {})
+    return {
+        "title": d.get("title") or "자동 생성된 요약",
+        "link": d.get("link"),
+        "summary": d.get("summary") or d.get("content") or "",
+    }
 
-        # 로그 저장
-        try:
-            chat_log = ChatLog(
-                user_id=uid,
-                message=question,
-                summary=f"{gpt_title}\n{gpt_link or ''}\n{gpt_summary}".strip(),
-                timestamp=datetime.utcnow(),
-            )
-            db.add(chat_log); db.commit()
-        except Exception as e:
-            print(f"[WARN] chat log 저장 실패(force LLM): {e}")
-            db.rollback()
-
-        # 캐시 저장 (nocache가 아니면)
-        if not nocache:
-            try:
-                upsert_cache(db, uid, question, {"title": gpt_title, "link": gpt_link, "summary": gpt_summary})
-            except Exception as e:
-                print(f"[WARN] cache upsert 실패(force LLM): {e}")
-
-        item = ChatResponseItem(title=gpt_title, link=gpt_link, summary=gpt_summary)
-        return ChatResponse(results=[item], timestamp=datetime.utcnow(),
-                            title=item.title, link=item.link, summary=item.summary)
-
-    # === 경로 B: 기본(캐시 → LLM) ===
-    cached = None
-    if not nocache:
+def _exact_cache(db: Session, uid: str, question: str) -> Any:
+    try:
+        return get_cached_answer(db, uid, question)
+    except TypeError:
         try:
-            cached = get_cached_answer(db, uid, question)
-        except TypeError:
-            try:
-                cached = get_cached_answer(db, question)
-            except Exception:
-                cached = None
+            return get_cached_answer(db, question)
+        except Exception:
+            return None
 
+def _lookup_cache(db: Session, uid: str, question: str) -> Any:
+    # 정확히 같은 질문 → 없으면 비슷한 질문(semantic_cache)
+    cached = _exact_cache(db, uid, question)
     if cached:
-        if isinstance(cached, dict):
-            title = cached.get("title") or "자동 생성된 요약"
-            link = cached.get("link")
-            summary = cached.get("summary") or ""
-        else:
-            d = getattr(cached, "__dict__", {})
-            title = d.get("title") or "자동 생성된 요약"
-            link = d.get("link")
-            summary = d.get("summary") or d.get("content") or ""
-        item = ChatResponseItem(title=title, link=link, summary=summary)
-        return ChatResponse(results=[item], timestamp=datetime.utcnow(),
-                            title=item.title, link=item.link, summary=item.summary)
-
-    # LLM 호출
+        semantic_cache.record_exact_hit()
+        return cached
     try:
-        ans = gpt_answer(question)
-        gpt_title = ans.get("title") or "자동 생성된 요약"
-        gpt_link = ans.get("link")
-        gpt_summary = ans.get("summary") or ""
+        return semantic_cache.lookup(db, question)
     except Exception as e:
-        print(f"[WARN] GPT call failed: {e}")
-        gpt_title, gpt_link = "GPT 응답 생성 실패(임시)", None
-        gpt_summary = "현재 외부 응답 생성에 실패했습니다. 잠시 후 다시 시도해주세요."
+        print(f"[WARN] semantic cache lookup failed: {e}")
+        db.rollback()
+        return None
 
-    # 로그 저장
+def _save_log(db: Session, uid: str, question: str, fields: Dict[str, Optional[str]]) -> None:
     try:
         chat_log = ChatLog(
             user_id=uid,
             message=question,
-            summary=f"{gpt_title}\n{gpt_link or ''}\n{gpt_summary}".strip(),
+            summary=f"{fields['title']}\n{fields['link'] or ''}\n{fields['summary']}".strip(),
             timestamp=datetime.utcnow(),
         )
         db.add(chat_log); db.commit()
@@ -153,24 +122,181 @@ def chat_api(body: Dict[str, Any] = Body(...), db: Session = Depends(get_db)):
         print(f"[WARN] chat log 저장 실패: {e}")
         db.rollback()
 
-    # 캐시 저장 (nocache가 아니면)
-    if not nocache:
+def _save_cache(db: Session, uid: str, question: str, fields: Dict[str, Optional[str]]) -> None:
+    try:
+        item = upsert_cache(db, uid, question, dict(fields))
+    except TypeError:
         try:
-            upsert_cache(db, uid, question, {"title": gpt_title, "link": gpt_link, "summary": gpt_summary})
-        except TypeError:
-            try:
-                upsert_cache(db, question, gpt_title, gpt_link, gpt_summary)
-            except Exception as e:
-                print(f"[WARN] cache upsert 실패: {e}")
+            item = upsert_cache(db, question, fields["title"], fields["link"], fields["summary"])
         except Exception as e:
             print(f"[WARN] cache upsert 실패: {e}")
+            return
+    except Exception as e:
+        print(f"[WARN] cache upsert 실패: {e}")
+        return
+    semantic_cache.remember(getattr(item, "id", None), question)
+
+def _save_log_and_cache(db: Session, uid: str, question: str, fields: Dict[str, Optional[str]], nocache: bool) -> None:
+    _save_log(db, uid, question, fields)
+    if not nocache:
+        _save_cache(db, uid, question, fields)
+
+def _cache_saver(uid: str, question: str, nocache: bool):
+    """합쳐진 LLM 호출이 성공했을 때 1번만 캐시 저장(chat_flight on_success)."""
+    if nocache:
+        return None
 
-    # chat_api 마지막 반환부
-    item = ChatResponseItem(title=gpt_title, link=gpt_link, summary=gpt_summary)
+    async def save(db: AsyncDB, result: Dict[str, Any]) -> None:
+        await db.call(_save_cache, uid, question, _answer_fields(result))
+    return save
+
+def _response(fields: Dict[str, Optional[str]]) -> ChatResponse:
+    item = ChatResponseItem(**fields)
     return ChatResponse(
-    results=[item],
-    timestamp=datetime.utcnow(),
-    title=item.title,      # ✅ 최상위도 채움
-    link=item.link,
-    summary=item.summary,
+        results=[item],
+        timestamp=datetime.utcnow(),
+        title=item.title,      # ✅ 최상위도 채움
+        link=item.link,
+        summary=item.summary,
     )
+
+# ---------------- 라우터 ----------------
+@router.post("/chat", response_model=ChatResponse)
+async def chat_api(body: Dict[str, Any] = Body(...), db: AsyncDB = Depends(get_async_db)):
+    """
+    비동기 경로: LLM(AsyncOpenAI)과 DB(AsyncDB) 대기 중에 스레드를 잡지 않음 → 워커 1개로 동시 채팅 수백 개.
+    LLM은 CHAT_LLM_TIMEOUT_SEC, DB 호출은 각각 CHAT_DB_TIMEOUT_SEC로 제한.
+    같은 질문이 동시에 들어오면 진행 중인 LLM 호출 1건을 같이 기다림(chat_flight).
+    """
+    uid, question = _validate(body)
+    try:
+        user = await db.call(get_user_by_id, uid)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="DB 응답 지연")
+    _check_user(user, uid, question)
+
+    force_llm = should_force_llm(body)
+    nocache = should_skip_cache(body)
+
+    # 경로 B: 캐시 → LLM (경로 A: LLM 강제면 캐시 조회 생략)
+    if not force_llm and not nocache:
+        try:
+            cached = await db.call(_lookup_cache, uid, question)
+        except asyncio.TimeoutError:
+            print("[WARN] cache lookup timed out")
+            cached = None
+        if cached:
+            return _response(_cached_fields(cached))
+
+    flight, _ = chat_flight.join_or_start(question, on_success=_cache_saver(uid, question, nocache))
+    try:
+        fields = _answer_fields(await flight.result())
+    except Exception as e:
+        print(f"[WARN] GPT call failed{' (force)' if force_llm else ''}: {e!r}")
+        fields = dict(_FAILED)
+
+    try:
+        await db.call(_save_log, uid, question, fields)
+    except asyncio.TimeoutError:
+        print("[WARN] chat log 저장 시간 초과")
+    return _response(fields)
+
+# ---------------- 스트리밍(SSE) ----------------
+# 이벤트: start → field(필드 조각, 여러 번) → done(최종 title/link/summary)
+#         실패하면 error 뒤에 done(임시 안내 문구). 캐시 적중이면 start → done.
+#         같은 질문이 진행 중이면 거기에 합류(start.shared=true, 이미 나온 조각부터 받음).
+_SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+def _done(fields: Dict[str, Optional[str]], cached: bool) -> str:
+    return _sse("done", {**fields, "cached": cached, "timestamp": datetime.utcnow().isoformat()})
+
+async def _stream_cached(fields: Dict[str, Optional[str]]) -> AsyncIterator[str]:
+    yield _sse("start", {"cached": True})
+    yield _done(fields, cached=True)
+
+async def _stream_answer(db: AsyncDB, uid: str, question: str, nocache: bool) -> AsyncIterator[str]:
+    try:
+        flight, started = chat_flight.join_or_start(question, on_success=_cache_saver(uid, question, nocache))
+        yield _sse("start", {"cached": False, "shared": not started})  # 헤더/첫 바이트를 바로 내보냄
+        fields = None
+        try:
+            async for field, piece in flight.fields():
+                yield _sse("field", {"field": field, "delta": piece})
+            fields = _answer_fields(await flight.result())
+        except Exception as e:
+            print(f"[WARN] GPT stream failed: {e!r}")
+            yield _sse("error", {"message": "응답 생성 중 오류가 발생했습니다."})
+        if fields is None:
+            fields = dict(_FAILED)
+
+        # 완성된 답을 로그에 저장한 뒤 done(캐시는 LLM 호출 쪽에서 성공 시 저장)
+        try:
+            await db.call(_save_log, uid, question, fields)
+        except asyncio.TimeoutError:
+            print("[WARN] chat log 저장 시간 초과(stream)")
+        yield _done(fields, cached=False)
+    finally:
+        await db.close()
+
+@router.post("/chat/stream")
+async def chat_stream(body: Dict[str, Any] = Body(...)):
+    """
+    /api/chat과 같은 요청 바디, 응답은 text/event-stream.
+    첫 바이트는 요청 직후(start), 이후 모델 첫 토큰이 오는 대로 field 이벤트.
+    DB 핸들은 스트림이 끝날 때 닫아야 하므로 Depends 대신 직접 만들고 생성기에서 정리.
+    """
+    uid, question = _validate(body)
+    db = AsyncDB()
+    try:
+        try:
+            user = await db.call(get_user_by_id, uid)
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="DB 응답 지연")
+        _check_user(user, uid, question)
+
+        nocache = should_skip_cache(body)
+        if not should_force_llm(body) and not nocache:
+            try:
+                cached = await db.call(_lookup_cache, uid, question)
+            except asyncio.TimeoutError:
+                cached = None
+            if cached:
+                await db.close()
+                return StreamingResponse(_stream_cached(_cached_fields(cached)),
+                                         media_type="text/event-stream", headers=_SSE_HEADERS)
+    except BaseException:
+        await db.close()
+        raise
+    return StreamingResponse(_stream_answer(db, uid, question, nocache),
+                             media_type="text/event-stream", headers=_SSE_HEADERS)
+
+@router.get("/chat/stats")
+def chat_stats():
+    """이 워커 프로세스의 답 캐시(정확/의미 기반 적중, 유사도 분포)와 동시 질문 합치기(single-flight) 통계."""
+    return {"answer_cache": semantic_cache.stats(), "single_flight": chat_flight.stats()}
+
+@router.post("/chat/sync", response_model=ChatResponse)
+def chat_api_sync(body: Dict[str, Any] = Body(...), db: Session = Depends(get_db)):
+    """이전 동기 구현(스레드풀에서 LLM 응답까지 대기). 비교 측정(bench/bench_chat.py)용으로 유지."""
+    uid, question = _validate(body)
+    _check_user(get_user_by_id(db, uid), uid, question)
+
+    force_llm = should_force_llm(body)
+    nocache = should_skip_cache(body)
+
+    if not force_llm and not nocache:
+        cached = _lookup_cache(db, uid, question)
+        if cached:
+            return _response(_cached_fields(cached))
+
+    try:
+        fields = _answer_fields(gpt_answer(question))
+    except Exception as e:
+        print(f"[WARN] GPT call failed{' (force)' if force_llm else ''}: {e}")
+        fields = dict(_FAILED)
+
+    _save_log_and_cache(db, uid, question, fields, nocache)
+    return _response(fields)
@@ -1,18 +1,53 @@
 # app/routers/crawl_admin.py
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel, HttpUrl
+from typing import Optional
 from sqlalchemy.orm import Session
 
 from app.services.crawl_pipeline import crawl_and_store
+from app.services.notice_projection import project_notices
+from app.services.near_dup import backfill as backfill_near_dup
+from app.repo.notice_repo import duplicate_clusters
 from app.database import get_db  # 네 프로젝트에 이미 있는 의존성
 
 router = APIRouter()
 
 class RunReq(BaseModel):
     list_url: HttpUrl
-    limit: int = 30
+    limit: Optional[int] = 30            # None이면 상한 없음(백필)
+    concurrency: Optional[int] = None    # 호스트당 동시 상세 요청 수(없으면 설정값)
+    deadline_sec: Optional[float] = None # 전체 마감 시간(없으면 설정값)
+    incremental: bool = False            # True면 이미 저장된 URL은 상세 요청 생략
+    page_from: Optional[int] = None      # 목록 페이지 범위(백필)
+    page_to: Optional[int] = None
+    until_known: bool = False            # 이미 아는 공지가 연속으로 나올 때까지 페이지 진행
 
 @router.post("/crawl/run")
 def crawl_run(req: RunReq, db: Session = Depends(get_db)):
-    result = crawl_and_store(db, str(req.list_url), limit=req.limit)
+    result = crawl_and_store(
+        db, str(req.list_url), limit=req.limit,
+        concurrency=req.concurrency, deadline_sec=req.deadline_sec,
+        incremental=req.incremental,
+        page_from=req.page_from, page_to=req.page_to, until_known=req.until_known,
+    )
     return result
+
+@router.post("/crawl/project")
+def crawl_project(db: Session = Depends(get_db)):
+    """app.notice 전체를 훑어 읽기 모델(notices)에 밀린 변경을 반영(초기 적재/복구용)."""
+    result = project_notices(db)
+    db.commit()
+    return result
+
+@router.post("/crawl/dedup/backfill")
+def crawl_dedup_backfill(db: Session = Depends(get_db)):
+    """지문(simhash)이 없는 기존 공지에 근사 중복 클러스터 부여 후 읽기 모델에 반영."""
+    result = backfill_near_dup(db)
+    result["projected"] = project_notices(db)
+    db.commit()
+    return result
+
+@router.get("/crawl/dedup/clusters")
+def crawl_dedup_clusters(limit: int = 20, db: Session = Depends(get_db)):
+    """2건 이상 묶인 근사 중복 클러스터(큰 순)."""
+    return duplicate_clusters(db, limit=limit)
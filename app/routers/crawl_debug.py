@@ -1,9 +1,13 @@
 # app/routers/crawl_debug.py
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, HttpUrl
 from typing import Optional
+from sqlalchemy.orm import Session
 
 from app.crawler.sites.ewha_notice import fetch_notice_list, fetch_notice_detail
+from app.database import get_db
+from app.repo.raw_archive_repo import raw_history, archive_stats
+from app.services.raw_archive import load_html, reparse
 
 router = APIRouter()
 
@@ -27,3 +31,25 @@ def crawl_preview(req: PreviewReq):
         "items": items,
         "sample_detail": sample_detail
     }
+
+# --- 원본 HTML 아카이브 조회/재파싱(재크롤 없이) ---
+
+@router.get("/crawl/raw/stats")
+def crawl_raw_stats(db: Session = Depends(get_db)):
+    return archive_stats(db)
+
+@router.get("/crawl/raw")
+def crawl_raw(url: str, before_id: Optional[int] = None, history: int = 20, db: Session = Depends(get_db)):
+    arc = load_html(db, url, before_id=before_id)
+    if arc is None:
+        raise HTTPException(status_code=404, detail="archived html not found")
+    return {**arc, "history": raw_history(db, url, limit=history)}
+
+@router.get("/crawl/raw/reparse")
+def crawl_raw_reparse(url: str, before_id: Optional[int] = None, db: Session = Depends(get_db)):
+    res = reparse(db, url, before_id=before_id)
+    if res is None:
+        raise HTTPException(status_code=404, detail="archived html not found")
+    if "body" in res["parsed"]:
+        res["parsed"]["body"] = res["parsed"]["body"][:2000]
+    return res
@@ -7,6 +7,7 @@ from typing import Optional, Any, Dict, List
 from app.database import get_db
 from app.models.models import User, Notice
 from app.crud import filter_notices_by_user_info
+from app.crud.notice import collapse_duplicates
 
 router = APIRouter(prefix="/notice", tags=["notice"])
 
@@ -16,6 +17,7 @@ def _to_dict(n: Any) -> Dict[str, Any]:
         "title": getattr(n, "title", None),
         "category": getattr(n, "category", None),
         "url": getattr(n, "url", None),
+        "cluster_id": getattr(n, "cluster_id", None),
     }
 
 @router.get("/all")
@@ -28,21 +30,26 @@ def get_filtered_notices(
     question: Optional[str] = Query(None, description="사용자 질문"),
     limit: int = Query(200, ge=1, le=1000),
     only_passed: bool = Query(True, description="True면 통과만 반환, False면 dropped도 함께 반환"),
+    collapse: bool = Query(False, description="True면 근사 중복 공지(cluster_id)는 최신 1건만(그래도 최대 limit건)"),
     db: Session = Depends(get_db),
 ):
     user = db.query(User).filter(User.user_id == user_id).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
+    # 접을 때는 넉넉히 읽고 접은 뒤 limit건으로 자름(중복이 빠져도 결과가 limit보다 줄지 않게)
+    fetch = limit * 4 if collapse else limit
     try:
         notices = (
             db.query(Notice)
               .order_by(Notice.created_at.desc())
-              .limit(limit)
+              .limit(fetch)
               .all()
         )
     except Exception:
-        notices = db.query(Notice).limit(limit).all()
+        notices = db.query(Notice).limit(fetch).all()
+    if collapse:
+        notices = collapse_duplicates(notices, limit)
 
     if only_passed:
         passed = filter_notices_by_user_info(
@@ -0,0 +1,86 @@
+# app/schedule/adaptive.py
+"""
+시드별 적응형 크롤 주기.
+
+- 시드마다 최근 CRAWL_ADAPTIVE_WINDOW회 실행(app.crawl_run)에서 신규+변경 건수를 모아 변경 빈도(건/분) 추정
+  (가장 오래된 실행의 건수는 창 시작 전에 쌓인 것이므로 제외 → 첫 전체 수집이 빈도를 부풀리지 않음)
+- 주기 = 크롤 1회당 기대 변경 건수(CRAWL_ADAPTIVE_TARGET) / 변경 빈도
+  창 안에서 변경이 없었으면 빈도 < 1/관찰기간 이므로 관찰기간만큼 늘림
+- 바쁜 기간(CRAWL_BUSY_PERIODS)엔 × CRAWL_BUSY_FACTOR, 최종값은 MIN~MAX로 제한
+- 이력이 부족하면(실행 2회 미만) CRAWL_INTERVAL_MIN 그대로
+"""
+from __future__ import annotations
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import pytz
+from sqlalchemy.orm import Session
+
+from app.core.config import (
+    CRAWL_INTERVAL_MIN, CRAWL_ADAPTIVE_MIN_MIN, CRAWL_ADAPTIVE_MAX_MIN, CRAWL_ADAPTIVE_TARGET,
+    CRAWL_ADAPTIVE_WINDOW, CRAWL_BUSY_PERIODS, CRAWL_BUSY_FACTOR, TIMEZONE,
+)
+from app.repo.crawl_run_repo import seed_runs
+
+_tz = pytz.timezone(TIMEZONE)  # 바쁜 기간(월-일)은 현지 날짜 기준
+
+_MD = Tuple[int, int]
+
+def _parse_md(s: str) -> _MD:
+    m, d = s.strip().split("-")
+    return int(m), int(d)
+
+def _parse_periods(specs: List[str]) -> List[Tuple[_MD, _MD]]:
+    periods = []
+    for spec in specs:
+        try:
+            start, end = spec.split("~")
+            periods.append((_parse_md(start), _parse_md(end)))
+        except ValueError:
+            print(f"[WARN] CRAWL_BUSY_PERIODS 항목 형식 오류(MM-DD~MM-DD): '{spec}', 무시")
+    return periods
+
+BUSY_PERIODS = _parse_periods(CRAWL_BUSY_PERIODS)
+
+def in_busy_period(now: datetime) -> bool:
+    md = (now.month, now.day)
+    for start, end in BUSY_PERIODS:
+        # 12-20~01-10처럼 해를 넘기는 기간도 허용
+        if (start <= md <= end) if start <= end else (md >= start or md <= end):
+            return True
+    return False
+
+def _clamp(minutes: float) -> int:
+    return int(min(max(round(minutes), CRAWL_ADAPTIVE_MIN_MIN), CRAWL_ADAPTIVE_MAX_MIN))
+
+def plan_interval(runs: List[Dict], now: datetime) -> Dict:
+    """
+    runs = 시드의 최근 실행(최신순, started_at/inserted/updated/errors/error)
+    반환: {"interval_min", "reason", "busy", "changes", "span_min", "changes_per_day"}
+    """
+    busy = in_busy_period(now)
+    ok = [r for r in runs if not r.get("error")]
+    if len(ok) < 2:
+        base, reason, changes, span_min = float(CRAWL_INTERVAL_MIN), "warmup", None, None
+    else:
+        oldest = ok[-1]["started_at"]
+        span_min = max((now - oldest).total_seconds() / 60, 1.0)
+        changes = sum((r["inserted"] or 0) + (r["updated"] or 0) for r in ok[:-1])
+        if changes:
+            base, reason = CRAWL_ADAPTIVE_TARGET * span_min / changes, "rate"
+        else:
+            base, reason = span_min, "idle"
+    if busy:
+        base *= CRAWL_BUSY_FACTOR
+    return {
+        "interval_min": _clamp(base),
+        "reason": reason,
+        "busy": busy,
+        "changes": changes,
+        "span_min": round(span_min, 1) if span_min is not None else None,
+        "changes_per_day": round(changes / span_min * 1440, 2) if span_min and changes is not None else None,
+    }
+
+def plan_seed(db: Session, seed_url: str, now: Optional[datetime] = None) -> Dict:
+    runs = seed_runs(db, seed_url, CRAWL_ADAPTIVE_WINDOW)
+    return plan_interval(runs, now or datetime.now(_tz))
@@ -1,44 +1,249 @@
 # app/schedule/jobs.py
 from __future__ import annotations
-from datetime import datetime
-from typing import List, Dict
+import asyncio
+import multiprocessing
+import os
+import socket
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional
 import pytz
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
-from app.core.config import CRAWL_SEEDS, CRAWL_INTERVAL_MIN, TIMEZONE
+from app.core.config import (
+    CRAWL_SEEDS, CRAWL_INTERVAL_MIN, CRAWL_INCREMENTAL, CRAWL_JOB_MODE, TIMEZONE,
+    CRAWL_LEADER_ELECTION, CRAWL_LEADER_CHECK_SEC, CRAWL_HISTORY_RUNS, CRAWL_HISTORY_KEEP_DAYS,
+    CRAWL_ADAPTIVE,
+)
 from app.database import SessionLocal
+from app.repo.crawl_worker_repo import save_worker_status, load_worker_status
+from app.schedule import leader
+from app.schedule.adaptive import plan_seed
+from app.services import freshness
+from app.services.crawl_history import history_stats, record_failure, prune
 from app.services.crawl_pipeline import crawl_and_store
 
 _scheduler: AsyncIOScheduler | None = None
+_executor: Executor | None = None
 _last_results: List[Dict] = []
+_last_by_seed: Dict[str, Dict] = {}
+_plans: Dict[str, Dict] = {}  # 시드별 현재 주기 계획(adaptive)
 _last_run_at: datetime | None = None
+_last_finished_at: datetime | None = None
+_last_skipped_at: datetime | None = None
+_running = 0  # 실행 중인 크롤 작업 수(시드별 작업은 실행기 1개에서 차례로 돎)
 _tz = pytz.timezone(TIMEZONE)
 
-async def _job():
-    global _last_results, _last_run_at
-    _last_results = []
-    _last_run_at = datetime.now(_tz)
+def worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
 
-    for url in CRAWL_SEEDS:
-        db = SessionLocal()
+def _record_status(**fields) -> None:
+    """app.crawl_worker에 상태 기록(실패해도 크롤에는 영향 없음)."""
+    db = SessionLocal()
+    try:
+        save_worker_status(db, fields)
+        db.commit()
+    except Exception as e:
+        print(f"[WARN] crawl worker status save failed: {e}")
+    finally:
+        db.close()
+
+def _plan(url: str) -> Dict:
+    db = SessionLocal()
+    try:
+        return plan_seed(db, url, datetime.now(_tz))
+    except Exception as e:
+        print(f"[WARN] crawl interval plan failed for {url}: {e}")
+        return {"interval_min": CRAWL_INTERVAL_MIN, "reason": "fallback"}
+    finally:
+        db.close()
+
+def _crawl_seed(url: str, wid: str, seed_started: datetime, results: List[Dict]) -> None:
+    db = SessionLocal()
+    try:
+        result = crawl_and_store(
+            db, url, limit=50, incremental=CRAWL_INCREMENTAL, trigger="schedule", worker_id=wid,
+        )
+        results.append({"url": url, **result})
+    except Exception as e:
+        results.append({"url": url, "error": str(e)})
+        db.rollback()
+        record_failure(db, url, str(e), seed_started, trigger="schedule", worker_id=wid)
+    finally:
+        db.close()
+
+def run_crawl_cycle(
+    mode: str = CRAWL_JOB_MODE,
+    wid: Optional[str] = None,
+    next_run_at: Optional[datetime] = None,
+    seeds: Optional[List[str]] = None,
+) -> Dict:
+    """
+    시드(기본: 전체)를 한 번 크롤(동기, 이벤트 루프 밖의 스레드/프로세스/워커에서 호출).
+    process 모드에선 자식 프로세스에서 실행되므로 인자/반환값은 pickle 가능한 값만.
+    CRAWL_ADAPTIVE면 크롤 직후 시드별 다음 주기를 계산해 돌려줌(재스케줄은 호출자가).
+    반환: {"started_at", "finished_at", "results", "plans": {url: plan}}
+    """
+    wid = wid or worker_id()
+    seeds = seeds or CRAWL_SEEDS
+    started = datetime.now(_tz)
+    _record_status(worker_id=wid, mode=mode, running=True, last_run_at=started, next_run_at=next_run_at)
+
+    results: List[Dict] = []
+    plans: Dict[str, Dict] = {}
+    for url in seeds:
+        seed_started = datetime.now(_tz)
         try:
-            result = crawl_and_store(db, url, limit=50)
-            _last_results.append({"url": url, **result})
-        except Exception as e:
-            _last_results.append({"url": url, "error": str(e)})
-        finally:
-            db.close()
+            with leader.seed_lock(url) as got:
+                if not got:
+                    # 채팅 갱신(freshness) 등 다른 곳에서 같은 시드를 크롤 중
+                    results.append({"url": url, "skipped": "crawl in progress"})
+                    continue
+                _crawl_seed(url, wid, seed_started, results)
+        except Exception as e:  # 락 자체를 못 잡은 경우(DB 연결 실패 등)
+            results.append({"url": url, "error": str(e)})
+        if CRAWL_ADAPTIVE:
+            plans[url] = results[-1]["schedule"] = _plan(url)
+
+    db = SessionLocal()
+    try:
+        prune(db, CRAWL_HISTORY_KEEP_DAYS)
+    except Exception as e:
+        print(f"[WARN] crawl run history prune failed: {e}")
+    finally:
+        db.close()
+
+    finished = datetime.now(_tz)
+    _record_status(worker_id=wid, mode=mode, running=False, last_finished_at=finished, last_results=results)
+    return {"started_at": started, "finished_at": finished, "results": results, "plans": plans}
+
+def _get_executor() -> Executor:
+    # 크롤은 한 번에 하나만 돌므로 워커 1개(스레드 또는 spawn 프로세스)
+    global _executor
+    if _executor is None:
+        if CRAWL_JOB_MODE == "process":
+            _executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+        else:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="crawl-job")
+    return _executor
+
+def _seed_job_id(url: str) -> str:
+    return f"crawl_job:{url}"
+
+def _crawl_jobs(scheduler) -> List:
+    if scheduler is None:
+        return []
+    return [j for j in scheduler.get_jobs() if j.id == "crawl_job" or j.id.startswith("crawl_job:")]
+
+def next_crawl_at(scheduler) -> Optional[datetime]:
+    """가장 먼저 돌 크롤 작업 시각(시드별 작업이면 그중 최소)."""
+    times = [j.next_run_time for j in _crawl_jobs(scheduler) if j.next_run_time]
+    return min(times) if times else None
+
+def _next_run_at() -> Optional[datetime]:
+    return next_crawl_at(_scheduler)
+
+def add_crawl_jobs(scheduler, func, *args) -> None:
+    """
+    CRAWL_ADAPTIVE면 시드마다 작업 1개(각자 주기), 아니면 전체 시드를 CRAWL_INTERVAL_MIN마다 도는 작업 1개.
+    func(*args, seeds)로 호출됨.
+    적응형 초기 주기는 DB 이력 조회가 필요하므로 여기서 계산하지 않음(시작 훅/이벤트 루프를 막지 않게):
+    일단 알고 있는 주기(없으면 CRAWL_INTERVAL_MIN)로 등록하고, 곧바로 도는 1회성 작업이
+    스케줄러 실행기 스레드에서 계획을 계산해 재스케줄.
+    """
+    opts = dict(replace_existing=True, max_instances=1, coalesce=True)
+    if not CRAWL_ADAPTIVE:
+        scheduler.add_job(
+            func, IntervalTrigger(minutes=CRAWL_INTERVAL_MIN, timezone=_tz), args=(*args, None),
+            id="crawl_job", **opts,
+        )
+        return
+    for url in CRAWL_SEEDS:
+        interval = (_plans.get(url) or {}).get("interval_min", CRAWL_INTERVAL_MIN)
+        scheduler.add_job(
+            func, IntervalTrigger(minutes=interval, timezone=_tz), args=(*args, [url]),
+            id=_seed_job_id(url), **opts,
+        )
+    scheduler.add_job(
+        _init_plans, args=(scheduler,), id="crawl_plan_init", replace_existing=True,
+        next_run_time=datetime.now(_tz),
+    )
+
+def _init_plans(scheduler) -> None:
+    """시드별 초기 주기 계산(동기 함수 → AsyncIOScheduler에서도 실행기 스레드에서 돎)."""
+    apply_plans(scheduler, {url: _plan(url) for url in CRAWL_SEEDS})
+
+def apply_plans(scheduler, plans: Dict[str, Dict]) -> None:
+    """크롤 직후 계산된 시드별 주기가 바뀌었으면 해당 작업만 재스케줄(다음 실행 = 지금 + 새 주기)."""
+    for url, plan in (plans or {}).items():
+        _plans[url] = plan
+        job = scheduler.get_job(_seed_job_id(url)) if scheduler else None
+        if job is None:
+            continue
+        old, interval = getattr(job.trigger, "interval", None), timedelta(minutes=plan["interval_min"])
+        if old == interval:
+            continue
+        scheduler.reschedule_job(job.id, trigger=IntervalTrigger(minutes=plan["interval_min"], timezone=_tz))
+        print(f"[INFO] crawl interval for {url}: {old} -> {interval} ({plan['reason']})")
+
+async def _elect():
+    """리더 확인/획득(주기 작업). 리더가 죽으면 다음 주기에 다른 워커가 이어받음."""
+    await asyncio.to_thread(leader.ensure_leader, worker_id())
+
+async def _job(seeds: Optional[List[str]] = None):
+    """
+    이벤트 루프에서는 실행만 넘기고 기다림(requests/BeautifulSoup/DB 블로킹 작업은 전용 스레드·프로세스).
+    리더가 아닌 워커는 건너뜀(여러 워커/레플리카가 같은 시드를 동시에 크롤하지 않도록).
+    seeds: 시드별 작업(adaptive)이면 [url], 아니면 None(전체)
+    """
+    global _last_results, _last_run_at, _last_finished_at, _last_skipped_at, _running
+    if not await asyncio.to_thread(leader.ensure_leader, worker_id()):
+        _last_skipped_at = datetime.now(_tz)
+        return
+    _running += 1
+    _last_run_at = datetime.now(_tz)
+    loop = asyncio.get_running_loop()
+    try:
+        out = await loop.run_in_executor(
+            _get_executor(), run_crawl_cycle, CRAWL_JOB_MODE, worker_id(), _next_run_at(), seeds,
+        )
+        results = out["results"]
+        apply_plans(_scheduler, out["plans"])
+    except Exception as e:
+        # process 모드에서 자식이 죽은 경우 등: 다음 실행에서 새로 띄우도록 정리
+        print(f"[WARN] crawl job failed: {e}")
+        results = [{"url": url, "error": str(e)} for url in (seeds or CRAWL_SEEDS)]
+        _shutdown_executor()
+    finally:
+        _running -= 1
+        _last_finished_at = datetime.now(_tz)
+    _last_by_seed.update({r["url"]: r for r in results})
+    _last_results = list(_last_by_seed.values())
+
+def _shutdown_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
 
 def start_scheduler():
-    """앱 시작 시 스케줄러 실행"""
+    """앱 시작 시 스케줄러 실행(external 모드면 별도 워커가 담당하므로 띄우지 않음)"""
     global _scheduler
+    if CRAWL_JOB_MODE == "external":
+        return None
     if _scheduler and _scheduler.running:
         return _scheduler
 
     _scheduler = AsyncIOScheduler(timezone=_tz)
-    trigger = IntervalTrigger(minutes=CRAWL_INTERVAL_MIN, timezone=_tz)
-    _scheduler.add_job(_job, trigger, id="crawl_job", replace_existing=True)
+    # 이전 실행이 끝나지 않았으면 겹쳐 돌리지 않음(밀린 실행은 1회로 합침)
+    add_crawl_jobs(_scheduler, _job)
+    if CRAWL_LEADER_ELECTION:
+        _scheduler.add_job(
+            _elect, IntervalTrigger(seconds=max(CRAWL_LEADER_CHECK_SEC, 5), timezone=_tz),
+            id="leader_job", replace_existing=True, max_instances=1, coalesce=True,
+            next_run_time=datetime.now(_tz),
+        )
     _scheduler.start()
     return _scheduler
 
@@ -47,23 +252,96 @@ def shutdown_scheduler():
     global _scheduler
     if _scheduler and _scheduler.running:
         _scheduler.shutdown(wait=False)
+    _shutdown_executor()
+    leader.release()
+
+def _iso(dt: Optional[datetime]) -> Optional[str]:
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        dt = _tz.localize(dt)
+    return dt.isoformat()
+
+def _workers_from_db() -> List[Dict]:
+    db = SessionLocal()
+    try:
+        rows = load_worker_status(db)
+    except Exception as e:
+        print(f"[WARN] crawl worker status load failed: {e}")
+        return []
+    finally:
+        db.close()
+    for r in rows:
+        for k in ("last_run_at", "last_finished_at", "next_run_at", "updated_at"):
+            r[k] = _iso(r[k])
+    return rows
+
+def _history() -> Dict:
+    db = SessionLocal()
+    try:
+        return history_stats(db, CRAWL_HISTORY_RUNS)
+    except Exception as e:
+        print(f"[WARN] crawl run history load failed: {e}")
+        return {}
+    finally:
+        db.close()
+
+def _leader_status() -> Dict:
+    current = None
+    if CRAWL_LEADER_ELECTION:
+        try:
+            current = leader.current_leader()
+        except Exception as e:
+            print(f"[WARN] crawl leader lookup failed: {e}")
+    return {
+        "enabled": CRAWL_LEADER_ELECTION,
+        "worker_id": worker_id(),
+        "is_leader": leader.is_leader() and CRAWL_JOB_MODE != "external",
+        "leader": current,  # 락을 잡은 세션(pid, application_name=...:<host:pid>, client_addr)
+        "last_skipped_at": _iso(_last_skipped_at),
+    }
+
+def _seed_schedule(last_results: List[Dict]) -> List[Dict]:
+    """시드별 현재 주기/근거(external 모드면 워커가 남긴 마지막 결과의 schedule)."""
+    from_results = {r.get("url"): r.get("schedule") for r in last_results if r.get("schedule")}
+    out = []
+    for url in CRAWL_SEEDS:
+        job = _scheduler.get_job(_seed_job_id(url)) if _scheduler else None
+        plan = _plans.get(url) or from_results.get(url) or {}
+        out.append({"url": url, **plan, "next_run_at": _iso(job.next_run_time) if job else None})
+    return out
 
 def get_status():
     """상태 확인용 (라우터에서 호출)"""
-    next_run = None
-    if _scheduler:
-        jobs = _scheduler.get_jobs()
-        if jobs:
-            next_run = jobs[0].next_run_time
-            if next_run and next_run.tzinfo is None:
-                next_run = _tz.localize(next_run)
+    next_run = _next_run_at()
+    workers = _workers_from_db()
+
+    last_run_at, last_finished_at = _iso(_last_run_at), _iso(_last_finished_at)
+    last_results, next_run_at, running = _last_results, _iso(next_run), _running > 0
+    if CRAWL_JOB_MODE == "external" and workers:
+        # 크롤은 별도 워커가 하므로 가장 최근 워커 상태를 보여줌
+        w = workers[0]
+        last_run_at, last_finished_at = w["last_run_at"], w["last_finished_at"]
+        last_results, next_run_at, running = w["last_results"] or [], w["next_run_at"], w["running"]
+    history = _history()
+    if last_run_at is None and history.get("runs"):
+        # 재시작 직후: 메모리 상태가 비어 있으면 DB에 남은 마지막 실행 시각
+        last_run_at = history["runs"][0]["started_at"]
 
     return {
         "seeds": CRAWL_SEEDS,
         "interval_min": CRAWL_INTERVAL_MIN,
-        "last_run_at": _last_run_at.isoformat() if _last_run_at else None,
-        "next_run_at": next_run.isoformat() if next_run else None,
-        "last_results": _last_results,
+        "mode": CRAWL_JOB_MODE,
+        "last_run_at": last_run_at,
+        "last_finished_at": last_finished_at,
+        "next_run_at": next_run_at,
+        "last_results": last_results,
+        "adaptive": {"enabled": CRAWL_ADAPTIVE, "seeds": _seed_schedule(last_results) if CRAWL_ADAPTIVE else []},
+        "crawl_running": running,
+        "workers": workers,
+        "leader": _leader_status(),
+        "chat_freshness": freshness.status(),
+        "history": history,  # 최근 실행별 지연/결과, 종류별 p50/p95/p99, 추세
         "timezone": TIMEZONE,
-        "running": bool(_scheduler and _scheduler.running),
+        "running": bool(_scheduler and _scheduler.running) or CRAWL_JOB_MODE == "external",
     }
@@ -0,0 +1,176 @@
+# app/schedule/leader.py
+"""
+크롤 스케줄러 리더 선출(Postgres advisory lock, 추가 서비스 없음).
+
+- 모든 워커/레플리카가 스케줄러를 띄우되, 세션 advisory lock을 잡은 프로세스만 크롤 실행
+- 락은 리더 전용 커넥션 1개에 묶여 있음 → 프로세스가 죽거나 커넥션이 끊기면 Postgres가 즉시 해제,
+  다른 워커가 다음 확인 주기(CRAWL_LEADER_CHECK_SEC)에 이어받음(failover)
+- 리더 커넥션은 application_name = 'cambee-crawl-leader:<host:pid>' → pg_locks + pg_stat_activity로
+  어느 워커가 리더인지 누구나 조회 가능
+- TCP keepalive로 네트워크가 끊긴 리더의 락도 오래 남지 않게 함
+- 시드별 크롤 락(seed_lock): 스케줄 크롤과 채팅 갱신(freshness)이 같은 시드를 동시에 크롤하지 않게
+  (락은 세션 단위라 다른 프로세스뿐 아니라 같은 프로세스의 다른 스레드와도 배타)
+"""
+from __future__ import annotations
+import threading
+import zlib
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, Optional, Set
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from app.core.config import CRAWL_LEADER_ELECTION, CRAWL_LEADER_LOCK_KEY
+from app.database import DB_URL, engine
+
+APP_NAME_PREFIX = "cambee-crawl-leader:"
+
+_conn: Optional[Connection] = None
+_engine = None
+_lock = threading.Lock()
+
+def _leader_engine(worker_id: str):
+    # 풀 밖의 전용 커넥션(pool_recycle 등으로 교체되면 락이 풀리므로)
+    global _engine
+    if _engine is None:
+        _engine = _create_leader_engine(worker_id)
+    return _engine
+
+def _create_leader_engine(worker_id: str):
+    return create_engine(
+        DB_URL,
+        poolclass=NullPool,
+        isolation_level="AUTOCOMMIT",
+        connect_args={
+            "application_name": f"{APP_NAME_PREFIX}{worker_id}"[:63],
+            "keepalives": 1, "keepalives_idle": 30, "keepalives_interval": 10, "keepalives_count": 3,
+        },
+    )
+
+def _close() -> None:
+    global _conn
+    if _conn is not None:
+        try:
+            _conn.close()
+        except Exception:
+            pass
+        _conn = None
+
+def _alive() -> bool:
+    try:
+        _conn.execute(text("SELECT 1"))
+        return True
+    except Exception:
+        return False
+
+def ensure_leader(worker_id: str) -> bool:
+    """
+    리더면 True. 리더가 아니면 락 획득을 1회 시도(비차단).
+    리더 커넥션이 끊겼으면 리더 자격을 잃은 것으로 보고 새 커넥션으로 다시 시도.
+    CRAWL_LEADER_ELECTION=0이면 항상 True(단일 프로세스 배포).
+    """
+    global _conn
+    if not CRAWL_LEADER_ELECTION:
+        return True
+    with _lock:
+        if _conn is not None:
+            if _alive():
+                return True
+            print("[WARN] crawl leader connection lost, re-electing")
+            _close()
+        conn = None
+        try:
+            conn = _leader_engine(worker_id).connect()
+            got = conn.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": CRAWL_LEADER_LOCK_KEY},
+            ).scalar()
+        except Exception as e:
+            print(f"[WARN] crawl leader election failed: {e}")
+            got = False
+        if got:
+            _conn = conn
+            print(f"[INFO] crawl leader acquired by {worker_id}")
+            return True
+        if conn is not None:
+            conn.close()
+        return False
+
+def is_leader() -> bool:
+    """마지막 확인 기준(DB 왕복 없음). 상태 표시용."""
+    return (not CRAWL_LEADER_ELECTION) or _conn is not None
+
+def release() -> None:
+    """앱 종료 시 락 반납(커넥션을 닫으면 Postgres가 해제)."""
+    with _lock:
+        _close()
+
+def current_leader() -> Optional[Dict]:
+    """
+    지금 락을 잡고 있는 세션 정보(pg_locks + pg_stat_activity).
+    bigint 키는 classid(상위 32비트) / objid(하위 32비트)로 나뉘어 기록됨.
+    """
+    key = CRAWL_LEADER_LOCK_KEY
+    with engine.connect() as conn:
+        row = conn.execute(text("""
+            SELECT a.pid, a.application_name, a.client_addr::text AS client_addr, a.backend_start
+            FROM pg_locks l
+            JOIN pg_stat_activity a ON a.pid = l.pid
+            WHERE l.locktype = 'advisory' AND l.granted
+              AND l.classid = :classid AND l.objid = :objid AND l.objsubid = 1
+            LIMIT 1
+        """), {"classid": (key >> 32) & 0xFFFFFFFF, "objid": key & 0xFFFFFFFF}).mappings().first()
+    if not row:
+        return None
+    leader = dict(row)
+    name = leader.get("application_name") or ""
+    leader["worker_id"] = name[len(APP_NAME_PREFIX):] if name.startswith(APP_NAME_PREFIX) else None
+    if leader.get("backend_start") is not None:
+        leader["backend_start"] = leader["backend_start"].isoformat()
+    return leader
+
+# --- 시드별 크롤 락 ---
+# 2-key advisory lock(int4, int4): pg_locks에는 classid=SEED_LOCK_CLASS, objid=시드 키, objsubid=2로 기록됨
+SEED_LOCK_CLASS = (CRAWL_LEADER_LOCK_KEY + 2) & 0x7FFFFFFF
+
+def _seed_key(url: str) -> int:
+    return zlib.crc32(url.encode("utf-8")) & 0x7FFFFFFF
+
+@contextmanager
+def seed_lock(url: str) -> Iterator[bool]:
+    """
+    with seed_lock(url) as got: 이 시드를 지금 크롤해도 되면 got=True(대기하지 않음).
+    다른 프로세스/스레드가 같은 시드를 크롤 중이면 False → 호출자는 건너뜀.
+    """
+    params = {"cls": SEED_LOCK_CLASS, "key": _seed_key(url)}
+    conn = engine.connect()
+    got = False
+    try:
+        got = bool(conn.execute(text("SELECT pg_try_advisory_lock(:cls, :key)"), params).scalar())
+        conn.commit()
+        yield got
+    finally:
+        if got:
+            try:
+                conn.execute(text("SELECT pg_advisory_unlock(:cls, :key)"), params)
+                conn.commit()
+            except Exception as e:
+                # 락을 쥔 커넥션이 풀로 돌아가지 않게 버림(커넥션이 닫히면 Postgres가 해제)
+                print(f"[WARN] seed lock release failed for {url}: {e}")
+                conn.invalidate()
+        conn.close()
+
+def crawling_seeds(db: Session, urls: Iterable[str]) -> Set[str]:
+    """
+    지금 어느 프로세스/스레드든 크롤 중인(seed_lock을 쥔) 시드.
+    호출자의 세션으로 조회(채팅 경로에선 AsyncDB가 넘긴 세션 → 이벤트 루프 스레드에서 sync 엔진을 열지 않음).
+    """
+    by_key = {_seed_key(u): u for u in urls}
+    if not by_key:
+        return set()
+    rows = db.execute(text("""
+        SELECT objid::bigint AS key FROM pg_locks
+        WHERE locktype = 'advisory' AND granted AND classid = :cls AND objsubid = 2
+    """), {"cls": SEED_LOCK_CLASS}).scalars().all()
+    return {by_key[k] for k in rows if k in by_key}
@@ -0,0 +1,61 @@
+# app/schedule/worker.py
+"""
+크롤 전용 워커 프로세스(CRAWL_JOB_MODE=external일 때 API 대신 크롤 담당).
+
+    python -m app.schedule.worker          # CRAWL_INTERVAL_MIN마다 크롤(CRAWL_ADAPTIVE면 시드별 주기)
+    python -m app.schedule.worker --once   # 1회 실행 후 종료(cron/k8s CronJob용)
+
+상태는 app.crawl_worker에 기록되고 API의 /api/schedule/status에서 조회됨.
+"""
+from __future__ import annotations
+import argparse
+import json
+from typing import List
+
+import pytz
+from apscheduler.schedulers.blocking import BlockingScheduler
+
+from app.core.config import CRAWL_ADAPTIVE, CRAWL_INTERVAL_MIN, TIMEZONE
+from app.crawler.parse_worker import shutdown_pool
+from app.schedule import leader
+from app.schedule.jobs import run_crawl_cycle, worker_id, add_crawl_jobs, apply_plans, next_crawl_at
+
+_tz = pytz.timezone(TIMEZONE)
+
+def _run(scheduler: BlockingScheduler | None = None, seeds: List[str] | None = None) -> None:
+    # 워커를 여러 개 띄워도 리더 하나만 크롤(리더가 죽으면 다음 주기에 다른 워커가 이어받음)
+    if not leader.ensure_leader(worker_id()):
+        print(f"[INFO] crawl worker {worker_id()} is not leader, skipping")
+        return
+    out = run_crawl_cycle("external", worker_id(), next_crawl_at(scheduler), seeds)
+    if scheduler is not None:
+        apply_plans(scheduler, out["plans"])
+    print(json.dumps(out["results"], ensure_ascii=False, default=str))
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--once", action="store_true", help="1회 크롤 후 종료")
+    args = ap.parse_args()
+
+    if args.once:
+        try:
+            _run()
+        finally:
+            shutdown_pool()
+            leader.release()
+        return
+
+    scheduler = BlockingScheduler(timezone=_tz)
+    add_crawl_jobs(scheduler, _run, scheduler)
+    every = "adaptive per seed" if CRAWL_ADAPTIVE else f"every {CRAWL_INTERVAL_MIN} min"
+    print(f"[INFO] crawl worker {worker_id()} started ({every})")
+    try:
+        scheduler.start()
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
+        shutdown_pool()
+        leader.release()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+# app/services/chat_flight.py
+"""
+같은 질문이 동시에 몰릴 때 LLM 호출을 1번으로 합침(single-flight, 프로세스/이벤트 루프 단위).
+
+- 키 = 정규화한 질문(+ 사용자 구분 segment: 답이 사용자 정보에 따라 달라질 때만 넘김, 지금 gpt_answer는 질문만 씀)
+- 처음 온 요청이 비행(flight)을 시작하고, 끝나기 전에 같은 키로 온 요청은 거기에 합류
+  - /api/chat: 결과만 기다림
+  - /api/chat/stream: 지금까지 나온 field 조각을 먼저 받고 이후 조각을 실시간으로 받음
+- LLM 호출은 별도 태스크라 시작한 요청이 끊겨도(클라이언트 종료) 합류한 요청은 끝까지 받음
+- 답 캐시 저장도 비행당 1번(성공했을 때만), ChatLog는 요청마다
+  - 저장 여부는 비행 단위: 참여한 요청 중 하나라도 저장을 허용하면(nocache가 아니면) 저장
+    (시작한 요청이 nocache여도 뒤에 합류한 일반 요청의 답은 캐시에 남음)
+- 합치는 범위는 워커 프로세스 하나(여러 워커 사이의 중복은 답 캐시가 흡수)
+- CHAT_SINGLE_FLIGHT=0이면 요청마다 따로 호출(같은 코드 경로, 등록만 안 함)
+"""
+from __future__ import annotations
+import asyncio
+import re
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from app.core.config import CHAT_SINGLE_FLIGHT
+from app.crawler.utils import normalize_text
+from app.database import AsyncDB
+from app.services.llm import gpt_stream_async
+
+_END = object()
+OnSuccess = Callable[[AsyncDB, Dict], Awaitable[Any]]
+# 끝의 물음표/마침표/물결/공백 차이는 같은 질문으로 봄
+_TRAILING_RE = re.compile(r"[\s?？!.~]+$")
+
+def normalize_question(question: str) -> str:
+    return _TRAILING_RE.sub("", normalize_text(question).lower())
+
+def flight_key(question: str, segment: Optional[str] = None) -> Hashable:
+    return (normalize_question(question), segment)
+
+class Flight:
+    """LLM 호출 1건 + 그 스트림 조각을 구독자에게 나눠 줌."""
+
+    def __init__(self, on_success: Optional[OnSuccess] = None):
+        self.events: List[Any] = []
+        self.task: Optional[asyncio.Task] = None
+        self.joined = 0
+        self.on_success = on_success  # 합류한 요청이 채울 수 있음(_run이 끝날 때 읽음)
+        self._subs: Set[asyncio.Queue] = set()
+
+    def publish(self, event: Any) -> None:
+        self.events.append(event)
+        for q in self._subs:
+            q.put_nowait(event)
+
+    async def fields(self) -> AsyncIterator[Tuple[str, str]]:
+        """(필드명, 조각): 이미 나온 것부터 다시 보내고 이어서 실시간으로."""
+        q: asyncio.Queue = asyncio.Queue()
+        replay = list(self.events)  # 복사와 구독 등록 사이에 await가 없으므로 누락/중복 없음
+        self._subs.add(q)
+        try:
+            for ev in replay:
+                if ev is _END:
+                    return
+                yield ev
+            while True:
+                ev = await q.get()
+                if ev is _END:
+                    return
+                yield ev
+        finally:
+            self._subs.discard(q)
+
+    async def result(self) -> Dict[str, Optional[str]]:
+        # shield: 기다리던 요청이 취소돼도 LLM 호출은 계속(다른 요청이 기다리는 중일 수 있음)
+        return await asyncio.shield(self.task)
+
+_flights: Dict[Hashable, Flight] = {}
+_stats = {"started": 0, "joined": 0, "max_joined": 0}
+
+async def _run(flight: Flight, question: str) -> Dict:
+    db = AsyncDB()  # 시작한 요청의 DB 핸들과 분리(그 요청이 먼저 끝나도 안전)
+    try:
+        result: Optional[Dict] = None
+        async for kind, payload in gpt_stream_async(db, question):
+            if kind == "field":
+                flight.publish(payload)
+            else:
+                result = payload
+        on_success = flight.on_success
+        if on_success is not None:
+            try:
+                await on_success(db, result)
+            except Exception as e:
+                print(f"[WARN] chat flight on_success failed: {e!r}")
+        return result
+    finally:
+        flight.publish(_END)
+        await db.close()
+
+def _finished(key: Hashable, flight: Flight, task: asyncio.Task) -> None:
+    if _flights.get(key) is flight:
+        del _flights[key]
+    if not task.cancelled():
+        task.exception()  # 기다리는 쪽이 없어도 "never retrieved" 경고가 나지 않게
+
+def join_or_start(
+    question: str,
+    segment: Optional[str] = None,
+    on_success: Optional[OnSuccess] = None,
+) -> Tuple[Flight, bool]:
+    """
+    반환: (flight, 시작했는지).
+    on_success(db, result)는 비행당 1번 LLM 성공 후 실행: 시작한 쪽 것, 없으면(nocache) 먼저 합류해 넘긴 쪽 것.
+    """
+    key = flight_key(question, segment)
+    flight = _flights.get(key) if CHAT_SINGLE_FLIGHT else None
+    if flight is not None and not flight.task.done():
+        flight.joined += 1
+        if flight.on_success is None:
+            flight.on_success = on_success
+        _stats["joined"] += 1
+        _stats["max_joined"] = max(_stats["max_joined"], flight.joined)
+        return flight, False
+    flight = Flight(on_success)
+    flight.task = asyncio.ensure_future(_run(flight, question))
+    flight.task.add_done_callback(lambda t: _finished(key, flight, t))
+    if CHAT_SINGLE_FLIGHT:
+        _flights[key] = flight
+    _stats["started"] += 1
+    return flight, True
+
+def stats() -> Dict[str, Any]:
+    total = _stats["started"] + _stats["joined"]
+    return {
+        "enabled": CHAT_SINGLE_FLIGHT,
+        **_stats,
+        "in_flight": len(_flights),
+        "llm_calls_saved_ratio": round(_stats["joined"] / total, 4) if total else 0.0,
+    }
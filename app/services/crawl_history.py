@@ -0,0 +1,116 @@
+# app/services/crawl_history.py
+"""
+크롤 실행 이력 저장/집계.
+
+- record_run: crawl_and_store 1회 결과 + URL별 측정값(fetch/parse/write ms, HTTP 상태, 바이트, 결과)을 저장
+- record_failure: 예외로 끝난 실행도 실패 1건으로 남김(오류율 집계용)
+- history_stats: 최근 N회 실행 목록 + 종류별 지연 백분위 + 추세(앞쪽 절반 대비 최근 절반)
+"""
+from __future__ import annotations
+from datetime import datetime
+from statistics import median
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.repo.crawl_run_repo import insert_run, insert_fetches, recent_runs, fetch_percentiles, prune_runs
+
+_RESULT_KEYS = ("found", "inserted", "updated", "unchanged", "not_modified", "errors")
+
+def record_run(
+    db: Session,
+    seed_url: str,
+    result: Dict,
+    fetches: List[Dict],
+    started_at: datetime,
+    trigger: str = "api",
+    worker_id: Optional[str] = None,
+) -> int:
+    """커밋은 호출자가 함(크롤 결과와 같은 트랜잭션)."""
+    run = {
+        "seed_url": seed_url, "worker_id": worker_id, "trigger": trigger, "started_at": started_at,
+        "duration_ms": (result.get("stages") or {}).get("total_ms"),
+        "summary": {k: v for k, v in result.items() if k not in _RESULT_KEYS},
+        **{k: result.get(k, 0) for k in _RESULT_KEYS},
+    }
+    run_id = insert_run(db, run)
+    insert_fetches(db, run_id, [f for f in fetches if f.get("url")])
+    return run_id
+
+def record_failure(
+    db: Session,
+    seed_url: str,
+    error: str,
+    started_at: datetime,
+    trigger: str = "api",
+    worker_id: Optional[str] = None,
+) -> Optional[int]:
+    """크롤이 예외로 끝난 경우(별도 세션에서 호출, 실패해도 경고만)."""
+    try:
+        run_id = insert_run(db, {
+            "seed_url": seed_url, "worker_id": worker_id, "trigger": trigger,
+            "started_at": started_at, "errors": 1, "error": error[:2000],
+        })
+        db.commit()
+        return run_id
+    except Exception as e:
+        db.rollback()
+        print(f"[WARN] crawl run failure save failed: {e}")
+        return None
+
+def prune(db: Session, keep_days: int) -> int:
+    deleted = prune_runs(db, keep_days)
+    db.commit()
+    return deleted
+
+def _num(v) -> Optional[float]:
+    return None if v is None else round(float(v), 1)
+
+def _median(values: List[Optional[float]]) -> Optional[float]:
+    vals = [v for v in values if v is not None]
+    return round(median(vals), 1) if vals else None
+
+def _change_pct(old: Optional[float], new: Optional[float]) -> Optional[float]:
+    if not old or new is None:
+        return None
+    return round((new - old) / old * 100, 1)
+
+def _trend(runs: List[Dict]) -> Dict:
+    """최신순 runs를 반으로 나눠 상세 fetch/parse p50 중앙값과 오류율 비교(+면 느려짐/나빠짐)."""
+    if len(runs) < 2:
+        return {}
+    half = len(runs) // 2
+    newer, older = runs[:half], runs[half:]
+
+    def _side(rs: List[Dict]) -> Dict:
+        fetches = sum(r["fetches"] or 0 for r in rs)
+        errors = sum((r["fetch_errors"] or 0) + (1 if r["error"] else 0) for r in rs)
+        return {
+            "runs": len(rs),
+            "fetch_p50": _median([r["fetch_p50"] for r in rs]),
+            "parse_p50": _median([r["parse_p50"] for r in rs]),
+            "error_rate": round(errors / fetches, 4) if fetches else None,
+        }
+
+    o, n = _side(older), _side(newer)
+    return {
+        "older": o, "newer": n,
+        "fetch_p50_change_pct": _change_pct(o["fetch_p50"], n["fetch_p50"]),
+        "parse_p50_change_pct": _change_pct(o["parse_p50"], n["parse_p50"]),
+    }
+
+def history_stats(db: Session, limit: int = 20) -> Dict:
+    """상태 API용: 최근 limit회 실행 + 종류(list/detail)별 지연 백분위 + 추세."""
+    runs = recent_runs(db, limit)
+    for r in runs:
+        for k in ("fetch_p50", "fetch_p95", "parse_p50", "parse_p95"):
+            r[k] = _num(r[k])
+        if r["started_at"] is not None:
+            r["started_at"] = r["started_at"].isoformat()
+    by_kind = {}
+    for p in fetch_percentiles(db, limit):
+        kind = p.pop("kind")
+        by_kind[kind] = {
+            k: (_num(v) if k.endswith(("_p50", "_p95", "_p99")) else int(v or 0)) for k, v in p.items()
+        }
+    return {"runs": runs, "latency": by_kind, "trend": _trend(runs)}
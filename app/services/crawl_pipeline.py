@@ -1,55 +1,673 @@
 # app/services/crawl_pipeline.py
 from __future__ import annotations
-from typing import Dict
+import queue
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
+from urllib.parse import urlparse
 from sqlalchemy.orm import Session
 
-from app.crawler.sites.ewha_notice import fetch_notice_list, fetch_notice_detail
-from app.crawler.utils import make_url_key, body_checksum
-from app.repo.notice_repo import upsert_notice, bulk_insert_raw
+from app.core.config import (
+    CRAWL_CONCURRENCY_PER_HOST, CRAWL_DEADLINE_SEC, CRAWL_MAX_PAGES,
+    CRAWL_KNOWN_STOP_RUN, CRAWL_REVISIT_BUDGET, CRAWL_REVISIT_AFTER_HOURS,
+    RAW_ARCHIVE, CRAWL_NEAR_DUP, CRAWL_PARSE_WORKERS, CRAWL_QUEUE_SIZE, CRAWL_WRITE_BATCH,
+)
+from app.crawler import http_cache, http_client
+from app.crawler import parse_worker
+from app.crawler.sites.ewha_notice import fetch_notice_list, fetch_notice_html, list_page_url
+from app.crawler.utils import make_url_key
+from app.repo.notice_repo import upsert_notices, bulk_insert_raw, find_known_notices, touch_checked
+from app.services.raw_archive import archive_pages
+from app.services.notice_projection import project_notices
+from app.services.crawl_history import record_run
+from app.services.near_dup import load_index, assign_clusters
 
-def crawl_and_store(db: Session, list_url: str, limit: int = 50) -> Dict:
-    items = fetch_notice_list(list_url)[:limit]
+def _host(url: str) -> str:
+    return (urlparse(url).netloc or "").lower()
 
-    inserted = updated = skipped = errors = 0
-    raw_logs = []
+def _remaining(deadline_at: Optional[float]) -> Optional[float]:
+    if deadline_at is None:
+        return None
+    return max(deadline_at - time.monotonic(), 0.0)
+
+def _run_parallel(
+    tasks: Dict[Hashable, Tuple[str, Callable[[], Any]]],
+    per_host: int,
+    timeout_sec: Optional[float],
+    name: str,
+) -> Dict[Hashable, Any]:
+    """
+    tasks = {key: (host, fn)} 를 스레드 풀로 동시에 실행한다.
+    - 호스트별 세마포어로 동시 요청 수를 per_host 이하로 제한
+    - timeout_sec 안에 끝나지 않은 작업은 TimeoutError로 표시(대기하지 않고 반환)
+    반환: {key: fn 결과 | Exception}
+    """
+    if not tasks:
+        return {}
+    per_host = max(per_host, 1)
+    sems = {h: threading.BoundedSemaphore(per_host) for h, _ in tasks.values()}
+
+    def _one(host: str, fn: Callable[[], Any]) -> Any:
+        with sems[host]:
+            return fn()
+
+    workers = min(len(tasks), per_host * len(sems))
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=name)
+    futures = {pool.submit(_one, h, fn): key for key, (h, fn) in tasks.items()}
+    try:
+        done, _ = wait(futures, timeout=timeout_sec)
+    finally:
+        # 마감 초과분은 취소(이미 실행 중인 요청은 자체 timeout으로 끝남)
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    results: Dict[Hashable, Any] = {}
+    for fut, key in futures.items():
+        if fut not in done:
+            results[key] = TimeoutError(f"crawl deadline exceeded ({timeout_sec}s)")
+        elif fut.exception() is not None:
+            results[key] = fut.exception()
+        else:
+            results[key] = fut.result()
+    return results
+
+def _fetch_list_logged(
+    list_url: str, page: Optional[int], conditional: bool, log: Optional[List[Dict]],
+    deadline_at: Optional[float] = None,
+) -> List[Dict]:
+    """fetch_notice_list + URL별 측정값 기록(HTTP 상태/바이트/fetch 시간, 나머지는 파싱 시간)."""
+    t = time.perf_counter()
+    entry = {"url": list_page_url(list_url, page), "kind": "list", "outcome": "ok"}
+    try:
+        with http_client.deadline(deadline_at):
+            return fetch_notice_list(list_url, page=page, conditional=conditional)
+    except Exception as e:
+        entry.update(outcome="error", error=str(e))
+        raise
+    finally:
+        if log is not None:
+            info = http_client.last_fetch() or {}
+            total = (time.perf_counter() - t) * 1000
+            entry.update(http_status=info.get("status"), bytes=info.get("bytes"), fetch_ms=info.get("fetch_ms"))
+            if entry["outcome"] == "ok" and info.get("fetch_ms") is not None:
+                entry["parse_ms"] = max(total - info["fetch_ms"], 0.0)
+            log.append(entry)
+
+def _fetch_list_pages(
+    list_url: str, pages: List[int], per_host: int, timeout_sec: Optional[float], conditional: bool = False,
+    log: Optional[List[Dict]] = None,
+) -> Dict[int, Union[List[Dict], Exception]]:
+    host = _host(list_url)
+    deadline_at = time.monotonic() + timeout_sec if timeout_sec is not None else None
+    tasks = {
+        p: (host, lambda p=p: _fetch_list_logged(list_url, p, conditional, log, deadline_at))
+        for p in pages
+    }
+    return _run_parallel(tasks, per_host, timeout_sec, "crawl-list")
+
+def _collect_list_items(
+    db: Session,
+    list_url: str,
+    page_from: int,
+    page_to: Optional[int],
+    until_known: bool,
+    per_host: int,
+    deadline_at: Optional[float],
+    conditional: bool,
+    log: Optional[List[Dict]] = None,
+) -> Tuple[List[Dict], Dict[str, Dict], Dict]:
+    """
+    목록 여러 페이지를 병렬로 받아 페이지 순서대로 합치고 링크 기준으로 중복 제거.
+    - page_to까지(없으면 CRAWL_MAX_PAGES 한도) per_host개씩 묶어 동시에 요청
+    - 새 항목이 없는 페이지(게시판 끝, 마지막 페이지 반복)가 나오면 중단
+    - until_known이면 이미 아는 공지가 CRAWL_KNOWN_STOP_RUN건 연속 나온 지점에서 중단
+    반환: (합친 항목, until_known일 때 조회한 기존 공지 정보, 페이지 통계)
+    """
+    last = page_from + CRAWL_MAX_PAGES - 1
+    if page_to is not None:
+        last = min(last, page_to)
+
+    merged: List[Dict] = []
+    seen = set()
+    known: Dict[str, Dict] = {}
+    stats = {"pages_fetched": 0, "page_errors": 0, "page_urls": []}
+    run = 0
+    page = page_from
+    done = False
+    while not done and page <= last:
+        remaining = _remaining(deadline_at)
+        if remaining is not None and remaining <= 0:
+            break
+        batch = list(range(page, min(page + max(per_host, 1), last + 1)))
+        page = batch[-1] + 1
+        results = _fetch_list_pages(list_url, batch, per_host, remaining, conditional=conditional, log=log)
+
+        for p in batch:
+            res = results.get(p)
+            if isinstance(res, Exception) or res is None:
+                stats["page_errors"] += 1
+                print(f"[WARN] list page {p} failed for {list_url}: {res}")
+                continue
+            stats["pages_fetched"] += 1
+            stats["page_urls"].append(list_page_url(list_url, p))
+            fresh = [it for it in res if it["link"] not in seen]
+            if not fresh:
+                done = True
+                break
+            if until_known:
+                known.update(find_known_notices(
+                    db, [make_url_key(it["link"]) for it in fresh],
+                    stale_hours=CRAWL_REVISIT_AFTER_HOURS,
+                ))
+            for it in fresh:
+                seen.add(it["link"])
+                merged.append(it)
+                if until_known:
+                    run = run + 1 if make_url_key(it["link"]) in known else 0
+                    if CRAWL_KNOWN_STOP_RUN > 0 and run >= CRAWL_KNOWN_STOP_RUN:
+                        done = True
+                        break
+            if done:
+                break
+    return merged, known, stats
+
+def _select_incremental(
+    db: Session,
+    items: List[Dict],
+    stop_run: int,
+    revisit_budget: int,
+    known: Optional[Dict[str, Dict]] = None,
+) -> Tuple[List[Dict], int, bool]:
+    """
+    목록 항목 중 상세를 받아야 할 것만 고른다.
+    - app.notice에 없는 URL은 전부 선택
+    - 이미 아는 URL이 stop_run건 연속으로 나오면 그 뒤는 보지 않음(목록은 최신순)
+    - 아는 URL 중 오래된(stale) 것은 revisit_budget건까지 재방문
+    - known을 넘기면(목록 단계에서 이미 조회) 다시 조회하지 않음
+    반환: (선택된 항목(목록 순서 유지), 상세 요청을 생략한 항목 수, 중단 여부)
+    """
+    keys = [make_url_key(it["link"]) for it in items]
+    if known is None:
+        known = find_known_notices(db, keys, stale_hours=CRAWL_REVISIT_AFTER_HOURS)
+
+    picked: List[int] = []
+    stale: List[Tuple[object, int]] = []
+    run = 0
+    stopped = False
+    for i, key in enumerate(keys):
+        info = known.get(key)
+        if info is None:
+            picked.append(i)
+            run = 0
+            continue
+        if info["stale"]:
+            stale.append((info["checked_at"], i))
+        run += 1
+        if stop_run > 0 and run >= stop_run:
+            stopped = True
+            break
+
+    # 가장 오래 확인하지 않은 것부터 재방문
+    stale.sort(key=lambda x: x[0])
+    picked.extend(i for _, i in stale[:max(revisit_budget, 0)])
+    picked.sort()
+    return [items[i] for i in picked], len(items) - len(picked), stopped
+
+# ──────────────────────────────────────────────────────────────
+# 단계별 파이프라인: 상세 fetch(스레드) → 파싱/정규화(프로세스 풀) → DB 쓰기(메인 스레드)
+# 단계 사이는 크기 제한 큐로 연결해 뒤 단계가 밀리면 앞 단계가 기다림(backpressure)
+
+_DONE = object()
+_POLL_SEC = 0.2
 
+def _put(q: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    """큐가 차 있으면 기다리되 stop이 걸리면 포기(소비자가 죽었을 때 생산자 스레드가 영원히 막히지 않게)."""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=_POLL_SEC)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+def _get(q: queue.Queue, stop: threading.Event) -> Any:
+    """stop이 걸리면 _DONE."""
+    while not stop.is_set():
+        try:
+            return q.get(timeout=_POLL_SEC)
+        except queue.Empty:
+            continue
+    return _DONE
+
+def _drain(q: queue.Queue) -> None:
+    try:
+        while True:
+            q.get_nowait()
+    except queue.Empty:
+        pass
+
+class _Stage:
+    """단계별 처리 건수/작업 시간 합(busy)/첫 시작~마지막 종료(wall) 집계."""
+
+    def __init__(self):
+        self.items = 0
+        self.busy = 0.0
+        self.first: Optional[float] = None
+        self.last: Optional[float] = None
+        self.lock = threading.Lock()
+
+    def add(self, started: float, busy_sec: float, n: int = 1) -> None:
+        now = time.perf_counter()
+        with self.lock:
+            self.items += n
+            self.busy += busy_sec
+            self.first = started if self.first is None else min(self.first, started)
+            self.last = now if self.last is None else max(self.last, now)
+
+    def summary(self) -> Dict:
+        wall = (self.last - self.first) if self.first is not None and self.last is not None else 0.0
+        return {"items": self.items, "busy_ms": round(self.busy * 1000, 1), "wall_ms": round(wall * 1000, 1)}
+
+class _DepthQueue(queue.Queue):
+    """put 시점의 큐 길이를 기록(최대/평균 깊이 → 어느 단계가 병목인지)."""
+
+    def __init__(self, maxsize: int):
+        super().__init__(maxsize=maxsize)
+        self.samples = 0
+        self.depth_sum = 0
+        self.depth_max = 0
+
+    def put(self, item, block=True, timeout=None):
+        super().put(item, block, timeout)
+        depth = self.qsize()
+        self.samples += 1
+        self.depth_sum += depth
+        self.depth_max = max(self.depth_max, depth)
+
+    def summary(self) -> Dict:
+        mean = self.depth_sum / self.samples if self.samples else 0.0
+        return {"max": self.depth_max, "mean": round(mean, 1), "capacity": self.maxsize}
+
+def _fetch_stage(
+    items: List[Dict], per_host: int, deadline_at: Optional[float], conditional: bool,
+    out_q: _DepthQueue, stage: _Stage, log: Dict[str, Dict], stop: threading.Event,
+) -> None:
+    """
+    상세 HTML 동시 수집(호스트별 per_host개). 결과를 받는 즉시 out_q로 넘김.
+    out_q: (item, html | None(변경 없음) | Exception)
+    log: {url: URL별 측정값} — 이후 단계가 parse_ms/write_ms/outcome을 채움
+    요청마다 timeout/재시도는 남은 마감 시간 안으로 제한, stop이 걸리면 남은 요청은 보내지 않음.
+    """
+    per_host = max(per_host, 1)
+    sems: Dict[str, threading.BoundedSemaphore] = {}
     for it in items:
+        sems.setdefault(_host(it["link"]), threading.BoundedSemaphore(per_host))
+
+    def _one(it: Dict) -> None:
         url = it["link"]
-        try:
-            detail = fetch_notice_detail(url)
-
-            title = detail.get("title") or it.get("title") or ""
-            body  = detail.get("body") or ""
-            category = it.get("category")
-            posted_at = detail.get("posted_at") or it.get("posted_at")
-            url_key = make_url_key(url)
-            checksum = body_checksum(body, title)
-
-            row = {
-                "url": url,
-                "url_key": url_key,
-                "title": title,
-                "body": body,
-                "category": category,
-                "posted_at": posted_at,
-                "checksum": checksum
+        if stop.is_set():
+            return
+        with sems[_host(url)]:
+            if stop.is_set():
+                return
+            remaining = _remaining(deadline_at)
+            if remaining is not None and remaining <= 0:
+                log[url] = {"url": url, "kind": "detail"}
+                _put(out_q, (it, TimeoutError("crawl deadline exceeded")), stop)
+                return
+            t = time.perf_counter()
+            try:
+                with http_client.deadline(deadline_at):
+                    res: Union[str, None, Exception] = fetch_notice_html(url, conditional=conditional)
+            except Exception as e:
+                res = e
+            elapsed = time.perf_counter() - t
+            stage.add(t, elapsed)
+            info = http_client.last_fetch() or {}
+            log[url] = {
+                "url": url, "kind": "detail", "http_status": info.get("status"),
+                "bytes": info.get("bytes"), "fetch_ms": info.get("fetch_ms", elapsed * 1000),
             }
+        _put(out_q, (it, res), stop)
+
+    try:
+        if items:
+            workers = min(len(items), per_host * len(sems))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="crawl-fetch") as pool:
+                for f in [pool.submit(_one, it) for it in items]:
+                    f.result()
+    finally:
+        _put(out_q, _DONE, stop)
+
+def _parse_stage(
+    in_q: _DepthQueue, out_q: _DepthQueue, workers: int, stage: _Stage,
+    normalize: _Stage, pages: Optional[Dict[str, str]], stop: threading.Event,
+) -> None:
+    """
+    받은 HTML을 프로세스 풀에서 파싱 + 정규화/체크섬(순서 유지, 동시 진행은 workers*2건까지).
+    out_q: (item, {"row", "parse_ms", "normalize_ms"} | None | Exception)
+    pages가 있으면 원본 HTML을 아카이브용으로 모아 둠
+    """
+    pool = parse_worker.get_pool(workers)
+    inflight: deque = deque()
+    max_inflight = max(workers, 1) * 2
+
+    def _emit(it: Dict, t: float, fut) -> None:
+        try:
+            res = fut.result()
+        except BrokenProcessPool as e:
+            parse_worker.shutdown_pool()
+            res = e
+        except Exception as e:
+            res = e
+        if isinstance(res, dict):
+            stage.add(t, res["parse_ms"] / 1000)
+            normalize.add(t, res["normalize_ms"] / 1000)
+        _put(out_q, (it, res), stop)
+
+    try:
+        while True:
+            msg = _get(in_q, stop)
+            if msg is _DONE:
+                break
+            it, html = msg
+            if not isinstance(html, str):
+                _put(out_q, (it, html), stop)  # 변경 없음/오류는 그대로 전달
+                continue
+            if pages is not None:
+                pages[it["link"]] = html
+            t = time.perf_counter()
+            if pool is not None:
+                try:
+                    inflight.append((it, t, pool.submit(parse_worker.parse_detail_row, it["link"], html, it)))
+                except (BrokenProcessPool, RuntimeError) as e:
+                    # 풀이 깨졌으면 이번 실행의 나머지는 이 스레드에서 파싱
+                    print(f"[WARN] parse pool unavailable, parsing in thread: {e}")
+                    parse_worker.shutdown_pool()
+                    pool = None
+            if pool is None:
+                try:
+                    res = parse_worker.parse_detail_row(it["link"], html, it)
+                    stage.add(t, res["parse_ms"] / 1000)
+                    normalize.add(t, res["normalize_ms"] / 1000)
+                except Exception as e:
+                    res = e
+                _put(out_q, (it, res), stop)
+                continue
+            while len(inflight) >= max_inflight or (inflight and inflight[0][2].done()):
+                _emit(*inflight.popleft())
+        while inflight and not stop.is_set():
+            _emit(*inflight.popleft())
+    finally:
+        for _, _, fut in inflight:
+            fut.cancel()
+        _put(out_q, _DONE, stop)
+
+def _upsert_rows(db: Session, rows: List[Dict]) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    upsert_notices로 한 번에 쓰고, 실패하면 행 단위로 다시 시도해 문제 행만 골라냄.
+    savepoint를 쓰므로 실패한 행이 같은 트랜잭션의 다른 쓰기를 망가뜨리지 않음.
+    반환: ({url: "inserted"|"updated"|"unchanged"}, {url: 오류 메시지})
+    """
+    if not rows:
+        return {}, {}
+    try:
+        with db.begin_nested():
+            return upsert_notices(db, rows), {}
+    except Exception as e:
+        print(f"[WARN] batch upsert failed, retrying per row: {e}")
+
+    status: Dict[str, str] = {}
+    failed: Dict[str, str] = {}
+    for row in rows:
+        try:
+            with db.begin_nested():
+                status.update(upsert_notices(db, [row]))
+        except Exception as e:
+            failed[row["url"]] = str(e)
+    return status, failed
+
+def crawl_and_store(
+    db: Session,
+    list_url: str,
+    limit: Optional[int] = 50,
+    concurrency: Optional[int] = None,
+    deadline_sec: Optional[float] = None,
+    conditional: bool = True,
+    incremental: bool = False,
+    revisit_budget: Optional[int] = None,
+    page_from: Optional[int] = None,
+    page_to: Optional[int] = None,
+    until_known: bool = False,
+    trigger: str = "api",
+    worker_id: Optional[str] = None,
+) -> Dict:
+    """
+    목록 → 상세 fetch → 파싱/정규화 → 배치 upsert (단계별 스레드/프로세스가 큐로 이어져 동시에 진행).
+    - limit: 상세까지 처리할 목록 항목 수 상한(None이면 무제한)
+    - concurrency: 호스트당 동시 요청 수(기본 CRAWL_CONCURRENCY_PER_HOST, 1이면 순차)
+    - deadline_sec: 목록 요청을 포함한 전체 마감 시간(기본 CRAWL_DEADLINE_SEC, 0 이하면 무제한)
+    - conditional: ETag/Last-Modified/본문 해시로 변경 없는 페이지는 파싱·upsert 생략
+    - incremental: 이미 저장된 URL은 상세 요청 생략(오래된 것만 revisit_budget건 재방문)
+    - page_from/page_to: 목록 페이지 범위(백필). 둘 다 없으면 첫 페이지만
+    - until_known: 이미 아는 공지가 연속으로 나올 때까지 페이지를 넘김(incremental 포함)
+    - trigger/worker_id: 실행 이력(app.crawl_run)에 남길 실행 주체
+    """
+    started = time.monotonic()
+    started_at = datetime.now(timezone.utc)
+    per_host = concurrency if concurrency is not None else CRAWL_CONCURRENCY_PER_HOST
+    deadline = deadline_sec if deadline_sec is not None else CRAWL_DEADLINE_SEC
+    deadline_at = started + deadline if deadline and deadline > 0 else None
+
+    if conditional:
+        http_cache.warm(db)
+
+    known: Optional[Dict[str, Dict]] = None
+    page_stats: Optional[Dict] = None
+    list_log: List[Dict] = []
+    t_list = time.perf_counter()
+    if page_from is None and page_to is None and not until_known:
+        items = _fetch_list_logged(list_url, None, conditional, list_log, deadline_at)
+        list_urls = [list_url]
+    else:
+        incremental = incremental or until_known
+        items, known, page_stats = _collect_list_items(
+            db, list_url, page_from or 1, page_to, until_known, per_host, deadline_at, conditional,
+            log=list_log,
+        )
+        list_urls = page_stats.pop("page_urls")
+        if not until_known:
+            known = None
+    list_ms = (time.perf_counter() - t_list) * 1000
+    if limit is not None:
+        items = items[:limit]
+    found = len(items)
 
-            inserted_flag = upsert_notice(db, row)
-            if inserted_flag:
-                inserted += 1
-            else:
-                # 변경 감지는 upsert에서 처리됐으므로, 여기서는 일단 updated/skip 구분 생략.
-                # 필요하면 SELECT로 기존 checksum 비교해 세부 카운트 가능.
-                updated += 1  # 실무에선 updated/skip 분리 권장
-            raw_logs.append({"url": url, "status": "ok", "html": None, "error": None})
+    known_skipped = 0
+    stopped_early = False
+    if incremental:
+        budget = revisit_budget if revisit_budget is not None else CRAWL_REVISIT_BUDGET
+        items, known_skipped, stopped_early = _select_incremental(
+            db, items, CRAWL_KNOWN_STOP_RUN, budget, known=known,
+        )
 
+    # 근사 중복 클러스터 인덱스(없어도 크롤은 진행, cluster_id만 비워 둠)
+    dedup = None
+    if CRAWL_NEAR_DUP and items:
+        try:
+            dedup = load_index(db)
+        except Exception as e:
+            print(f"[WARN] near-duplicate index load failed: {e}")
+
+    # 상세 fetch → 파싱 → DB 쓰기를 큐로 이어 동시에 진행
+    pages: Optional[Dict[str, str]] = {} if RAW_ARCHIVE else None
+    fetch_log: Dict[str, Dict] = {}
+    fetch_q = _DepthQueue(max(CRAWL_QUEUE_SIZE, 1))
+    write_q = _DepthQueue(max(CRAWL_QUEUE_SIZE, 1))
+    st_fetch, st_parse, st_norm, st_write = _Stage(), _Stage(), _Stage(), _Stage()
+    stop = threading.Event()  # 쓰기 단계가 실패하면 앞 단계 스레드를 멈춤
+    threads = [
+        threading.Thread(
+            target=_fetch_stage, name="crawl-fetch-stage", daemon=True,
+            args=(items, per_host, deadline_at, conditional, fetch_q, st_fetch, fetch_log, stop),
+        ),
+        threading.Thread(
+            target=_parse_stage, name="crawl-parse-stage", daemon=True,
+            args=(fetch_q, write_q, CRAWL_PARSE_WORKERS, st_parse, st_norm, pages, stop),
+        ),
+    ]
+    for t in threads:
+        t.start()
+
+    inserted = updated = unchanged = skipped = errors = 0
+    raw_logs = []
+    log_by_url: Dict[str, Dict] = {}
+    status: Dict[str, str] = {}
+    failed: Dict[str, str] = {}
+    batch: List[Dict] = []
+    batches = clustered = 0
+    stored_urls = list(list_urls)
+    not_modified: List[str] = []
+
+    def _flush() -> None:
+        nonlocal batches, clustered
+        if not batch:
+            return
+        t = time.perf_counter()
+        if dedup is not None:
+            assign_clusters(dedup, batch)
+            clustered += sum(1 for row in batch if row.get("cluster_id") not in (None, row["url_key"]))
+        st, fl = _upsert_rows(db, batch)
+        status.update(st)
+        failed.update(fl)
+        elapsed = time.perf_counter() - t
+        st_write.add(t, elapsed, n=len(batch))
+        for row in batch:
+            fetch_log.setdefault(row["url"], {})["write_ms"] = elapsed * 1000 / len(batch)
+        batches += 1
+        batch.clear()
+
+    # DB 쓰기는 세션을 공유하므로 메인 스레드에서 배치 단위로 처리
+    # 여기서 예외가 나면 stop으로 앞 단계를 멈추고 큐를 비운 뒤 스레드를 회수(스레드/커넥션 누수 방지)
+    ok = False
+    try:
+        while True:
+            msg = write_q.get()
+            if msg is _DONE:
+                break
+            it, res = msg
+            url = it["link"]
+            entry = fetch_log.setdefault(url, {"url": url, "kind": "detail"})
+            if res is None:
+                # 304 또는 동일 본문: 파싱/upsert 생략
+                entry["outcome"] = "not_modified"
+                skipped += 1
+                not_modified.append(url)
+                raw_logs.append({"url": url, "status": "not_modified", "html": None, "error": None})
+                continue
+            if isinstance(res, Exception):
+                entry.update(outcome="error", error=str(res))
+                errors += 1
+                raw_logs.append({"url": url, "status": "error", "html": None, "error": str(res)})
+                continue
+            entry["parse_ms"] = res["parse_ms"] + res["normalize_ms"]
+            log = {"url": url, "status": "ok", "html": None, "error": None}
+            raw_logs.append(log)
+            log_by_url[url] = log
+            batch.append(res["row"])
+            if len(batch) >= max(CRAWL_WRITE_BATCH, 1):
+                _flush()
+        _flush()
+        ok = True
+    finally:
+        if not ok:
+            stop.set()
+            _drain(write_q)
+            _drain(fetch_q)
+        for t in threads:
+            t.join()
+    # 변경 없음도 확인은 한 것이므로 checked_at 갱신(재방문 예산이 같은 오래된 행에만 쓰이지 않게)
+    if not_modified:
+        try:
+            with db.begin_nested():
+                touch_checked(db, not_modified)
         except Exception as e:
+            print(f"[WARN] checked_at touch failed: {e}")
+
+    for url, log in log_by_url.items():
+        st = status.get(url)
+        if st is None:
             errors += 1
-            raw_logs.append({"url": url, "status": "error", "html": None, "error": str(e)})
+            log.update(status="error", error=failed.get(url, "upsert failed"))
+            fetch_log[url].update(outcome="error", error=log["error"])
+            continue
+        fetch_log[url]["outcome"] = st
+        if st == "inserted":
+            inserted += 1
+        elif st == "updated":
+            updated += 1
+        else:
+            unchanged += 1
+        stored_urls.append(url)
 
+    if pages:
+        try:
+            # 아카이브 실패가 이번 upsert까지 되돌리지 않도록 savepoint 안에서 저장
+            with db.begin_nested():
+                blob_hashes = archive_pages(db, pages)
+            for r in raw_logs:
+                r["blob_hash"] = blob_hashes.get(r["url"])
+        except Exception as e:
+            print(f"[WARN] raw archive failed: {e}")
+    # 읽기 모델(notices) 반영: 이번에 저장된 공지 중 읽기 모델과 다른 것만 upsert
+    projected = {"inserted": 0, "updated": 0}
+    keys = [make_url_key(u) for u, st in status.items()]
+    try:
+        with db.begin_nested():
+            projected = project_notices(db, url_keys=keys)
+    except Exception as e:
+        print(f"[WARN] notice projection failed: {e}")
     bulk_insert_raw(db, raw_logs)
-    db.commit()
+    if conditional:
+        # upsert까지 성공한 URL만 검증자 확정(실패분은 다음 실행에서 다시 받음)
+        http_cache.confirm(stored_urls)
+        stored = set(stored_urls)
+        http_cache.discard(it["link"] for it in items if it["link"] not in stored)
+        http_cache.flush(db)
+
+    result = {
+        "found": found, "inserted": inserted, "updated": updated, "unchanged": unchanged,
+        "updated_or_skipped": updated + unchanged,  # 이전 응답 형식 호환
+        "not_modified": skipped, "errors": errors,
+        "projected": projected["inserted"] + projected["updated"],
+    }
+    if dedup is not None:
+        result["near_dup"] = {"indexed": len(dedup), "clustered": clustered}
+    result["stages"] = {
+        "list": {"pages": len(list_urls), "wall_ms": round(list_ms, 1)},
+        "fetch": st_fetch.summary(),
+        "parse": {**st_parse.summary(), "workers": CRAWL_PARSE_WORKERS},
+        "normalize": st_norm.summary(),
+        "write": {**st_write.summary(), "batches": batches},
+        "queues": {"fetch_to_parse": fetch_q.summary(), "parse_to_write": write_q.summary()},
+        "total_ms": round((time.monotonic() - started) * 1000, 1),
+    }
+    if page_stats is not None:
+        result.update(page_stats)
+    if incremental:
+        result.update({"known_skipped": known_skipped, "stopped_early": stopped_early})
 
-    # updated에서 진짜 변경만 카운트하고 싶다면, 별도 SELECT 비교 로직 추가 가능.
-    return {"found": len(items), "inserted": inserted, "updated_or_skipped": updated, "errors": errors}
+    # 실행 이력 + URL별 측정값(같은 트랜잭션, 실패해도 크롤 결과는 유지)
+    try:
+        with db.begin_nested():
+            result["run_id"] = record_run(
+                db, list_url, result, list_log + list(fetch_log.values()),
+                started_at=started_at, trigger=trigger, worker_id=worker_id,
+            )
+    except Exception as e:
+        print(f"[WARN] crawl run history save failed: {e}")
+    db.commit()
+    return result
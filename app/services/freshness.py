@@ -0,0 +1,170 @@
+# app/services/freshness.py
+"""
+채팅 요청 경로의 공지 신선도 관리(stale-while-revalidate).
+
+- 채팅은 항상 읽기 모델(notices)에 있는 것으로 바로 답함(요청 중에 크롤하지 않음)
+- 시드의 마지막 성공 크롤(app.crawl_run)이 허용 나이보다 오래됐으면 백그라운드 갱신을 예약
+  - 허용 나이 = max(CHAT_FRESHNESS_MIN, 시드의 예정 크롤 주기) × 1.5
+    (예정 주기 = CRAWL_INTERVAL_MIN, CRAWL_ADAPTIVE면 시드별 적응형 계획)
+  - 스케줄 크롤이 제때 돌고 있으면 채팅 트래픽이 크롤을 더 자주 일으키지 않음(적응형 주기 유지),
+    스케줄이 밀리거나 실패했을 때만 채팅이 갱신을 앞당김
+  - 프로세스 안: 갱신 스레드 1개 + 진행 중이면 새로 예약하지 않음(동시 요청이 몰려도 1번)
+  - 시드마다 스케줄 크롤과 같은 락(leader.seed_lock)을 비차단으로 잡고, 잡은 뒤 신선도를 다시 확인
+    → 다른 프로세스/스레드가 그 시드를 크롤 중이면 건너뜀(시드당 크롤은 언제나 1개)
+  - 크롤 중인 시드는 오래됐어도 stale로 보지 않음
+- 신선도 조회 자체도 CHAT_FRESHNESS_CHECK_SEC에 1번만(요청마다 DB 왕복하지 않음)
+- 갱신이 실패하면 CHAT_FRESHNESS_MIN 동안 다시 예약하지 않음(사이트 장애 때 요청마다 재시도 방지)
+- CRAWL_JOB_MODE=external이면 API 프로세스는 크롤하지 않음(워커 담당), 상태만 보여줌
+"""
+from __future__ import annotations
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import (
+    CHAT_FRESHNESS_MIN, CHAT_FRESHNESS_CHECK_SEC, CRAWL_SEEDS, CRAWL_INCREMENTAL, CRAWL_JOB_MODE,
+    CRAWL_INTERVAL_MIN, CRAWL_ADAPTIVE,
+)
+from app.database import SessionLocal
+from app.repo.crawl_run_repo import last_success
+from app.schedule.adaptive import plan_seed
+from app.schedule.leader import crawling_seeds, seed_lock
+from app.services.crawl_pipeline import crawl_and_store
+
+REFRESH_LIMIT = 30
+_GRACE = 1.5  # 예정 주기 대비 여유(크롤 소요 시간/스케줄 지터로 주기 끝마다 stale이 되지 않게)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+_pending: Optional[Future] = None
+_checked_mono = 0.0
+_retry_after_mono = 0.0
+_state: Dict = {"stale": [], "max_age_min": {}, "checked_at": None}
+_last_refresh: Dict = {}
+
+def seed_max_ages(db: Session, seeds: List[str]) -> Dict[str, int]:
+    """시드별 허용 나이(분)."""
+    ages: Dict[str, int] = {}
+    for url in seeds:
+        interval = CRAWL_INTERVAL_MIN
+        if CRAWL_ADAPTIVE:
+            try:
+                interval = plan_seed(db, url)["interval_min"]
+            except Exception as e:
+                print(f"[WARN] freshness plan failed for {url}: {e}")
+        ages[url] = int(max(CHAT_FRESHNESS_MIN, interval) * _GRACE)
+    return ages
+
+def _aged_seeds(db: Session, seeds: List[str], ages: Optional[Dict[str, int]] = None) -> List[str]:
+    """마지막 성공 크롤이 허용 나이보다 오래됐거나 이력이 없는 시드."""
+    ages = ages if ages is not None else seed_max_ages(db, seeds)
+    last = last_success(db, seeds)
+    now = datetime.now(timezone.utc)
+    return [url for url in seeds if last.get(url) is None or last[url] < now - timedelta(minutes=ages[url])]
+
+def stale_seeds(db: Session, ages: Optional[Dict[str, int]] = None) -> List[str]:
+    """오래된 시드 중 지금 크롤 중이 아닌 것(크롤 중이면 곧 갱신되므로 제외)."""
+    aged = _aged_seeds(db, CRAWL_SEEDS, ages)
+    if not aged:
+        return []
+    busy = crawling_seeds(db, aged)
+    return [url for url in aged if url not in busy]
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chat-refresh")
+    return _executor
+
+def _refresh() -> None:
+    global _retry_after_mono
+    try:
+        ok = _refresh_locked()
+    except Exception as e:
+        print(f"[WARN] chat refresh failed: {e}")
+        _last_refresh.update(finished_at=datetime.now(timezone.utc).isoformat(), error=str(e))
+        ok = False
+    if not ok:
+        _retry_after_mono = time.monotonic() + CHAT_FRESHNESS_MIN * 60
+
+def _refresh_locked() -> bool:
+    """시드별 크롤 락을 잡은 시드만, 잡은 뒤에도 아직 오래됐으면 크롤. 실패한 시드가 있으면 False."""
+    started = datetime.now(timezone.utc)
+    results: List[Dict] = []
+    db = SessionLocal()
+    try:
+        for url in stale_seeds(db):
+            with seed_lock(url) as got:
+                if not got:
+                    results.append({"url": url, "skipped": "crawl in progress"})
+                    continue
+                if not _aged_seeds(db, [url]):
+                    results.append({"url": url, "skipped": "refreshed elsewhere"})
+                    continue
+                try:
+                    r = crawl_and_store(db, url, limit=REFRESH_LIMIT, incremental=CRAWL_INCREMENTAL, trigger="chat")
+                    results.append({"url": url, "found": r.get("found"), "inserted": r.get("inserted"),
+                                    "updated": r.get("updated"), "errors": r.get("errors")})
+                except Exception as e:
+                    db.rollback()
+                    print(f"[WARN] chat refresh crawl failed for {url}: {e}")
+                    results.append({"url": url, "error": str(e)})
+    finally:
+        db.close()
+    _last_refresh.update(
+        started_at=started.isoformat(), finished_at=datetime.now(timezone.utc).isoformat(),
+        error=None, results=results,
+    )
+    return not any("error" in r for r in results)
+
+def schedule_refresh() -> bool:
+    """갱신 예약. 이미 예약/진행 중이면 False(동시 요청 중복 제거)."""
+    global _pending
+    if CRAWL_JOB_MODE == "external" or time.monotonic() < _retry_after_mono:
+        return False
+    with _lock:
+        if _pending is not None and not _pending.done():
+            return False
+        _pending = _get_executor().submit(_refresh)
+        return True
+
+def ensure_fresh(db: Session) -> Dict:
+    """
+    채팅 요청에서 호출(블로킹 없음, 최악의 경우 CHECK_SEC마다 가벼운 조회 1번).
+    반환: {"stale": [오래된 시드], "refreshing": bool, "checked_at"}
+    """
+    global _checked_mono, _state
+    if CHAT_FRESHNESS_MIN <= 0:
+        return {"stale": [], "refreshing": False, "checked_at": None}
+    now = time.monotonic()
+    if now - _checked_mono >= CHAT_FRESHNESS_CHECK_SEC:
+        _checked_mono = now
+        ages: Dict[str, int] = {}
+        try:
+            ages = seed_max_ages(db, CRAWL_SEEDS)
+            stale = stale_seeds(db, ages)
+        except Exception as e:
+            print(f"[WARN] freshness check failed: {e}")
+            stale = []
+        _state = {"stale": stale, "max_age_min": ages, "checked_at": datetime.now(timezone.utc).isoformat()}
+        if stale:
+            schedule_refresh()
+    return {**_state, "refreshing": _pending is not None and not _pending.done()}
+
+def status() -> Dict:
+    return {
+        "floor_min": CHAT_FRESHNESS_MIN,
+        **_state,  # max_age_min: 시드별 허용 나이(분)
+        "refreshing": _pending is not None and not _pending.done(),
+        "last_refresh": dict(_last_refresh) or None,
+    }
+
+def shutdown() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
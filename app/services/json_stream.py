@@ -0,0 +1,142 @@
+# app/services/json_stream.py
+"""
+LLM이 토큰 단위로 내보내는 JSON 객체에서 지정한 문자열 필드 값을 도착하는 대로 꺼냄.
+
+    s = JsonFieldStream(("title", "link", "summary"))
+    for tok in tokens:
+        for field, delta in s.feed(tok):   # ("summary", "이번 학기 ") ...
+            ...
+
+- 최상위 객체의 "키": "문자열" 만 스트리밍(이스케이프/\\uXXXX/서로게이트 쌍 처리)
+- 문자열이 아닌 값(null, 숫자, 중첩 객체)은 건너뜀 → 최종 값은 완성된 JSON을 다시 파싱해 확정
+"""
+from __future__ import annotations
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+class JsonFieldStream:
+    def __init__(self, fields: Iterable[str]):
+        self.fields = set(fields)
+        self.values: Dict[str, str] = {}
+        self._state = "start"
+        self._depth = 0          # 최상위 객체 = 1
+        self._key = ""
+        self._field: Optional[str] = None
+        self._in_str = False     # 건너뛰는 값 안의 문자열
+        self._skip_esc = False
+        self._esc = False
+        self._hex = ""
+        self._high: Optional[int] = None  # 서로게이트 쌍 앞부분
+
+    def feed(self, chunk: str) -> List[Tuple[str, str]]:
+        out: List[Tuple[str, str]] = []
+        buf: List[str] = []
+        for ch in chunk:
+            self._step(ch, buf)
+            if buf and self._state != "value_str":
+                self._emit(buf, out)
+        if buf:
+            self._emit(buf, out)
+        return out
+
+    def _emit(self, buf: List[str], out: List[Tuple[str, str]]) -> None:
+        delta = "".join(buf)
+        buf.clear()
+        if self._field is None or not delta:
+            return
+        self.values[self._field] = self.values.get(self._field, "") + delta
+        out.append((self._field, delta))
+
+    def _step(self, ch: str, buf: List[str]) -> None:
+        st = self._state
+        if st == "start":
+            if ch == "{":
+                self._depth, self._state = 1, "member"
+        elif st == "member":
+            if ch == '"':
+                self._key, self._state = "", "key"
+            elif ch == "}":
+                self._state = "end"
+        elif st == "key":
+            if self._esc:
+                self._key += _ESCAPES.get(ch, ch)
+                self._esc = False
+            elif ch == "\\":
+                self._esc = True
+            elif ch == '"':
+                self._state = "colon"
+            else:
+                self._key += ch
+        elif st == "colon":
+            if ch == ":":
+                self._state = "value"
+        elif st == "value":
+            if ch.isspace():
+                return
+            if ch == '"':
+                self._field = self._key if self._key in self.fields else None
+                if self._field is not None:
+                    self.values.setdefault(self._field, "")
+                self._state = "value_str"
+            else:
+                self._field = None
+                self._state = "skip"
+                self._skip(ch)
+        elif st == "value_str":
+            self._string_char(ch, buf)
+        elif st == "after":
+            if ch == ",":
+                self._state = "member"
+            elif ch == "}":
+                self._state = "end"
+        elif st == "skip":
+            self._skip(ch)
+
+    def _string_char(self, ch: str, buf: List[str]) -> None:
+        if self._hex or (self._esc and ch == "u"):
+            if self._esc:
+                self._esc, self._hex = False, "u"
+                return
+            self._hex += ch
+            if len(self._hex) == 5:
+                code = int(self._hex[1:], 16)
+                self._hex = ""
+                if 0xD800 <= code < 0xDC00:
+                    self._high = code
+                    return
+                if 0xDC00 <= code < 0xE000 and self._high is not None:
+                    code = 0x10000 + ((self._high - 0xD800) << 10) + (code - 0xDC00)
+                self._high = None
+                buf.append(chr(code))
+            return
+        if self._esc:
+            self._esc = False
+            buf.append(_ESCAPES.get(ch, ch))
+        elif ch == "\\":
+            self._esc = True
+        elif ch == '"':
+            self._state = "after"
+        else:
+            buf.append(ch)
+
+    def _skip(self, ch: str) -> None:
+        # 문자열이 아닌 값: 중첩 괄호/문자열을 따라가며 최상위의 , 또는 } 까지 건너뜀
+        if self._in_str:
+            if self._skip_esc:
+                self._skip_esc = False
+            elif ch == "\\":
+                self._skip_esc = True
+            elif ch == '"':
+                self._in_str = False
+            return
+        if ch == '"':
+            self._in_str = True
+        elif ch in "{[":
+            self._depth += 1
+        elif ch in "}]":
+            self._depth -= 1
+            if self._depth == 0:
+                self._state = "end"
+        elif ch == "," and self._depth == 1:
+            self._state = "member"
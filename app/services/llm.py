@@ -1,16 +1,19 @@
 # app/services/llm.py
 from __future__ import annotations
 
+import asyncio
 import json
 import os
-from typing import Optional, Dict, List
+from typing import Any, AsyncIterator, Optional, Dict, List, Tuple
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from sqlalchemy.orm import Session
 from app.core import config
-from app.database import SessionLocal
+from app.database import AsyncDB, SessionLocal
+from app.crud.notice import collapse_duplicates
 from app.models.models import Notice
-from app.services.crawl_pipeline import crawl_and_store  # ✅ 파이프라인 사용
+from app.services.freshness import ensure_fresh
+from app.services.json_stream import JsonFieldStream
 
 
 def _get_system_prompt() -> str:
@@ -25,6 +28,8 @@ if not config.OPENAI_API_KEY:
     raise RuntimeError("[LLM] OPENAI_API_KEY가 비어 있습니다. .env에 OPENAI_API_KEY를 설정하세요.")
 
 _client = OpenAI(api_key=config.OPENAI_API_KEY)
+# 비동기 경로: 요청 단위 제한 시간, 재시도는 1번(재시도까지 포함해 wait_for로 다시 제한)
+_async_client = AsyncOpenAI(api_key=config.OPENAI_API_KEY, timeout=config.CHAT_LLM_TIMEOUT_SEC, max_retries=1)
 _MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
 _TEMPERATURE = float(os.getenv("OPENAI_TEMPERATURE", "0.2"))
 _SYSTEM = _get_system_prompt()
@@ -42,12 +47,14 @@ def _parse_json(content: str) -> Dict[str, Optional[str]]:
 
 
 def _recent_notices(db: Session, limit: int = 3) -> List[Notice]:
-    return (
+    # 여러 게시판에 다시 올라온 같은 공지는 1건만(프롬프트에 중복이 들어가지 않게 넉넉히 읽고 접음)
+    rows = (
         db.query(Notice)
         .order_by(Notice.date.desc().nullslast(), Notice.created_at.desc())
-        .limit(limit)
+        .limit(limit * 4)
         .all()
     )
+    return collapse_duplicates(rows, limit)
 
 
 def _notice_context_from_list(rows: List[Notice]) -> str:
@@ -60,34 +67,21 @@ def _notice_context_from_list(rows: List[Notice]) -> str:
     return "\n".join(lines)
 
 
-def _crawl_refresh(db: Session, limit: int = 30) -> None:
-    seeds = getattr(config, "CRAWL_SEEDS", None) or [
-        "https://www.ewha.ac.kr/ewha/news/notice.do"
-    ]
-    for url in seeds:
-        try:
-            crawl_and_store(db, url, limit=limit)
-        except Exception as e:
-            print(f"[WARN] crawl failed for {url}: {e}")
-
+def _prepare_context(db: Session) -> Tuple[str, Optional[str]]:
+    """(최근 공지 요약, 대표 링크). 요청 중엔 크롤하지 않음: 오래됐으면 백그라운드 갱신만 예약하고 지금 데이터로 답함"""
+    ensure_fresh(db)
+    recent = _recent_notices(db, limit=3)
+    return _notice_context_from_list(recent), (recent[0].url if recent else None)
 
-def gpt_answer(question: str, context: Optional[str] = None) -> Dict[str, Optional[str]]:
-    db = SessionLocal()
-    try:
-        _crawl_refresh(db, limit=30)
-        recent = _recent_notices(db, limit=3)
-        notice_ctx = _notice_context_from_list(recent)
-        top_link = recent[0].url if recent else None
-    finally:
-        db.close()
 
+def _build_messages(question: str, notice_ctx: str, context: Optional[str]) -> List[Dict[str, str]]:
     user_content = f"질문: {question}"
     if notice_ctx:
         user_content += f"\n\n최근 공지사항 요약:\n{notice_ctx}"
     if context:
         user_content += f"\n\n추가컨텍스트:\n{context}"
 
-    messages = [
+    return [
         {"role": "system", "content": _SYSTEM},
         {"role": "user", "content": user_content},
         {
@@ -96,13 +90,68 @@ def gpt_answer(question: str, context: Optional[str] = None) -> Dict[str, Option
         },
     ]
 
+
+def _finish(content: str, top_link: Optional[str]) -> Dict[str, Optional[str]]:
+    result = _parse_json(content or "")
+    if not result.get("link") and top_link:
+        result["link"] = top_link
+    return result
+
+
+def gpt_answer(question: str, context: Optional[str] = None) -> Dict[str, Optional[str]]:
+    db = SessionLocal()
+    try:
+        notice_ctx, top_link = _prepare_context(db)
+    finally:
+        db.close()
+
     resp = _client.chat.completions.create(
         model=_MODEL,
-        messages=messages,
+        messages=_build_messages(question, notice_ctx, context),
         response_format={"type": "json_object"},
         temperature=_TEMPERATURE,
     )
-    result = _parse_json(resp.choices[0].message.content or "")
-    if not result.get("link") and top_link:
-        result["link"] = top_link
-    return result
+    return _finish(resp.choices[0].message.content, top_link)
+
+
+async def gpt_stream_async(
+    db: AsyncDB, question: str, context: Optional[str] = None,
+) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    gpt_answer의 비동기 스트리밍 버전(/api/chat, /api/chat/stream 공용, chat_flight가 호출).
+    DB는 AsyncDB, LLM은 AsyncOpenAI → 기다리는 동안 스레드를 잡지 않음.
+    모델 토큰이 오는 대로 JSON 필드 조각을 내보냄.
+    yield ("field", (필드명, 조각)) ... 마지막에 ("done", {"title", "link", "summary"})
+    생성 전체를 CHAT_LLM_TIMEOUT_SEC로 제한(초과 시 asyncio.TimeoutError).
+    """
+    notice_ctx, top_link = await db.call(_prepare_context)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + config.CHAT_LLM_TIMEOUT_SEC
+    stream = await asyncio.wait_for(
+        _async_client.chat.completions.create(
+            model=_MODEL,
+            messages=_build_messages(question, notice_ctx, context),
+            response_format={"type": "json_object"},
+            temperature=_TEMPERATURE,
+            stream=True,
+        ),
+        timeout=config.CHAT_LLM_TIMEOUT_SEC,
+    )
+    parser = JsonFieldStream(("title", "link", "summary"))
+    parts: List[str] = []
+    chunks = stream.__aiter__()
+    try:
+        while True:
+            try:
+                chunk = await asyncio.wait_for(chunks.__anext__(), timeout=max(deadline - loop.time(), 0.001))
+            except StopAsyncIteration:
+                break
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if not delta:
+                continue
+            parts.append(delta)
+            for field, piece in parser.feed(delta):
+                yield "field", (field, piece)
+    finally:
+        await stream.close()
+    yield "done", _finish("".join(parts), top_link)
@@ -0,0 +1,52 @@
+# app/services/near_dup.py
+"""
+근사 중복 공지 클러스터링(적재 시점에 cluster_id 부여).
+
+- load_index: app.notice의 지문으로 인메모리 LSH 인덱스를 만듦(크롤 1회마다 1번, 수만 건도 수십 ms)
+- assign_clusters: upsert 직전 행마다 cluster_id 결정(같은 실행 안에서 먼저 들어온 공지와도 묶임)
+- backfill: 지문이 없는 기존 공지를 채움(마이그레이션 직후 1회)
+"""
+from __future__ import annotations
+from typing import Dict, List
+
+from sqlalchemy.orm import Session
+
+from app.core.config import CRAWL_NEAR_DUP_DISTANCE
+from app.crawler.simhash import SimHashIndex, simhash, to_signed, to_unsigned
+from app.repo.notice_repo import load_simhashes, notices_without_simhash, save_clusters
+
+BACKFILL_BATCH = 500
+
+def load_index(db: Session) -> SimHashIndex:
+    index = SimHashIndex(CRAWL_NEAR_DUP_DISTANCE)
+    for r in load_simhashes(db):
+        index.add(r["url_key"], to_unsigned(r["simhash"]), r["cluster_id"] or r["url_key"])
+    return index
+
+def assign_clusters(index: SimHashIndex, rows: List[Dict]) -> None:
+    """rows의 simhash(부호 있는 값)로 row["cluster_id"]를 채움(지문이 없으면 그대로 둠)."""
+    for row in rows:
+        h = row.get("simhash")
+        if h is not None:
+            row["cluster_id"] = index.assign(row["url_key"], to_unsigned(h))
+
+def backfill(db: Session, batch_size: int = BACKFILL_BATCH) -> Dict[str, int]:
+    """반환: {"fingerprinted": n, "clustered": 다른 공지와 묶인 수}. 배치마다 커밋."""
+    index = load_index(db)
+    total = {"fingerprinted": 0, "clustered": 0}
+    after_id = 0
+    while True:
+        rows = notices_without_simhash(db, after_id=after_id, limit=batch_size)
+        if not rows:
+            return total
+        out = []
+        for r in rows:
+            h = simhash(r["title"], r["body"])
+            if h is None:
+                continue
+            cluster = index.assign(r["url_key"], h)
+            out.append({"url_key": r["url_key"], "simhash": to_signed(h), "cluster_id": cluster})
+            total["clustered"] += cluster != r["url_key"]
+        total["fingerprinted"] += save_clusters(db, out)
+        db.commit()
+        after_id = rows[-1]["id"]
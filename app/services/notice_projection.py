@@ -0,0 +1,52 @@
+# app/services/notice_projection.py
+"""
+크롤러 테이블(app.notice) → 읽기 모델(notices, ORM Notice) projection.
+
+- 새로 생겼거나 checksum/카테고리/게시일/근사 중복 클러스터가 바뀐 공지만 upsert(나머지는 건드리지 않음)
+- target_grade / target_major / target_student_number는 이때 텍스트에서 한 번만 추출
+- crawl_and_store가 실행마다 바뀐 url_key만 넘겨 호출하고,
+  url_keys 없이 호출하면 전체를 훑어 밀린 것을 따라잡음(초기 적재/장애 복구)
+"""
+from __future__ import annotations
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import TIMEZONE
+from app.crawler.targets import extract_targets
+from app.repo.read_model_repo import pending_projection, upsert_read_notices
+
+PROJECTION_BATCH = 500
+
+def _to_read_row(n: Dict) -> Dict:
+    return {
+        "source_key": n["url_key"],
+        "source_checksum": n["checksum"],
+        "url": n["url"],
+        "title": n["title"],
+        "content": n["body"],
+        "category": n["category"],
+        "posted_at": n["posted_at"],
+        "cluster_id": n["cluster_id"],
+        **extract_targets(n["title"], n["body"], n["url"]),
+    }
+
+def project_notices(
+    db: Session, url_keys: Optional[List[str]] = None, batch_size: int = PROJECTION_BATCH,
+) -> Dict[str, int]:
+    """
+    반환: {"inserted": n, "updated": n}
+    커밋은 호출자 몫(crawl_and_store는 같은 트랜잭션에서 함께 커밋)
+    """
+    total = {"inserted": 0, "updated": 0}
+    if url_keys is not None and not url_keys:
+        return total
+    after = ""
+    while True:
+        pending = pending_projection(db, TIMEZONE, url_keys=url_keys, after=after, limit=batch_size)
+        if not pending:
+            return total
+        res = upsert_read_notices(db, [_to_read_row(n) for n in pending], TIMEZONE)
+        total["inserted"] += res["inserted"]
+        total["updated"] += res["updated"]
+        after = pending[-1]["url_key"]
@@ -0,0 +1,63 @@
+# app/services/raw_archive.py
+"""
+원본 HTML 아카이브 저장/조회/재파싱.
+
+- archive_pages: 크롤 1회분 {url: html}을 내용 해시로 묶어, DB에 없는 blob만 압축해 저장
+- load_html / iter_latest_html: 저장된 본문을 다시 꺼냄(재크롤 없이 새 파서로 재처리)
+- reparse: 최신 아카이브를 현재 parse_notice_detail로 다시 파싱
+"""
+from __future__ import annotations
+from typing import Dict, Iterator, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.crawler import raw_archive
+from app.crawler.sites.ewha_notice import parse_notice_detail
+from app.repo.raw_archive_repo import existing_hashes, save_blobs, latest_raw, latest_raw_page
+
+def archive_pages(db: Session, pages: Dict[str, str]) -> Dict[str, str]:
+    """
+    pages = {url: html}
+    반환: {url: blob_hash} → notice_raw.blob_hash로 기록
+    같은 실행 안에서나 이전 실행과 본문이 같으면 압축/저장을 생략하고 기존 blob을 참조
+    """
+    if not pages:
+        return {}
+    hashes = {url: raw_archive.content_hash(html) for url, html in pages.items()}
+    have = existing_hashes(db, hashes.values())
+
+    blobs: Dict[str, Dict] = {}
+    for url, h in hashes.items():
+        if h in have or h in blobs:
+            continue
+        blobs[h] = raw_archive.pack(pages[url])
+    save_blobs(db, list(blobs.values()))
+    return hashes
+
+def load_html(db: Session, url: str, before_id: Optional[int] = None) -> Optional[Dict]:
+    """url의 최신(또는 before_id 이전) 아카이브 → {id, url, fetched_at, blob_hash, html}"""
+    row = latest_raw(db, url, before_id=before_id)
+    if row is None:
+        return None
+    return {
+        "id": row["id"], "url": row["url"], "fetched_at": row["fetched_at"],
+        "blob_hash": row["blob_hash"], "html": raw_archive.unpack(row),
+    }
+
+def iter_latest_html(db: Session, batch_size: int = 200) -> Iterator[Tuple[str, str]]:
+    """아카이브된 모든 URL의 최신 본문을 (url, html)로 순회(배치 단위로 조회)."""
+    after = ""
+    while True:
+        rows = latest_raw_page(db, after_url=after, limit=batch_size)
+        if not rows:
+            return
+        for r in rows:
+            yield r["url"], raw_archive.unpack(r)
+        after = rows[-1]["url"]
+
+def reparse(db: Session, url: str, before_id: Optional[int] = None) -> Optional[Dict]:
+    arc = load_html(db, url, before_id=before_id)
+    if arc is None:
+        return None
+    parsed = parse_notice_detail(arc["html"], url)
+    return {"id": arc["id"], "fetched_at": arc["fetched_at"], "blob_hash": arc["blob_hash"], "parsed": parsed}
@@ -0,0 +1,283 @@
+# app/services/semantic_cache.py
+"""
+의미 기반 답 캐시(gpt_search_cache 위의 한 단계).
+
+정확히 같은 질문(lower/btrim)만 적중하던 캐시를 "수강신청 언제야?" / "수강 신청 기간 알려줘" 같은
+표현 차이까지 적중하도록 확장.
+
+- 키 문자열: 문장 끝 어미/요청 표현을 떼고, 같은 뜻의 질문어를 하나로 모은 뒤(언제/기간/일정/날짜… → 언제,
+  어떻게/방법/절차 → 방법) 공백/문장부호를 뺌
+- 벡터: 키 문자열의 글자 2·3-gram을 해시 버킷(DIM)에 모은 TF-IDF(로그 TF, L2 정규화), 희소 표현
+  (한국어는 띄어쓰기/조사 변형이 잦아 글자 n-gram이 단어보다 안정, 외부 모델/네트워크 불필요)
+- 인덱스: 버킷별 posting 목록(버킷 정렬된 행 번호/가중치 배열). 검색은 질문의 버킷 posting만 모아
+  np.bincount 1번 → 코사인 top-k. 빌드 후 바뀌지 않으므로 락 없이 검색
+- 적중 조건: 유사도 CHAT_SEMANTIC_THRESHOLD 이상 + 질문 속 숫자가 같음("1학기"/"2학기" 오답 방지)
+- 최근 CHAT_SEMANTIC_MAX_ENTRIES개를 DB에서 읽어 빌드, CHAT_SEMANTIC_RELOAD_SEC마다 다시 빌드
+  (다른 워커가 저장한 항목 반영, IDF 재계산)
+  - 빌드는 전용 스레드 1개에서 자기 세션으로(요청 경로/이벤트 루프는 기다리지 않음, 그동안은 기존 인덱스로 답함)
+  - 실패하면 5초부터 2배씩(최대 RELOAD_SEC) 물러났다가 다시 시도
+- 이 워커가 저장한 답은 다음 빌드 전까지 _recent에 두고 검색 때 함께 비교
+- numpy가 없으면 비활성(정확히 같은 질문만 적중)
+"""
+from __future__ import annotations
+import math
+import re
+import time
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config import (
+    CHAT_SEMANTIC_CACHE, CHAT_SEMANTIC_THRESHOLD, CHAT_SEMANTIC_MAX_ENTRIES, CHAT_SEMANTIC_RELOAD_SEC,
+)
+from app.crawler.utils import normalize_text
+from app.crud.cache import get_cache_by_id, load_cache_questions
+from app.database import SessionLocal
+
+try:
+    import numpy as np
+except ImportError:  # 선택 의존성
+    np = None
+    if CHAT_SEMANTIC_CACHE:
+        print("[WARN] numpy 미설치: 의미 기반 답 캐시 비활성(정확히 같은 질문만 캐시 적중)")
+
+ENABLED = CHAT_SEMANTIC_CACHE and np is not None
+DIM = 1 << 18  # 희소 표현이라 버킷 수는 메모리에 거의 영향 없음(IDF 배열 1MB), 충돌만 줄임
+TOP_K = 5
+RECENT_MAX = 1024  # 빌드 사이에 바로 반영할 최대 건수(넘으면 다음 빌드 때 반영)
+_RETRY_MIN_SEC = 5.0
+_NGRAMS = (2, 3)
+_STRIP_RE = re.compile(r"[\W_]+", re.UNICODE)
+_DIGITS_RE = re.compile(r"\d+")
+# 문장 끝 어미/요청 표현("언제야?" / "언제예요" / "언제인지 알려줘")은 같은 질문으로 봄
+_TAIL_RE = re.compile(
+    r"(?:알려\s*주세요|알려\s*줄래|알려\s*줘|가르쳐\s*줘|궁금합니다|궁금해요?|해\s*주세요|해\s*줘|"
+    r"인지|인가요|인가|이에요|예요|입니다|이야|하나요|해요|에요|해|야|요|\s|[^\w])+$",
+    re.UNICODE,
+)
+# 같은 것을 묻는 질문어(뒤따르는 조사 포함)는 한 단어로("수강신청 언제" == "수강 신청 기간")
+_SYNONYMS = (
+    (re.compile(r"(?:(?:언제|기간|일정|날짜|기한|며칠|몇\s*일)(?:[이은는가을를](?=\s|$))?\s*)+"), "언제"),
+    (re.compile(r"(?:(?:어떻게|방법|절차|하는\s*법)(?:[이은는을를](?=\s|$))?\s*)+"), "방법"),
+)
+
+def _key_text(question: str) -> str:
+    s = normalize_text(question).lower()
+    s = _TAIL_RE.sub("", s) or s
+    for pat, word in _SYNONYMS:
+        s = pat.sub(word, s)
+    return _STRIP_RE.sub("", s)
+
+def _grams(question: str) -> Dict[int, int]:
+    s = _key_text(question)
+    counts: Dict[int, int] = {}
+    if not s:
+        return counts
+    grams = [s] if len(s) < _NGRAMS[0] else [s[i:i + n] for n in _NGRAMS for i in range(len(s) - n + 1)]
+    for g in grams:
+        b = zlib.crc32(g.encode("utf-8")) & (DIM - 1)
+        counts[b] = counts.get(b, 0) + 1
+    return counts
+
+def _digits(question: str) -> Tuple[str, ...]:
+    return tuple(sorted(_DIGITS_RE.findall(question or "")))
+
+class SemanticIndex:
+    """cache id → 정규화된 TF-IDF 희소 행. 빌드 후 불변(여러 스레드가 락 없이 검색)."""
+
+    def __init__(self, questions: Sequence[Tuple[int, str]] = ()):
+        n = len(questions)
+        rows: List[int] = []
+        buckets: List[int] = []
+        tf: List[float] = []
+        for row, (_, q) in enumerate(questions):
+            for b, c in _grams(q).items():
+                rows.append(row)
+                buckets.append(b)
+                tf.append(1.0 + math.log(c))
+        r = np.asarray(rows, dtype=np.int32)
+        b = np.asarray(buckets, dtype=np.int64)
+        w = np.asarray(tf, dtype=np.float32)
+        df = np.bincount(b, minlength=DIM)
+        self.idf = (np.log((1.0 + n) / (1.0 + df)) + 1.0).astype(np.float32)
+        w *= self.idf[b]
+        norms = np.sqrt(np.bincount(r, weights=w * w, minlength=n)).astype(np.float32)
+        w /= norms[r]  # 항목이 있는 행만 posting에 들어가므로 norm > 0
+        order = np.argsort(b, kind="stable")
+        self._buckets, self._rows, self._w = b[order], r[order], w[order]
+        self._n = n
+        self.ids: List[int] = [cid for cid, _ in questions]
+        self._digits: List[Tuple[str, ...]] = [_digits(q) for _, q in questions]
+
+    def __len__(self) -> int:
+        return self._n
+
+    def vector(self, question: str) -> Dict[int, float]:
+        """{버킷: 가중치}(이 인덱스의 IDF, L2 정규화)."""
+        v = {b: (1.0 + math.log(c)) * float(self.idf[b]) for b, c in _grams(question).items()}
+        norm = math.sqrt(sum(x * x for x in v.values()))
+        return {b: x / norm for b, x in v.items()} if norm > 0 else {}
+
+    def search(self, question: str, k: int = TOP_K,
+               vec: Optional[Dict[int, float]] = None) -> List[Tuple[int, float, Tuple[str, ...]]]:
+        """유사도 내림차순 (cache_id, 유사도, 질문 속 숫자) 최대 k개(겹치는 버킷이 하나도 없는 행은 제외)."""
+        vec = self.vector(question) if vec is None else vec
+        if self._n == 0 or not vec:
+            return []
+        qb = np.fromiter(vec.keys(), dtype=np.int64, count=len(vec))
+        qw = np.fromiter(vec.values(), dtype=np.float32, count=len(vec))
+        lo = np.searchsorted(self._buckets, qb, "left")
+        hi = np.searchsorted(self._buckets, qb, "right")
+        spans = [np.arange(a, z) for a, z in zip(lo.tolist(), hi.tolist()) if z > a]
+        if not spans:
+            return []
+        idx = np.concatenate(spans)
+        rows = self._rows[idx]
+        scores = np.bincount(rows, weights=self._w[idx] * np.repeat(qw, hi - lo), minlength=self._n)
+        cand = np.unique(rows)
+        k = min(k, len(cand))
+        top = cand[np.argpartition(-scores[cand], k - 1)[:k]]
+        top = top[np.argsort(-scores[top])]
+        return [(self.ids[i], float(scores[i]), self._digits[i]) for i in top]
+
+_index: Optional[SemanticIndex] = None
+# 마지막 빌드 뒤 이 워커가 저장한 항목: cache_id → (벡터, 숫자). 통째로 바꿔 끼우는 dict(락 없음)
+_recent: Dict[int, Tuple[Dict[int, float], Tuple[str, ...]]] = {}
+_executor: Optional[ThreadPoolExecutor] = None
+_pending: Optional[Future] = None
+_loaded_mono = 0.0
+_retry_after_mono = 0.0
+_failures = 0
+_load: Dict[str, Any] = {"loaded_at": None, "load_ms": None, "last_error": None}
+_stats = {"lookups": 0, "exact_hits": 0, "semantic_hits": 0, "misses": 0}
+_hit_scores: Deque[float] = deque(maxlen=1000)
+_miss_scores: Deque[float] = deque(maxlen=1000)  # 빗나간 요청의 최고 유사도(임계값 조정용)
+
+def _due() -> bool:
+    now = time.monotonic()
+    if now < _retry_after_mono:
+        return False
+    return _index is None or now - _loaded_mono >= CHAT_SEMANTIC_RELOAD_SEC
+
+def _reload() -> None:
+    """전용 스레드에서 실행: 자기 세션으로 읽고 새 인덱스를 만든 뒤 참조만 바꿔 끼움."""
+    global _index, _recent, _loaded_mono, _retry_after_mono, _failures
+    if not _due():
+        return  # 중복 예약(경쟁으로 2번 들어온 경우)
+    t = time.perf_counter()
+    db = SessionLocal()
+    try:
+        rows = load_cache_questions(db, CHAT_SEMANTIC_MAX_ENTRIES)
+        index = SemanticIndex(rows[::-1])
+    except Exception as e:
+        _failures += 1
+        backoff = min(_RETRY_MIN_SEC * 2 ** (_failures - 1), max(CHAT_SEMANTIC_RELOAD_SEC, _RETRY_MIN_SEC))
+        _retry_after_mono = time.monotonic() + backoff
+        _load["last_error"] = f"{datetime.now(timezone.utc).isoformat()} {e}"
+        print(f"[WARN] semantic cache load failed (retry in {backoff:.0f}s): {e}")
+        return
+    finally:
+        db.close()
+    built = set(index.ids)
+    _index = index
+    _recent = {cid: v for cid, v in _recent.items() if cid not in built}  # 빌드 중 저장된 것만 남김
+    _loaded_mono = time.monotonic()
+    _failures = 0
+    ms = (time.perf_counter() - t) * 1000
+    _load.update(loaded_at=datetime.now(timezone.utc).isoformat(), load_ms=round(ms), last_error=None)
+    print(f"[semantic-cache] loaded {len(rows)} questions in {ms:.0f}ms")
+
+def schedule_reload() -> bool:
+    """빌드가 필요하면 백그라운드에 예약(블로킹/락 없음). 이미 예약/진행 중이거나 물러나는 중이면 False."""
+    global _executor, _pending
+    if not ENABLED or not _due():
+        return False
+    if _pending is not None and not _pending.done():
+        return False
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="semantic-cache")
+    _pending = _executor.submit(_reload)
+    return True
+
+def _search(question: str) -> List[Tuple[int, float, Tuple[str, ...]]]:
+    index = _index
+    if index is None:
+        return []
+    vec = index.vector(question)
+    found = index.search(question, vec=vec)
+    seen = {cid for cid, _, _ in found}
+    for cid, (v, digits) in _recent.items():  # 바꿔 끼우기만 하는 dict라 순회 중 바뀌지 않음
+        if cid not in seen:
+            found.append((cid, sum(w * v.get(b, 0.0) for b, w in vec.items()), digits))
+    found.sort(key=lambda x: -x[1])
+    return found[:TOP_K]
+
+def record_exact_hit() -> None:
+    _stats["lookups"] += 1
+    _stats["exact_hits"] += 1
+
+def lookup(db: Session, question: str, threshold: float = CHAT_SEMANTIC_THRESHOLD) -> Any:
+    """정확 일치가 빗나간 뒤 호출. 적중하면 GptSearchCache 행, 아니면 None. 인덱스를 직접 읽지 않음(빌드는 예약만)."""
+    _stats["lookups"] += 1
+    best = 0.0
+    if ENABLED:
+        schedule_reload()
+        digits = _digits(question)
+        for cache_id, score, cand_digits in _search(question):
+            best = max(best, score)
+            if score < threshold:
+                break
+            if cand_digits != digits:
+                continue
+            row = get_cache_by_id(db, cache_id)
+            if row is not None:
+                _stats["semantic_hits"] += 1
+                _hit_scores.append(score)
+                return row
+    _stats["misses"] += 1
+    _miss_scores.append(best)
+    return None
+
+def remember(cache_id: Optional[int], question: str) -> None:
+    """이 워커가 저장한 캐시 항목을 다음 빌드 전까지 검색에 바로 반영(IDF는 현재 인덱스 기준)."""
+    global _recent
+    index = _index
+    if not ENABLED or cache_id is None or index is None or len(_recent) >= RECENT_MAX:
+        return
+    try:
+        _recent = {**_recent, cache_id: (index.vector(question), _digits(question))}
+    except Exception as e:
+        print(f"[WARN] semantic cache add failed: {e}")
+
+def _pct(xs: Sequence[float], q: float) -> Optional[float]:
+    xs = sorted(xs)
+    return round(xs[min(int(q * len(xs)), len(xs) - 1)], 4) if xs else None
+
+def stats() -> Dict[str, Any]:
+    hits = _stats["exact_hits"] + _stats["semantic_hits"]
+    return {
+        "enabled": ENABLED,
+        "threshold": CHAT_SEMANTIC_THRESHOLD,
+        "entries": len(_index) if _index is not None else 0,
+        "recent": len(_recent),
+        "loading": _pending is not None and not _pending.done(),
+        **_load,
+        **_stats,
+        "hit_rate": round(hits / _stats["lookups"], 4) if _stats["lookups"] else 0.0,
+        "similarity": {
+            "hit_p50": _pct(_hit_scores, .5),
+            "hit_min": round(min(_hit_scores), 4) if _hit_scores else None,
+            "miss_best_p50": _pct(_miss_scores, .5),
+            "miss_best_p90": _pct(_miss_scores, .9),
+        },
+    }
+
+def shutdown() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,3 @@
+# app/services/tests/conftest.py
+# DB에 직접 붙는 수동 점검 스크립트는 pytest 수집에서 제외(python -m 으로 실행)
+collect_ignore = ["test_filtering.py", "insert_dummy_data.py"]
@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app import database
+from app.database import AsyncDB
+
+@pytest.fixture
+def sqlite_db(monkeypatch, tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'chat.db'}", pool_size=2, max_overflow=0, pool_timeout=1)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE chat_log (id INTEGER PRIMARY KEY, message TEXT)"))
+    monkeypatch.setattr(database, "ASYNC_DB", False)
+    monkeypatch.setattr(database, "SessionLocal", sessionmaker(bind=engine, autoflush=False))
+    return engine
+
+def _read(db, n):
+    return db.execute(text("SELECT :n"), {"n": n}).scalar()
+
+def _write(db, msg):
+    db.execute(text("INSERT INTO chat_log (message) VALUES (:m)"), {"m": msg})
+
+def _fail(db):
+    db.execute(text("INSERT INTO chat_log (message) VALUES ('rolled back')"))
+    raise RuntimeError("boom")
+
+def test_connection_is_returned_between_calls(sqlite_db):
+    async def chat(i):
+        db = AsyncDB()
+        try:
+            assert await db.call(_read, i) == i
+            await asyncio.sleep(0.05)  # LLM 대기: 이 동안 커넥션을 잡고 있으면 풀(2개)이 바닥남
+            assert sqlite_db.pool.checkedout() <= 2
+            await db.call(_write, f"q{i}")
+        finally:
+            await db.close()
+
+    async def main():
+        await asyncio.gather(*[chat(i) for i in range(20)])
+
+    asyncio.run(main())
+    assert sqlite_db.pool.checkedout() == 0
+    with sqlite_db.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM chat_log")).scalar() == 20
+
+def test_failed_call_is_rolled_back(sqlite_db):
+    async def main():
+        db = AsyncDB()
+        try:
+            with pytest.raises(RuntimeError):
+                await db.call(_fail)
+            assert sqlite_db.pool.checkedout() == 0
+            await db.call(_write, "after")
+        finally:
+            await db.close()
+
+    asyncio.run(main())
+    with sqlite_db.connect() as conn:
+        assert conn.execute(text("SELECT message FROM chat_log")).scalars().all() == ["after"]
@@ -0,0 +1,182 @@
+import asyncio
+
+import pytest
+
+from app.services import chat_flight
+
+RESULT = {"title": "t", "link": None, "summary": "안녕하세요"}
+
+class FakeDB:
+    closed = 0
+
+    async def close(self):
+        FakeDB.closed += 1
+
+class FakeLLM:
+    def __init__(self, pieces=("안녕", "하세요"), delay=0.01, error=None):
+        self.calls = []
+        self.pieces = pieces
+        self.delay = delay
+        self.error = error
+        self.field_sent = asyncio.Event()
+
+    async def __call__(self, db, question, context=None):
+        self.calls.append(question)
+        for p in self.pieces:
+            await asyncio.sleep(self.delay)
+            yield "field", ("summary", p)
+            self.field_sent.set()
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        yield "done", dict(RESULT)
+
+@pytest.fixture(autouse=True)
+def _isolated(monkeypatch):
+    monkeypatch.setattr(chat_flight, "AsyncDB", FakeDB)
+    monkeypatch.setattr(chat_flight, "_flights", {})
+    monkeypatch.setattr(chat_flight, "_stats", {"started": 0, "joined": 0, "max_joined": 0})
+    monkeypatch.setattr(chat_flight, "CHAT_SINGLE_FLIGHT", True)
+
+async def _collect(flight):
+    return [ev async for ev in flight.fields()]
+
+def _use(monkeypatch, llm):
+    monkeypatch.setattr(chat_flight, "gpt_stream_async", llm)
+    return llm
+
+def test_flight_key_ignores_case_spacing_and_trailing_punctuation():
+    assert chat_flight.flight_key("수강신청  언제야?") == chat_flight.flight_key("수강신청 언제야 ?!")
+    assert chat_flight.flight_key("Hello") == chat_flight.flight_key("hello~")
+    assert chat_flight.flight_key("질문", "a") != chat_flight.flight_key("질문", "b")
+
+def test_concurrent_requests_share_one_llm_call(monkeypatch):
+    llm = _use(monkeypatch, FakeLLM())
+
+    async def main():
+        async def ask(q):
+            flight, _ = chat_flight.join_or_start(q)
+            return await flight.result()
+        return await asyncio.gather(*[ask("수강신청 언제야?" if i % 2 else "수강신청 언제야") for i in range(50)])
+
+    results = asyncio.run(main())
+    assert len(llm.calls) == 1
+    assert all(r == RESULT for r in results)
+    stats = chat_flight.stats()
+    assert (stats["started"], stats["joined"], stats["max_joined"], stats["in_flight"]) == (1, 49, 49, 0)
+    assert FakeDB.closed >= 1
+
+def test_late_joiner_replays_earlier_fields(monkeypatch):
+    llm = _use(monkeypatch, FakeLLM(pieces=("a", "b", "c")))
+
+    async def main():
+        starter, started = chat_flight.join_or_start("q")
+        live = asyncio.ensure_future(_collect(starter))
+        await llm.field_sent.wait()  # 첫 조각이 나간 뒤 합류
+        joiner, joined_started = chat_flight.join_or_start("q")
+        assert joiner is starter and started and not joined_started
+        assert len(joiner.events) == 1
+        late = await _collect(joiner)
+        return await live, late, await joiner.result()
+
+    live, late, result = asyncio.run(main())
+    assert live == late == [("summary", "a"), ("summary", "b"), ("summary", "c")]
+    assert result == RESULT
+    assert len(llm.calls) == 1
+
+def test_starter_cancellation_does_not_cancel_the_flight(monkeypatch):
+    llm = _use(monkeypatch, FakeLLM(delay=0.02))
+
+    async def main():
+        starter, _ = chat_flight.join_or_start("q")
+        waiter = asyncio.ensure_future(starter.result())
+        await asyncio.sleep(0)
+        joiner, started = chat_flight.join_or_start("q")
+        waiter.cancel()  # 시작한 요청의 클라이언트가 끊김
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        return started, await joiner.result(), starter.task.cancelled()
+
+    started, result, cancelled = asyncio.run(main())
+    assert not started
+    assert result == RESULT
+    assert not cancelled
+    assert len(llm.calls) == 1
+
+def test_new_flight_after_previous_one_finished(monkeypatch):
+    llm = _use(monkeypatch, FakeLLM())
+
+    async def main():
+        first, _ = chat_flight.join_or_start("q")
+        await first.result()
+        second, started = chat_flight.join_or_start("q")
+        await second.result()
+        return first is second, started
+
+    same, started = asyncio.run(main())
+    assert not same and started
+    assert len(llm.calls) == 2
+
+def test_disabled_single_flight_calls_per_request(monkeypatch):
+    monkeypatch.setattr(chat_flight, "CHAT_SINGLE_FLIGHT", False)
+    llm = _use(monkeypatch, FakeLLM())
+
+    async def main():
+        flights = [chat_flight.join_or_start("q") for _ in range(3)]
+        assert all(started for _, started in flights)
+        await asyncio.gather(*[f.result() for f, _ in flights])
+
+    asyncio.run(main())
+    assert len(llm.calls) == 3
+
+def test_error_reaches_every_waiter_and_ends_streams(monkeypatch):
+    _use(monkeypatch, FakeLLM(error=asyncio.TimeoutError()))
+    saved = []
+
+    async def save(db, result):
+        saved.append(result)
+
+    async def main():
+        starter, _ = chat_flight.join_or_start("q", on_success=save)
+        joiner, _ = chat_flight.join_or_start("q")
+        fields = [ev async for ev in joiner.fields()]
+        outcomes = await asyncio.gather(starter.result(), joiner.result(), return_exceptions=True)
+        return fields, outcomes
+
+    fields, outcomes = asyncio.run(main())
+    assert fields == [("summary", "안녕"), ("summary", "하세요")]
+    assert all(isinstance(o, asyncio.TimeoutError) for o in outcomes)
+    assert saved == []
+
+def _saver(log, name):
+    async def save(db, result):
+        log.append((name, result["summary"]))
+    return save
+
+@pytest.mark.parametrize("savers, expected", [
+    (("starter", "joiner"), [("starter", "안녕하세요")]),
+    ((None, "joiner", "joiner2"), [("joiner", "안녕하세요")]),  # 시작한 요청이 nocache여도 저장
+    ((None, None), []),
+])
+def test_on_success_runs_once_per_flight(monkeypatch, savers, expected):
+    _use(monkeypatch, FakeLLM())
+    log = []
+
+    async def main():
+        flights = [chat_flight.join_or_start("q", on_success=_saver(log, s) if s else None) for s in savers]
+        await asyncio.gather(*[f.result() for f, _ in flights])
+
+    asyncio.run(main())
+    assert log == expected
+
+def test_on_success_failure_does_not_fail_the_answer(monkeypatch):
+    _use(monkeypatch, FakeLLM())
+
+    async def broken(db, result):
+        raise RuntimeError("db down")
+
+    async def main():
+        flight, _ = chat_flight.join_or_start("q", on_success=broken)
+        return await flight.result()
+
+    assert asyncio.run(main()) == RESULT
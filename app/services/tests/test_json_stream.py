@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+from app.services.json_stream import JsonFieldStream
+
+FIELDS = ("title", "link", "summary")
+
+def _stream(chunks, fields=FIELDS):
+    s = JsonFieldStream(fields)
+    out = []
+    for c in chunks:
+        out.extend(s.feed(c))
+    return s, out
+
+def _joined(out):
+    values = {}
+    for field, delta in out:
+        values[field] = values.get(field, "") + delta
+    return values
+
+def _split_every(text, n):
+    return [text[i:i + n] for i in range(0, len(text), n)]
+
+DOC = json.dumps({
+    "title": "수강신청 \"안내\"",
+    "link": None,
+    "meta": {"score": [1, 2, {"summary": "가짜"}], "note": "}, \"summary\": \"x"},
+    "summary": "줄1\n줄2\t탭 \\ 역슬래시 / 슬래시 😀 끝",
+}, ensure_ascii=True)
+
+def test_single_chunk():
+    s, out = _stream([DOC])
+    assert _joined(out) == {"title": "수강신청 \"안내\"", "summary": "줄1\n줄2\t탭 \\ 역슬래시 / 슬래시 😀 끝"}
+    assert s.values == _joined(out)
+    assert s._state == "end"
+
+@pytest.mark.parametrize("n", [1, 2, 3, 5, 7])
+def test_any_chunking_gives_same_values(n):
+    _, whole = _stream([DOC])
+    _, out = _stream(_split_every(DOC, n))
+    assert _joined(out) == _joined(whole)
+
+def test_escape_split_across_chunks():
+    _, out = _stream(['{"summary": "a\\', 'nb\\', '"c\\\\', 'd"}'])
+    assert out == [("summary", "a"), ("summary", "\nb"), ("summary", "\"c\\"), ("summary", "d")]
+
+def test_unicode_escape_split_across_chunks():
+    _, out = _stream(['{"title": "\\u', 'AC', '00\\uac0', '1!"}'])
+    assert _joined(out) == {"title": "가각!"}
+
+def test_surrogate_pair_split_across_chunks():
+    _, out = _stream(['{"summary": "\\ud83d', '\\ude', '00"}'])
+    assert _joined(out) == {"summary": "😀"}
+
+def test_deltas_arrive_as_tokens_arrive():
+    s = JsonFieldStream(FIELDS)
+    assert s.feed('{"summary": "이번 ') == [("summary", "이번 ")]
+    assert s.feed('학기') == [("summary", "학기")]
+    assert s.feed('"') == []
+
+def test_unknown_and_non_string_fields_are_skipped():
+    _, out = _stream(['{"link": null, "extra": "무시", "title": 3, "summary": "요약"}'])
+    assert out == [("summary", "요약")]
+
+def test_escaped_quote_in_key_does_not_end_key():
+    _, out = _stream(['{"sum\\"mary": "x", "summary": "y"}'])
+    assert out == [("summary", "y")]
+
+def test_empty_string_value_is_recorded_without_deltas():
+    s, out = _stream(['{"title": "", "summary": "x"}'])
+    assert out == [("summary", "x")]
+    assert s.values == {"title": "", "summary": "x"}
+
+def test_input_after_end_is_ignored():
+    s, out = _stream(['{"title": "a"}', ' {"title": "b"}'])
+    assert out == [("title", "a")]
@@ -0,0 +1,126 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from app.services import semantic_cache as sc  # noqa: E402
+from app.services.semantic_cache import SemanticIndex, _digits, _key_text  # noqa: E402
+
+CACHED = [
+    "수강신청 언제야?", "졸업 요건이 뭐야", "장학금 신청 방법", "기숙사 입사 신청 기간", "2학기 등록금 납부 기간",
+    "1학기 성적 확인", "휴학 신청은 어떻게 해요", "도서관 운영 시간", "셔틀버스 시간표", "학생증 재발급 방법",
+    "계절학기 수강신청 일정", "복학 신청 기간", "졸업논문 제출 마감", "국가장학금 2차 신청",
+]
+
+@pytest.fixture(scope="module")
+def index():
+    return SemanticIndex([(100 + i, q) for i, q in enumerate(CACHED)])
+
+def _top(index, q):
+    cid, score, _ = index.search(q)[0]
+    return CACHED[cid - 100], score
+
+@pytest.mark.parametrize("a, b", [
+    ("수강신청 언제야?", "수강 신청 기간 알려줘"),
+    ("수강신청 언제야?", "수강신청 언제예요"),
+    ("수강신청 언제야?", "수강신청 일정이 언제인지 궁금해요"),
+    ("장학금 신청 방법", "장학금 신청 어떻게 해?"),
+])
+def test_key_text_collapses_endings_and_question_words(a, b):
+    assert _key_text(a) == _key_text(b)
+
+@pytest.mark.parametrize("q", ["수강 신청 기간 알려줘", "수강신청 언제예요", "수강신청 날짜"])
+def test_paraphrase_hits_above_threshold(index, q):
+    assert _top(index, q) == ("수강신청 언제야?", pytest.approx(1.0, abs=1e-5))
+
+@pytest.mark.parametrize("q", ["기숙사 퇴사 절차", "도서관 몇시까지 해?", "교환학생 지원 자격"])
+def test_other_topics_stay_below_threshold(index, q):
+    results = index.search(q)
+    assert not results or results[0][1] < sc.CHAT_SEMANTIC_THRESHOLD
+
+def test_scores_are_cosine_and_sorted(index):
+    results = index.search("계절 학기 수강 신청 기간")
+    scores = [s for _, s, _ in results]
+    assert scores == sorted(scores, reverse=True)
+    assert all(0.0 < s <= 1.0 + 1e-6 for s in scores)
+    assert CACHED[results[0][0] - 100] == "계절학기 수강신청 일정"
+
+def test_search_matches_dense_cosine(index):
+    import numpy as np
+
+    def dense(q):
+        v = np.zeros(sc.DIM)
+        for b, w in index.vector(q).items():
+            v[b] = w
+        return v
+
+    q = "국가장학금 신청"
+    expected = {100 + i: float(dense(c) @ dense(q)) for i, c in enumerate(CACHED)}
+    for cid, score, _ in index.search(q, k=len(CACHED)):
+        assert score == pytest.approx(expected[cid], abs=1e-5)
+
+def test_digits_are_returned_for_the_guard(index):
+    cid, score, digits = index.search("1학기 등록금 납부 기간")[0]
+    assert CACHED[cid - 100] == "2학기 등록금 납부 기간"
+    assert score >= sc.CHAT_SEMANTIC_THRESHOLD
+    assert digits == ("2",) != _digits("1학기 등록금 납부 기간")
+
+def test_empty_index_and_empty_query():
+    assert SemanticIndex([]).search("수강신청") == []
+    assert len(SemanticIndex([])) == 0
+    assert SemanticIndex([(1, "수강신청")]).search("?!") == []
+
+class _Session:
+    def close(self):
+        pass
+
+@pytest.fixture
+def module_state(monkeypatch):
+    monkeypatch.setattr(sc, "ENABLED", True)
+    monkeypatch.setattr(sc, "SessionLocal", _Session)
+    monkeypatch.setattr(sc, "get_cache_by_id", lambda db, cid: ("row", cid))
+    for name, value in {"_index": None, "_recent": {}, "_pending": None, "_executor": None, "_loaded_mono": 0.0,
+                        "_retry_after_mono": 0.0, "_failures": 0,
+                        "_load": {"loaded_at": None, "load_ms": None, "last_error": None},
+                        "_stats": {"lookups": 0, "exact_hits": 0, "semantic_hits": 0, "misses": 0}}.items():
+        monkeypatch.setattr(sc, name, value)
+    yield
+    sc.shutdown()
+
+def _load_and_wait():
+    assert sc.schedule_reload()
+    sc._pending.result(timeout=5)
+
+def test_lookup_uses_background_index_and_digit_guard(module_state, monkeypatch):
+    monkeypatch.setattr(sc, "load_cache_questions", lambda db, limit: [(2, "2학기 등록금 납부 기간"), (1, "수강신청 언제야?")])
+    assert sc.lookup(None, "수강 신청 기간 알려줘") is None  # 첫 조회는 빌드만 예약하고 기다리지 않음
+    sc._pending.result(timeout=5)
+    assert sc.lookup(None, "수강 신청 기간 알려줘") == ("row", 1)
+    assert sc.lookup(None, "1학기 등록금 납부 기간") is None
+    assert not sc.schedule_reload()  # RELOAD_SEC 안에는 다시 빌드하지 않음
+    st = sc.stats()
+    assert (st["entries"], st["lookups"], st["semantic_hits"], st["misses"]) == (2, 3, 1, 2)
+
+def test_remember_is_searchable_until_next_build(module_state, monkeypatch):
+    rows = [(1, "졸업 요건이 뭐야")]
+    monkeypatch.setattr(sc, "load_cache_questions", lambda db, limit: list(rows))
+    _load_and_wait()
+    sc.remember(7, "수강신청 언제야?")
+    assert sc.lookup(None, "수강신청 기간") == ("row", 7)
+    rows.insert(0, (7, "수강신청 언제야?"))
+    monkeypatch.setattr(sc, "_loaded_mono", 0.0)
+    _load_and_wait()
+    assert sc._recent == {}
+    assert sc.lookup(None, "수강신청 기간") == ("row", 7)
+
+def test_failed_build_backs_off(module_state, monkeypatch):
+    def fail(db, limit):
+        raise RuntimeError("db down")
+    monkeypatch.setattr(sc, "load_cache_questions", fail)
+    _load_and_wait()
+    assert sc._index is None
+    assert "db down" in sc.stats()["last_error"]
+    assert not sc.schedule_reload()
+    monkeypatch.setattr(sc, "_retry_after_mono", 0.0)
+    _load_and_wait()
+    assert sc._failures == 2
+    assert sc._retry_after_mono - sc._loaded_mono >= 2 * sc._RETRY_MIN_SEC
@@ -0,0 +1,200 @@
+# bench/bench_chat.py
+"""
+/api/chat 동시성-지연 곡선 측정(비동기 /api/chat vs 동기 /api/chat/sync, 스트리밍 /api/chat/stream).
+
+모델 지연의 편차를 빼고 서버 쪽 동시성만 보려면 고정 지연의 가짜 LLM을 띄워서 측정:
+
+1) 가짜 LLM(OpenAI 호환 /v1/chat/completions, 고정 지연, stream=true면 토큰 간격 --token-ms):
+    python bench/bench_chat.py mock-llm --port 8900 --delay-ms 800 --token-ms 20
+
+2) API 서버(가짜 LLM을 바라보게):
+    OPENAI_BASE_URL=http://127.0.0.1:8900/v1 uvicorn app.main:app --port 8000
+
+3) 측정(동시 요청 수별 p50/p95/p99, 처리량, 실패 수 → 마크다운 표):
+    python bench/bench_chat.py run --url http://127.0.0.1:8000 --user-id 1 --levels 1,10,50,100,200 \
+        --out bench/results_chat.md --label "after (async + single-flight)"
+
+--out이면 같은 표를 실행 조건(라벨/시각/단계별 요청 수/동일 질문 여부)과 함께 마크다운 파일에 덧붙임
+(변경 전/후를 같은 파일에 쌓아서 비교, 측정한 결과 파일을 그대로 커밋).
+
+요청은 nocache=true로 보내 매번 LLM까지 감(캐시 적중으로 곡선이 흐려지지 않게).
+--same-question이면 단계마다 모든 요청이 같은 질문 → 동시 질문 합치기(single-flight) 효과 측정
+(가짜 LLM 호출 수는 /api/chat/stats의 started/joined로 확인).
+first 열은 첫 응답 조각까지의 시간(스트리밍은 첫 field 이벤트, 나머지는 전체 응답과 같음).
+동기 경로는 Starlette 스레드풀(기본 40) 크기에서 지연이 꺾이고, 비동기 경로는 LLM 지연 근처에 머무는 것이 목표.
+표준 라이브러리만 사용.
+"""
+from __future__ import annotations
+import argparse
+import json
+import statistics
+import time
+from datetime import datetime, timezone
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple
+
+
+def _pct(xs, q: float) -> float:
+    xs = sorted(xs)
+    return xs[min(int(q * len(xs)), len(xs) - 1)] if xs else 0.0
+
+
+# ---------------- 가짜 LLM ----------------
+def _completion(content: str) -> Dict:
+    return {
+        "id": "chatcmpl-bench", "object": "chat.completion", "created": int(time.time()), "model": "bench",
+        "choices": [{"index": 0, "finish_reason": "stop",
+                     "message": {"role": "assistant", "content": content}}],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+    }
+
+
+def cmd_mock_llm(args) -> None:
+    delay = args.delay_ms / 1000
+    answer = json.dumps({"title": "벤치마크 응답", "link": None, "summary": "가짜 LLM 응답입니다."}, ensure_ascii=False)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            req = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+            if req.get("stream"):
+                return self._stream()
+            time.sleep(delay)
+            body = json.dumps(_completion(answer), ensure_ascii=False).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _stream(self):
+            # 첫 토큰까지 delay-ms의 1/4, 이후 토큰(몇 글자씩)마다 token-ms
+            time.sleep(delay / 4)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            for i in range(0, len(answer), 4):
+                chunk = {"id": "chatcmpl-bench", "object": "chat.completion.chunk", "created": int(time.time()),
+                         "model": "bench", "choices": [{"index": 0, "delta": {"content": answer[i:i + 4]},
+                                                        "finish_reason": None}]}
+                self.wfile.write(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+                time.sleep(args.token_ms / 1000)
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.close_connection = True
+
+        def log_message(self, *a):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        daemon_threads = True
+        request_queue_size = 1024  # 동시 접속이 몰려도 listen backlog에서 밀리지 않게
+
+    server = Server(("127.0.0.1", args.port), Handler)
+    print(f"mock LLM on http://127.0.0.1:{args.port}/v1 (delay {args.delay_ms}ms)")
+    server.serve_forever()
+
+
+# ---------------- 부하 ----------------
+def _post(url: str, payload: Dict, timeout: float) -> Tuple[float, float]:
+    """(전체 ms, 첫 응답 조각 ms)"""
+    data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    t = time.perf_counter()
+    first = None
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        if resp.status != 200:
+            raise RuntimeError(f"HTTP {resp.status}")
+        for line in resp:
+            if first is None and line.startswith(b"event: field"):
+                first = time.perf_counter()
+    end = time.perf_counter()
+    return (end - t) * 1000, ((first or end) - t) * 1000
+
+
+def _level(url: str, user_id: str, concurrency: int, n: int, timeout: float, same: bool = False) -> Dict:
+    def one(i: int):
+        msg = f"벤치마크 질문 {concurrency}" if same else f"벤치마크 질문 {concurrency}-{i}"
+        payload = {"user_id": user_id, "message": msg, "nocache": True}
+        try:
+            return _post(url, payload, timeout)
+        except (urllib.error.URLError, OSError, RuntimeError):
+            return None
+
+    t = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        out = list(pool.map(one, range(n)))
+    wall = time.perf_counter() - t
+    ok: List[float] = [x[0] for x in out if x is not None]
+    first: List[float] = [x[1] for x in out if x is not None]
+    return {
+        "n": n, "errors": n - len(ok),
+        "p50": _pct(ok, .5), "p95": _pct(ok, .95), "p99": _pct(ok, .99),
+        "first_p50": _pct(first, .5),
+        "mean": statistics.fmean(ok) if ok else 0.0,
+        "rps": len(ok) / wall if wall else 0.0,
+    }
+
+
+def cmd_run(args) -> None:
+    levels = [int(x) for x in args.levels.split(",") if x.strip()]
+    paths = [p for p in args.paths.split(",") if p.strip()]
+    rows = []
+    for path in paths:
+        for c in levels:
+            n = max(args.requests, c) if args.requests else c * 3
+            r = _level(args.url.rstrip("/") + path, args.user_id, c, n, args.timeout, args.same_question)
+            rows.append((path, c, r))
+            print(f"{path:16s} c={c:4d} n={r['n']:4d}  p50={r['p50']:8.1f}ms  p95={r['p95']:8.1f}ms  "
+                  f"p99={r['p99']:8.1f}ms  first={r['first_p50']:8.1f}ms  {r['rps']:7.1f} req/s  "
+                  f"errors={r['errors']}", flush=True)
+
+    table = ["| path | concurrency | p50 (ms) | p95 (ms) | p99 (ms) | first p50 (ms) | req/s | errors |",
+             "|---|---:|---:|---:|---:|---:|---:|---:|"]
+    for path, c, r in rows:
+        table.append(f"| {path} | {c} | {r['p50']:.0f} | {r['p95']:.0f} | {r['p99']:.0f} | {r['first_p50']:.0f} "
+                     f"| {r['rps']:.1f} | {r['errors']} |")
+    print("\n" + "\n".join(table))
+    if args.out:
+        requests = f"{args.requests}/level" if args.requests else "concurrency x 3"
+        head = (f"## {args.label or 'run'}\n\n"
+                f"- at: {datetime.now(timezone.utc).isoformat(timespec='seconds')}\n"
+                f"- url: {args.url}, requests: {requests}, same question: {args.same_question}\n\n")
+        with open(args.out, "a", encoding="utf-8") as f:
+            f.write(head + "\n".join(table) + "\n\n")
+        print(f"\n→ {args.out}")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    m = sub.add_parser("mock-llm", help="고정 지연 가짜 LLM 서버")
+    m.add_argument("--port", type=int, default=8900)
+    m.add_argument("--delay-ms", type=int, default=800)
+    m.add_argument("--token-ms", type=int, default=20)
+    m.set_defaults(func=cmd_mock_llm)
+
+    r = sub.add_parser("run", help="동시성별 지연 측정")
+    r.add_argument("--url", default="http://127.0.0.1:8000")
+    r.add_argument("--user-id", default="1")
+    r.add_argument("--levels", default="1,10,50,100,200")
+    r.add_argument("--paths", default="/api/chat/sync,/api/chat,/api/chat/stream")
+    r.add_argument("--requests", type=int, default=0, help="단계별 요청 수(기본: 동시 수 x 3)")
+    r.add_argument("--timeout", type=float, default=120.0)
+    r.add_argument("--same-question", action="store_true", help="단계 안의 요청이 모두 같은 질문")
+    r.add_argument("--out", default="", help="결과 표를 덧붙일 마크다운 파일")
+    r.add_argument("--label", default="", help="--out 표 제목(예: before / after)")
+    r.set_defaults(func=cmd_run)
+
+    args = ap.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+# bench/bench_crawl.py
+"""
+크롤러 오프라인 벤치마크(녹화한 응답을 재생).
+
+1) 녹화(실제 사이트 접속, 1회):
+    python bench/bench_crawl.py record https://www.ewha.ac.kr/ewha/news/notice.do --pages 3
+   → CRAWL_FIXTURE_DIR(기본 fixtures/crawl)에 목록/상세 응답과 manifest.json 저장
+
+2) 측정(네트워크 없이):
+    python bench/bench_crawl.py run            # 재생 fetch 처리량 + 페이지당 파싱 시간
+    python bench/bench_crawl.py run --db       # + crawl_and_store 종단 처리량(로컬 Postgres)
+
+--db는 DATABASE_URL의 DB에 실제로 upsert하므로 로컬/테스트 DB에서만 사용할 것
+(db/migrations/*.sql 적용 필요).
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def _manifest_path() -> Path:
+    from app.core.config import CRAWL_FIXTURE_DIR
+    return Path(CRAWL_FIXTURE_DIR) / "manifest.json"
+
+
+def _pct(xs, q: float) -> float:
+    xs = sorted(xs)
+    return xs[min(int(q * len(xs)), len(xs) - 1)] if xs else 0.0
+
+
+def _fmt(name: str, ms) -> str:
+    return (f"{name:14s} n={len(ms):4d}  mean={statistics.fmean(ms):7.2f}ms  "
+            f"p50={_pct(ms, .5):7.2f}ms  p95={_pct(ms, .95):7.2f}ms")
+
+
+def cmd_record(args) -> None:
+    os.environ["CRAWL_HTTP_MODE"] = "record"
+    from app.crawler.sites.ewha_notice import fetch_notice_list, fetch_notice_detail, list_page_url
+
+    list_pages, details = [], []
+    pages = [None] + list(range(1, args.pages + 1))
+    for p in pages:
+        items = fetch_notice_list(args.list_url, page=p)
+        list_pages.append(list_page_url(args.list_url, p))
+        for it in items:
+            if it["link"] not in details:
+                details.append(it["link"])
+    details = details[: args.limit]
+    for i, url in enumerate(details, 1):
+        try:
+            fetch_notice_detail(url)
+        except Exception as e:
+            print(f"[WARN] detail 녹화 실패 {url}: {e}")
+        print(f"\rdetail {i}/{len(details)}", end="", flush=True)
+    print()
+
+    manifest = {"list_url": args.list_url, "pages": args.pages, "list_pages": list_pages, "detail_urls": details}
+    _manifest_path().parent.mkdir(parents=True, exist_ok=True)
+    _manifest_path().write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"녹화 완료: 목록 {len(list_pages)}쪽, 상세 {len(details)}건 → {_manifest_path().parent}")
+
+
+def cmd_run(args) -> None:
+    os.environ["CRAWL_HTTP_MODE"] = "replay"
+    from app.crawler import http_client
+    from app.crawler.sites.ewha_notice import parse_notice_list, parse_notice_detail
+
+    manifest = json.loads(_manifest_path().read_text(encoding="utf-8"))
+    list_pages, detail_urls = manifest["list_pages"], manifest["detail_urls"]
+    urls = list_pages + detail_urls
+
+    # 1) 재생 transport 경유 fetch + 문자셋 판별
+    bodies = {}
+    t0 = time.perf_counter()
+    for _ in range(args.repeat):
+        for url in urls:
+            resp = http_client.get(url)
+            resp.raise_for_status()
+            bodies[url] = http_client.decode(resp)
+    elapsed = time.perf_counter() - t0
+    print(f"fetch(replay)  {len(urls) * args.repeat / elapsed:9.1f} pages/sec")
+
+    # 2) 페이지당 파싱 시간
+    list_ms, detail_ms = [], []
+    for _ in range(args.repeat):
+        for url in list_pages:
+            t = time.perf_counter()
+            parse_notice_list(bodies[url], url)
+            list_ms.append((time.perf_counter() - t) * 1000)
+        for url in detail_urls:
+            t = time.perf_counter()
+            parse_notice_detail(bodies[url], url)
+            detail_ms.append((time.perf_counter() - t) * 1000)
+    if list_ms:
+        print(_fmt("parse list", list_ms))
+    if detail_ms:
+        print(_fmt("parse detail", detail_ms))
+
+    # 3) crawl_and_store 종단 처리량(로컬 Postgres)
+    if args.db:
+        from app.database import SessionLocal
+        from app.services.crawl_pipeline import crawl_and_store
+
+        kw = dict(limit=None, concurrency=args.concurrency, deadline_sec=0, incremental=False)
+        if manifest.get("pages"):
+            kw.update(page_from=1, page_to=manifest["pages"])
+        for label, conditional in (("cold", False), ("warm", False), ("conditional", True)):
+            db = SessionLocal()
+            try:
+                t = time.perf_counter()
+                res = crawl_and_store(db, manifest["list_url"], conditional=conditional, **kw)
+                dt = time.perf_counter() - t
+            finally:
+                db.close()
+            print(f"e2e {label:11s} {res.get('found', 0) / dt:9.1f} items/sec  ({dt:.2f}s) {res}")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    rec = sub.add_parser("record")
+    rec.add_argument("list_url")
+    rec.add_argument("--pages", type=int, default=1, help="page=1..N 목록도 함께 녹화")
+    rec.add_argument("--limit", type=int, default=100, help="녹화할 상세 페이지 수 상한")
+    run = sub.add_parser("run")
+    run.add_argument("--repeat", type=int, default=3)
+    run.add_argument("--db", action="store_true", help="crawl_and_store 종단 측정(로컬 Postgres)")
+    run.add_argument("--concurrency", type=int, default=None)
+    args = ap.parse_args()
+    {"record": cmd_record, "run": cmd_run}[args.cmd](args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# bench/bench_dates.py
+"""
+날짜 파서 마이크로 벤치마크: 기존(_parse_date: 치환 + dateutil fuzzy) vs app.crawler.dates.parse_date.
+
+사용법:
+    python bench/bench_dates.py [저장된 목록 페이지 디렉터리] [--repeat N]
+
+디렉터리를 주면 목록 페이지의 모든 td / date·time 클래스 노드 텍스트를 후보로 모은다
+(파서가 실제로 받는 입력과 같은 분포). 없으면 내장 샘플을 행 수만큼 반복한다.
+"""
+from __future__ import annotations
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from bs4 import BeautifulSoup  # noqa: E402
+from dateutil import parser as dateparser  # noqa: E402
+
+from app.crawler import dates  # noqa: E402
+
+SAMPLES = [
+    "2025.08.12", "2025-08-12", "2025/08/12", "2025-08-12 14:30", "2025.8.1.",
+    "2025년 8월 12일", "2025년 8월 12일 (화) 오후 2시 30분", "20250812", "25.08.12",
+    "등록일 2025.08.11", "Aug 12, 2025",
+]
+
+
+def legacy_parse_date(txt: str):
+    """변경 전 구현(비교용 사본)."""
+    txt = re.sub(r"\s+", " ", txt or "").strip()
+    txt = txt.replace("년", "-").replace("월", "-").replace("일", "").replace(".", "-").replace("/", "-")
+    try:
+        return dateparser.parse(txt, yearfirst=True, dayfirst=False, fuzzy=True)
+    except Exception:
+        return None
+
+
+def candidates_from_pages(pages_dir: str):
+    out = []
+    date_cls = re.compile(r"(date|time)", re.I)
+    year = re.compile(r"\b20\d{2}\b")
+    for p in sorted(Path(pages_dir).glob("**/*.html")):
+        soup = BeautifulSoup(p.read_text(encoding="utf-8", errors="replace"), "lxml")
+        for node in soup.find_all("td") + soup.find_all(class_=date_cls):
+            txt = node.get_text(" ", strip=True)
+            if year.search(txt):
+                out.append(txt)
+    return out
+
+
+def _bench(fn, inputs, repeat: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for s in inputs:
+            fn(s)
+    return (time.perf_counter() - t0) / (repeat * len(inputs)) * 1e6
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("pages_dir", nargs="?")
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args()
+
+    inputs = candidates_from_pages(args.pages_dir) if args.pages_dir else SAMPLES * 50
+    if not inputs:
+        sys.exit("날짜 후보 텍스트가 없습니다.")
+
+    mismatch = [s for s in set(inputs)
+                if (legacy_parse_date(s) or None) and dates.parse_date(s)
+                and legacy_parse_date(s).date() != dates.parse_date(s).date()]
+
+    old_us = _bench(legacy_parse_date, inputs, args.repeat)
+    dates._parse_cached.cache_clear()
+    new_us = _bench(dates.parse_date, inputs, args.repeat)
+    info = dates.cache_info()
+
+    print(f"inputs: {len(inputs)} ({len(set(inputs))} distinct) x {args.repeat}")
+    print(f"legacy  : {old_us:8.2f} us/call")
+    print(f"current : {new_us:8.2f} us/call  ({old_us / max(new_us, 1e-9):.1f}x)")
+    print(f"lru     : hits={info.hits} misses={info.misses} size={info.currsize}/{info.maxsize}")
+    dates._parse_cached.cache_clear()
+    cold_us = _bench(lambda s: dates._fast(s) or dates._fuzzy(s), inputs, 1)
+    print(f"no-cache: {cold_us:8.2f} us/call (LRU 없이 정규식 + 폴백)")
+    if mismatch:
+        print("legacy와 날짜가 다른 입력:", mismatch)
+
+
+if __name__ == "__main__":
+    main()
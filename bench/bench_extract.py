@@ -0,0 +1,98 @@
+# bench/bench_extract.py
+"""
+상세 페이지 본문 추출(_extract_main_block) 벤치마크: 기존(후보 태그마다 get_text) vs 현재(1-pass 점수).
+
+사용법:
+    python bench/bench_extract.py [저장된 HTML 디렉터리] [--repeat N]
+
+디렉터리를 주지 않으면 깊게 중첩된 합성 페이지로 측정한다.
+페이지당 파싱(BeautifulSoup) 시간은 양쪽에서 동일하므로 추출 단계만 따로 잰다.
+"""
+from __future__ import annotations
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from app.crawler.sites.ewha_notice import _extract_main_block  # noqa: E402
+
+
+def _clean(s: str) -> str:
+    return re.sub(r"\s+", " ", s or "").strip()
+
+
+def legacy_extract_main_block(soup: BeautifulSoup) -> str:
+    """변경 전 구현(비교용 사본)."""
+    for t in soup(["script", "style", "noscript"]):
+        t.decompose()
+    candidates = []
+    for name in ["article", "main", "section", "div"]:
+        for tag in soup.find_all(name):
+            txt = _clean(tag.get_text(" ", strip=True))
+            candidates.append((len(txt), txt))
+    if candidates:
+        candidates.sort(reverse=True, key=lambda x: x[0])
+        return candidates[0][1]
+    return _clean(soup.get_text(" ", strip=True))
+
+
+def synthetic_page(depth: int = 30, paragraphs: int = 40) -> str:
+    nav = "".join(f'<li><a href="/m{i}">메뉴 {i}</a></li>' for i in range(80))
+    body = "".join(f"<p>{i}번째 문단입니다. 수강신청 및 장학 관련 안내 사항을 확인하세요.</p>" for i in range(paragraphs))
+    content = f'<div class="b-content-box"><h2>공지 제목</h2><span class="b-date">2025.08.12</span>{body}</div>'
+    for i in range(depth):
+        content = f'<div class="wrap{i}">{content}</div>'
+    return (
+        f"<html><head><title>공지</title><script>var x=1;</script></head><body>"
+        f'<div id="wrap"><div id="header"><ul>{nav}</ul></div>'
+        f'<div id="container"><section><article>{content}</article></section></div>'
+        f'<div id="footer"><p>서울특별시 서대문구 이화여대길 52</p></div></div></body></html>'
+    )
+
+
+def _time(fn, html: str, repeat: int) -> tuple:
+    total = 0.0
+    out = ""
+    for _ in range(repeat):
+        soup = BeautifulSoup(html, "lxml")
+        t0 = time.perf_counter()
+        out = fn(soup)
+        total += time.perf_counter() - t0
+    return total / repeat * 1000.0, out
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("pages_dir", nargs="?", help="저장된 상세 페이지(.html) 디렉터리")
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    if args.pages_dir:
+        pages = {p.name: p.read_text(encoding="utf-8", errors="replace")
+                 for p in sorted(Path(args.pages_dir).glob("**/*.html"))}
+    else:
+        pages = {f"synthetic-depth{d}": synthetic_page(depth=d) for d in (5, 15, 30, 60)}
+    if not pages:
+        sys.exit("측정할 .html 파일이 없습니다.")
+
+    print(f"{'page':40s} {'legacy ms':>10s} {'new ms':>10s} {'speedup':>8s} {'len old/new':>14s}")
+    sum_old = sum_new = 0.0
+    for name, html in pages.items():
+        old_ms, old_txt = _time(legacy_extract_main_block, html, args.repeat)
+        new_ms, new_txt = _time(_extract_main_block, html, args.repeat)
+        sum_old += old_ms
+        sum_new += new_ms
+        print(f"{name[:40]:40s} {old_ms:10.2f} {new_ms:10.2f} {old_ms / max(new_ms, 1e-9):7.1f}x "
+              f"{len(old_txt):6d}/{len(new_txt):<6d}")
+    n = len(pages)
+    print(f"{'mean per page':40s} {sum_old / n:10.2f} {sum_new / n:10.2f} {sum_old / max(sum_new, 1e-9):7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+-- 크롤러 조건부 GET(ETag / Last-Modified) 검증자 캐시
+CREATE TABLE IF NOT EXISTS app.http_validator (
+  url_key TEXT PRIMARY KEY,
+  url TEXT NOT NULL,
+  etag TEXT,
+  last_modified TEXT,
+  body_hash TEXT,
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
@@ -0,0 +1,19 @@
+-- 원본 HTML 아카이브: 압축한 본문을 내용 해시(sha256) 기준으로 한 번만 저장
+-- notice_raw는 fetch마다 한 행(blob_hash로 참조)만 쌓이므로 바뀌지 않은 페이지는 추가 용량이 거의 없음
+CREATE TABLE IF NOT EXISTS app.raw_blob (
+  hash TEXT PRIMARY KEY,
+  codec TEXT NOT NULL,
+  size_raw INTEGER NOT NULL,
+  size_stored INTEGER NOT NULL,
+  data BYTEA NOT NULL,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- 이미 압축된 데이터라 TOAST 재압축은 낭비
+ALTER TABLE app.raw_blob ALTER COLUMN data SET STORAGE EXTERNAL;
+
+ALTER TABLE app.notice_raw
+  ADD COLUMN IF NOT EXISTS blob_hash TEXT REFERENCES app.raw_blob(hash);
+
+CREATE INDEX IF NOT EXISTS idx_notice_raw_url_fetched ON app.notice_raw(url, fetched_at DESC);
+CREATE INDEX IF NOT EXISTS idx_notice_raw_blob_hash ON app.notice_raw(blob_hash);
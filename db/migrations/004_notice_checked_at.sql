@@ -0,0 +1,7 @@
+-- 변경 없는 공지는 본문을 다시 쓰지 않고 확인 시각(checked_at)만 갱신
+-- updated_at = 마지막 내용 변경, checked_at = 마지막 확인(증분 크롤 재방문 판단)
+-- checked_at에는 인덱스를 두지 않음(HOT update 유지)
+ALTER TABLE app.notice ADD COLUMN IF NOT EXISTS checked_at TIMESTAMPTZ;
+
+-- HOT update가 같은 페이지에 새 버전을 둘 수 있도록 여유 공간 확보(이후 기록되는 페이지부터 적용)
+ALTER TABLE app.notice SET (fillfactor = 90);
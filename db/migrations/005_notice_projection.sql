@@ -0,0 +1,8 @@
+-- 읽기 모델(notices)을 크롤러 테이블(app.notice)에서 projection
+-- source_key = app.notice.url_key, source_checksum = projection 당시 app.notice.checksum
+-- (notices는 ORM create_all로 만들어지므로 컬럼만 추가, 기존 수동 입력 행은 source_key NULL)
+ALTER TABLE notices ADD COLUMN IF NOT EXISTS source_key VARCHAR(64);
+ALTER TABLE notices ADD COLUMN IF NOT EXISTS source_checksum VARCHAR(64);
+
+CREATE UNIQUE INDEX IF NOT EXISTS ux_notices_source_key ON notices(source_key);
+CREATE INDEX IF NOT EXISTS idx_notices_date_created ON notices(date DESC NULLS LAST, created_at DESC);
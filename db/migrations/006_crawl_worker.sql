@@ -0,0 +1,12 @@
+-- 크롤 실행 주체(API 프로세스 또는 별도 워커)의 최근 상태
+-- 별도 워커(app/schedule/worker.py)로 돌릴 때 API의 /api/schedule/status가 여기서 읽어 보여줌
+CREATE TABLE IF NOT EXISTS app.crawl_worker (
+  worker_id TEXT PRIMARY KEY,            -- host:pid
+  mode TEXT NOT NULL,                    -- thread | process | external
+  running BOOLEAN NOT NULL DEFAULT FALSE,
+  last_run_at TIMESTAMPTZ,
+  last_finished_at TIMESTAMPTZ,
+  next_run_at TIMESTAMPTZ,
+  last_results JSONB,
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
@@ -0,0 +1,38 @@
+-- 크롤 실행 이력(시드별 1행)과 URL별 측정값
+-- /api/schedule/status의 지연 백분위/오류율/추세, 시드별 변경률 계산에 사용
+CREATE TABLE IF NOT EXISTS app.crawl_run (
+  id BIGSERIAL PRIMARY KEY,
+  seed_url TEXT NOT NULL,
+  worker_id TEXT,
+  trigger TEXT NOT NULL,                 -- schedule | api | ...
+  started_at TIMESTAMPTZ NOT NULL,
+  finished_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  duration_ms DOUBLE PRECISION,
+  found INTEGER NOT NULL DEFAULT 0,
+  inserted INTEGER NOT NULL DEFAULT 0,
+  updated INTEGER NOT NULL DEFAULT 0,
+  unchanged INTEGER NOT NULL DEFAULT 0,
+  not_modified INTEGER NOT NULL DEFAULT 0,
+  errors INTEGER NOT NULL DEFAULT 0,
+  error TEXT,                            -- 실행 자체가 실패한 경우
+  summary JSONB                          -- crawl_and_store 반환값 전체(단계별 통계 포함)
+);
+
+CREATE INDEX IF NOT EXISTS idx_crawl_run_started ON app.crawl_run(started_at DESC);
+CREATE INDEX IF NOT EXISTS idx_crawl_run_seed_started ON app.crawl_run(seed_url, started_at DESC);
+
+CREATE TABLE IF NOT EXISTS app.crawl_fetch (
+  id BIGSERIAL PRIMARY KEY,
+  run_id BIGINT NOT NULL REFERENCES app.crawl_run(id) ON DELETE CASCADE,
+  url TEXT NOT NULL,
+  kind TEXT NOT NULL,                    -- list | detail
+  http_status INTEGER,                   -- 304 = 조건부 요청에서 변경 없음
+  bytes INTEGER,
+  fetch_ms DOUBLE PRECISION,             -- 속도 제한 대기/재시도 포함
+  parse_ms DOUBLE PRECISION,             -- 파싱 + 정규화/체크섬
+  write_ms DOUBLE PRECISION,             -- 배치 upsert 시간을 배치 행 수로 나눈 값
+  outcome TEXT NOT NULL,                 -- inserted | updated | unchanged | not_modified | ok | error
+  error TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_crawl_fetch_run ON app.crawl_fetch(run_id);
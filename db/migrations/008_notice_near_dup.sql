@@ -0,0 +1,10 @@
+-- 근사 중복 공지 클러스터(SimHash)
+-- simhash = 제목+본문 64비트 지문(부호 있는 BIGINT로 저장), cluster_id = 클러스터 대표 공지의 url_key
+-- 기존 행은 POST /crawl/dedup/backfill 로 채움
+ALTER TABLE app.notice ADD COLUMN IF NOT EXISTS simhash BIGINT;
+ALTER TABLE app.notice ADD COLUMN IF NOT EXISTS cluster_id TEXT;
+CREATE INDEX IF NOT EXISTS idx_notice_cluster ON app.notice(cluster_id);
+
+-- 읽기 모델에도 projection → 조회 시 cluster_id로 중복을 접음
+ALTER TABLE notices ADD COLUMN IF NOT EXISTS cluster_id VARCHAR(64);
+CREATE INDEX IF NOT EXISTS idx_notices_cluster ON notices(cluster_id);